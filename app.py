@@ -6,8 +6,9 @@ Streamlit 기반의 맞춤형 뉴스 뷰어
 import streamlit as st
 import time
 from datetime import datetime
-from src.fetcher import fetch_news_by_keywords, fetch_news
-from src.summarizer import summarize_articles
+from src.fetcher import fetch_news_by_keywords, fetch_news, RssSnapshot
+from src.search_index import ArticleSearchIndex
+from src.summarizer import is_failed_summary, summarize_articles
 
 # 페이지 설정
 st.set_page_config(
@@ -23,6 +24,8 @@ if 'keywords' not in st.session_state:
     st.session_state.keywords = []
 if 'loading' not in st.session_state:
     st.session_state.loading = False
+if 'search_index' not in st.session_state:
+    st.session_state.search_index = ArticleSearchIndex()
 
 # 커스텀 CSS
 st.markdown("""
@@ -91,10 +94,13 @@ def fetch_and_display_news(keywords, limit):
     status_text = st.empty()
 
     all_articles = []
+    rss_snapshot = RssSnapshot(keywords, target=limit)
+    # 결과 내 검색용 색인 (기사가 도착하는 대로 추가)
+    search_index = ArticleSearchIndex()
 
     for i, keyword in enumerate(keywords):
         status_text.text(f"'{keyword}' 키워드로 뉴스 수집 중...")
-        articles = fetch_news(keyword, limit=limit)
+        articles = fetch_news(keyword, limit=limit, rss_snapshot=rss_snapshot)
 
         # 중복 제거
         seen_links = {a['link'] for a in all_articles}
@@ -102,6 +108,7 @@ def fetch_and_display_news(keywords, limit):
             if article['link'] not in seen_links:
                 all_articles.append(article)
                 seen_links.add(article['link'])
+                search_index.add(article)
 
         progress_bar.progress((i + 1) / (len(keywords) + 1))
 
@@ -109,6 +116,8 @@ def fetch_and_display_news(keywords, limit):
     if all_articles:
         status_text.text("기사 요약 생성 중...")
         all_articles = summarize_articles(all_articles, delay=0.3)
+        # 요약이 채워진 기사로 색인 갱신
+        search_index.add_many(all_articles)
 
     progress_bar.progress(1.0)
     status_text.text("완료!")
@@ -117,6 +126,7 @@ def fetch_and_display_news(keywords, limit):
     status_text.empty()
 
     st.session_state.articles = all_articles
+    st.session_state.search_index = search_index
     st.session_state.loading = False
 
     return all_articles
@@ -183,7 +193,7 @@ elif st.session_state.articles:
         sources = set(a['source'] for a in st.session_state.articles)
         st.metric("📌 언론사 수", len(sources))
     with col3:
-        success_count = sum(1 for a in st.session_state.articles if not a.get('summary', '').startswith('('))
+        success_count = sum(1 for a in st.session_state.articles if not is_failed_summary(a.get('summary', '')))
         st.metric("✅ 요약 성공", f"{success_count}개")
 
     st.divider()
@@ -191,14 +201,14 @@ elif st.session_state.articles:
     # 필터 옵션
     col1, col2 = st.columns([2, 1])
     with col1:
-        search_in_results = st.text_input("🔎 결과 내 검색", placeholder="기사 제목 검색...")
+        search_in_results = st.text_input("🔎 결과 내 검색", placeholder="제목, 요약, 언론사 검색...")
     with col2:
         sort_option = st.selectbox("정렬", ["최신순", "언론사별"])
 
-    # 필터링
+    # 필터링 (검색어가 있으면 관련도 순)
     filtered_articles = st.session_state.articles
     if search_in_results:
-        filtered_articles = [a for a in filtered_articles if search_in_results.lower() in a['title'].lower()]
+        filtered_articles = st.session_state.search_index.search(search_in_results)
 
     # 정렬
     if sort_option == "언론사별":
@@ -0,0 +1,72 @@
+"""
+추출 요약 벤치마크
+기사 수를 늘려 가며 summarize_batch 한 번의 시간을 잽니다.
+
+사용법:
+    # 합성 기사(기사당 25문장)로 측정
+    python benchmarks/bench_extractive.py --articles 100 300 1000
+
+    # 저장해 둔 기사 본문(*.txt, 파일당 기사 하나)으로 측정
+    python benchmarks/bench_extractive.py --texts DIR
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extractive import summarize_batch
+
+
+_TOPICS = ['반도체 수출', '금리 인상', '전기차 배터리', '부동산 대출', '인공지능 규제', '기후 변화', '의료 인력', '청년 고용']
+_PHRASES = [
+    '{topic} 문제를 두고 정부와 업계가 대책을 논의했다.',
+    '전문가들은 {topic} 흐름이 하반기에도 이어질 것으로 내다봤다.',
+    '{topic} 관련 지표는 지난해 같은 기간보다 크게 개선됐다.',
+    '관계자는 {topic}에 대한 시장의 우려가 과도하다고 말했다.',
+    '이번 발표로 {topic} 분야 기업들의 투자 계획에도 변화가 예상된다.',
+    '한편 야당은 {topic} 대책이 현장과 동떨어져 있다고 비판했다.',
+]
+
+
+def synthetic_texts(count: int, sentences: int = 25, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    texts = []
+    for index in range(count):
+        topic = _TOPICS[index % len(_TOPICS)]
+        body = [f'홍길동 기자 = {topic}']
+        body += [rng.choice(_PHRASES).format(topic=topic) for _ in range(sentences - 2)]
+        body.append('무단 전재 및 재배포 금지.')
+        texts.append(' '.join(body))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='추출 요약 벤치마크')
+    parser.add_argument('--articles', type=int, nargs='+', default=[100, 300, 1000], help='합성 기사 수')
+    parser.add_argument('--texts', metavar='DIR', help='저장된 기사 본문 디렉토리 (없으면 합성 기사)')
+    parser.add_argument('-n', '--iterations', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    args = parser.parse_args()
+
+    if args.texts:
+        batches = [[path.read_text(encoding='utf-8') for path in sorted(Path(args.texts).glob('*.txt'))]]
+    else:
+        batches = [synthetic_texts(count) for count in args.articles]
+
+    print(f"{'기사 수':>8} {'글자 수':>12} {'시간':>10}")
+    for texts in batches:
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            summaries = summarize_batch(texts)
+        elapsed = (time.perf_counter() - started) / args.iterations
+        print(f"{len(texts):>8} {sum(map(len, texts)):>12,} {elapsed * 1000:>8.1f}ms")
+
+    print(f"\n예시 요약: {summaries[0]}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+기사 본문 추출 벤치마크
+lxml 본문 추출기(extract_article_body)와 이전 정규식 추출 방식의 시간과 결과 길이를 비교합니다.
+
+사용법:
+    # 합성 페이지(네이버/다음 구조, 크기별)로 비교
+    python benchmarks/bench_extractor.py -n 50
+
+    # 저장해 둔 기사 HTML 파일(*.html)로 비교
+    python benchmarks/bench_extractor.py --pages DIR
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extractor import extract_article_body
+
+
+# 이전 구현 (summarizer.extract_naver_article의 정규식 경로)
+_REGEX_PATTERNS = [
+    r'<article[^>]*id="dic_area"[^>]*>(.*?)</article>',
+    r'<div[^>]*class="[^"]*newsct_article[^"]*"[^>]*>(.*?)</div>',
+    r'<div[^>]*id="_article_body"[^>]*>(.*?)</div>',
+]
+
+
+def regex_body(html: str) -> str:
+    for pattern in _REGEX_PATTERNS:
+        match = re.search(pattern, html, re.DOTALL)
+        if match:
+            text = re.sub(r'<[^>]+>', ' ', match.group(1))
+            text = re.sub(r'\s+', ' ', text).strip()
+            if len(text) > 100:
+                return text
+    return ''
+
+
+def _filler(kilobytes: int) -> str:
+    """페이지 크기를 맞추기 위한 메뉴/스크립트 블록"""
+    block = '<div class="menu"><ul>' + '<li><a href="/x">메뉴 항목</a></li>' * 20 + '</ul></div>'
+    script = '<script>var config = {"a": 1, "b": [1, 2, 3]};</script>'
+    return (block + script) * max(kilobytes * 1024 // (len((block + script).encode()) or 1), 1)
+
+
+def synthetic_pages() -> list[tuple[str, str]]:
+    paragraph = '<p>' + '정부는 반도체 수출이 전년보다 크게 늘었다고 발표했다. ' * 8 + '</p>'
+    photo = '<div class="end_photo_org"><img src="a.jpg"><em class="img_desc">사진 설명</em></div>'
+    pages = []
+    for size in (50, 200, 1000):
+        filler = _filler(size)
+        naver = (
+            f'<html><head><meta charset="utf-8"></head><body>{filler}'
+            f'<div id="newsct_article" class="newsct_article _article_body">'
+            f'<article id="dic_area" class="go_trans _article_content">{photo}{paragraph * 10}'
+            f'<div class="ad">광고</div>{paragraph * 5}</article></div>{filler}</body></html>'
+        )
+        daum = (
+            f'<html><head><meta charset="utf-8"></head><body>{filler}'
+            f'<div class="news_view fs_type1"><div class="article_view" data-translation-body>'
+            f'<section dmcf-ptype="general">{paragraph * 10}<figure><figcaption>캡션</figcaption></figure>'
+            f'{paragraph * 5}</section></div></div>{filler}</body></html>'
+        )
+        # dic_area가 없고 중첩 div가 많은 이전 레이아웃
+        nested = (
+            f'<html><body>{filler}<div class="newsct_article">'
+            f'<div><div>{paragraph * 3}</div></div>{paragraph * 10}</div>{filler}</body></html>'
+        )
+        pages += [(f'naver_{size}k', naver), (f'daum_{size}k', daum), (f'nested_{size}k', nested)]
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 본문 추출 벤치마크')
+    parser.add_argument('--pages', metavar='DIR', help='저장된 기사 HTML 디렉토리 (없으면 합성 페이지)')
+    parser.add_argument('-n', '--iterations', type=int, default=20, help='반복 횟수 (기본값: 20)')
+    args = parser.parse_args()
+
+    if args.pages:
+        pages = [(path.name, path.read_text(encoding='utf-8', errors='replace'))
+                 for path in sorted(Path(args.pages).glob('*.html'))]
+    else:
+        pages = synthetic_pages()
+
+    print(f"{'페이지':<16} {'크기':>9} {'정규식':>10} {'lxml':>10}   추출 길이 (정규식 / lxml)")
+    totals = {'regex': 0.0, 'lxml': 0.0}
+    for name, html in pages:
+        timings = {}
+        for label, extract in (('regex', regex_body), ('lxml', extract_article_body)):
+            started = time.perf_counter()
+            for _ in range(args.iterations):
+                text = extract(html)
+            timings[label] = (time.perf_counter() - started) / args.iterations
+            totals[label] += timings[label]
+            timings[label + '_len'] = len(text)
+
+        print(
+            f"{name:<16} {len(html.encode()) // 1024:>7}KB "
+            f"{timings['regex'] * 1000:>8.2f}ms {timings['lxml'] * 1000:>8.2f}ms"
+            f"   {timings['regex_len']:>6} / {timings['lxml_len']:>6}"
+        )
+
+    print(f"\n합계: 정규식 {totals['regex'] * 1000:.1f}ms, lxml {totals['lxml'] * 1000:.1f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
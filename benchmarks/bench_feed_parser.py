@@ -0,0 +1,102 @@
+"""
+피드 파서 백엔드 벤치마크
+기록해 둔 RSS 피드로 lxml 파서와 feedparser의 파싱 시간과 결과를 비교합니다.
+
+사용법:
+    # 1. RSS_FEEDS의 피드를 로컬에 기록
+    python benchmarks/bench_feed_parser.py --record benchmarks/feeds
+
+    # 2. 기록한 피드로 두 백엔드 비교
+    python benchmarks/bench_feed_parser.py benchmarks/feeds -n 20
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import http_client
+from src.feed_parser import parse_feed_feedparser, parse_feed_lxml
+from src.fetcher import RSS_FEEDS
+
+
+def record(directory: Path) -> None:
+    """RSS_FEEDS의 피드를 directory/<번호>_<언론사>.xml로 저장합니다."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for index, (source_name, rss_url) in enumerate(RSS_FEEDS.items()):
+        filename = f"{index:02d}_{re.sub(r'[^0-9A-Za-z가-힣]+', '_', source_name)}.xml"
+        try:
+            response = http_client.get(rss_url, timeout=10)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"  [경고] {source_name}: {e}")
+            continue
+        (directory / filename).write_bytes(response.content)
+        print(f"  {source_name}: {len(response.content):,} bytes")
+
+
+def bench(directory: Path, iterations: int) -> int:
+    feeds = [(path.name, path.read_bytes()) for path in sorted(directory.glob('*.xml'))]
+    if not feeds:
+        print(f"{directory}에 기록된 피드가 없습니다. --record로 먼저 기록하세요.")
+        return 1
+
+    total_bytes = sum(len(content) for _, content in feeds)
+    print(f"피드 {len(feeds)}개, {total_bytes:,} bytes, {iterations}회 반복\n")
+
+    # 결과 비교 (엔트리 수, 링크, 발행일)
+    mismatches = 0
+    for name, content in feeds:
+        try:
+            fast = parse_feed_lxml(content)
+        except Exception as e:
+            print(f"  [대체] {name}: lxml 실패 ({e.__class__.__name__}), feedparser 사용")
+            continue
+        slow = parse_feed_feedparser(content)
+        if len(fast) != len(slow):
+            print(f"  [차이] {name}: 엔트리 수 {len(fast)} != {len(slow)}")
+            mismatches += 1
+            continue
+        for a, b in zip(fast, slow):
+            if (a['link'], a['published']) != (b['link'], b['published']):
+                print(f"  [차이] {name}: {a['link']} {a['published']!r} != {b['link']} {b['published']!r}")
+                mismatches += 1
+                break
+
+    results = {}
+    for backend, parse in (('feedparser', parse_feed_feedparser), ('lxml', parse_feed_lxml)):
+        started = time.perf_counter()
+        entries = 0
+        for _ in range(iterations):
+            for _, content in feeds:
+                try:
+                    entries += len(parse(content))
+                except Exception:
+                    pass
+        elapsed = time.perf_counter() - started
+        results[backend] = elapsed
+        print(f"  {backend:<10} {elapsed:8.3f}초  (1회 {elapsed / iterations * 1000:7.1f}ms, 엔트리 {entries // iterations}개)")
+
+    print(f"\n  lxml 속도: feedparser 대비 {results['feedparser'] / results['lxml']:.1f}배")
+    print(f"  결과 차이: {mismatches}개 피드")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='피드 파서 백엔드 벤치마크')
+    parser.add_argument('directory', nargs='?', default='benchmarks/feeds', help='기록된 피드 디렉토리')
+    parser.add_argument('--record', metavar='DIR', help='RSS_FEEDS를 DIR에 기록하고 종료')
+    parser.add_argument('-n', '--iterations', type=int, default=10, help='반복 횟수 (기본값: 10)')
+    args = parser.parse_args()
+
+    if args.record:
+        record(Path(args.record))
+        return 0
+    return bench(Path(args.directory), args.iterations)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
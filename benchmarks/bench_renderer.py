@@ -0,0 +1,87 @@
+"""
+다이제스트 렌더링 벤치마크
+기사 수를 늘려 가며 create_html_digest와 이전 방식(루프 안에서 html += ...)의 시간을 비교하고,
+DIGEST_MAX_BYTES에 맞춰 나눈(build_digest_parts) 통 수와 가장 큰 통의 크기를 보여 줍니다.
+
+사용법:
+    python benchmarks/bench_renderer.py --articles 1000 10000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import mailer
+
+
+def legacy_digest(articles: list[dict]) -> str:
+    """이전 구현의 기사 행 루프 (이스케이프 없음, 문자열 누적)"""
+    html = '<table><tbody>'
+    for i, article in enumerate(articles, 1):
+        title = article['title'][:80] + '...' if len(article['title']) > 80 else article['title']
+
+        html += f"""
+                <tr>
+                    <td class="num">{i}</td>
+                    <td><a href="{article['link']}" class="title-link" target="_blank">{title}</a></td>
+                    <td><span class="source">{article['source']}</span></td>
+                    <td class="time">{article['published']}</td>
+                </tr>
+        """
+    return html + '</tbody></table>'
+
+
+def synthetic_articles(count: int) -> list[dict]:
+    return [
+        {
+            'title': f'[단독] 정부, 반도체 수출 지원 대책 발표 "하반기 회복 기대" ({index})',
+            'link': f'https://news.example.com/article/{index}?section=economy&id={index}',
+            'source': ('연합뉴스', '조선일보', 'KBS', '한겨레')[index % 4],
+            'published': '2025-01-20 10:00',
+            'summary': '',
+        }
+        for index in range(count)
+    ]
+
+
+def _measure(render, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description='다이제스트 렌더링 벤치마크')
+    parser.add_argument('--articles', type=int, nargs='+', default=[1000, 10000], help='기사 수')
+    parser.add_argument('-n', '--iterations', type=int, default=5, help='반복 횟수 (기본값: 5)')
+    args = parser.parse_args()
+
+    print(
+        f"{'기사 수':>8} {'이전(+=)':>12} {'템플릿(첫 렌더링)':>18} {'템플릿(조각 캐시)':>18} {'크기':>10}"
+        f" {'나눈 통 수':>10} {'최대 크기':>10}"
+    )
+    for count in args.articles:
+        articles = synthetic_articles(count)
+        legacy = _measure(lambda: legacy_digest(articles), args.iterations)
+
+        mailer._row_cache.clear()
+        started = time.perf_counter()
+        html = mailer.create_html_digest(articles, ['반도체'])
+        cold = time.perf_counter() - started
+        warm = _measure(lambda: mailer.create_html_digest(articles, ['반도체']), args.iterations)
+        parts = mailer.build_digest_parts(articles, ['반도체'], overflow='split')
+        largest = max(len(part['html'].encode()) for part in parts)
+
+        print(
+            f"{count:>8} {legacy * 1000:>10.1f}ms {cold * 1000:>16.1f}ms {warm * 1000:>16.1f}ms "
+            f"{len(html.encode()) // 1024:>8}KB {len(parts):>10} {largest // 1024:>8}KB"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,10 +11,19 @@ from datetime import datetime
 
 from src.config import Config
 from src.fetcher import fetch_news_by_keywords, get_available_sources
-from src.mailer import send_digest
+from src.http_client import print_connection_stats
+from src.mailer import send_digest, send_personalized_digests
+from src.pipeline import run_pipeline
+from src.seen_index import SeenIndex
 
 
-def job(dry_run: bool = False, limit: int = 50, no_summary: bool = True) -> None:
+def job(
+    dry_run: bool = False,
+    limit: int = 50,
+    no_summary: bool = True,
+    include_sent: bool = False,
+    pipeline: bool = False
+) -> None:
     """
     뉴스 수집 -> (요약) -> 이메일 전송 작업을 수행합니다.
 
@@ -22,6 +31,8 @@ def job(dry_run: bool = False, limit: int = 50, no_summary: bool = True) -> None
         dry_run: True면 이메일을 실제로 전송하지 않음
         limit: 키워드당 수집할 기사 수
         no_summary: True면 요약 단계를 건너뜀 (기본값: True)
+        include_sent: True면 이전 실행에서 이미 보낸 기사도 다시 포함
+        pipeline: True면 수집과 요약을 겹쳐 실행 (앞 키워드의 기사를 요약하는 동안 다음 키워드 수집)
     """
     print("\n" + "=" * 60)
     print(f"🚀 뉴스 다이제스트 작업 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -38,43 +49,92 @@ def job(dry_run: bool = False, limit: int = 50, no_summary: bool = True) -> None
 
     Config.print_config()
 
-    keywords = Config.get_keywords()
     recipients = Config.get_recipients()
+    recipient_keywords = Config.get_recipient_keywords()
+    # 수신자별 키워드까지 모두 수집해 하나의 기사 풀로 사용
+    keywords = list(dict.fromkeys(
+        Config.get_keywords() + [kw for kws in recipient_keywords.values() for kw in kws]
+    ))
 
-    # 1. 뉴스 수집
-    print("\n📥 [1단계] 뉴스 수집")
-    print("-" * 40)
-    print(f"    지원 언론사: {len(get_available_sources())}개")
-    articles = fetch_news_by_keywords(keywords, limit_per_keyword=limit)
+    if pipeline:
+        # 1-2. 뉴스 수집과 요약을 크기 제한 큐로 이어 동시에 진행
+        print("\n📥 [1-2단계] 뉴스 수집 및 요약 (파이프라인)")
+        print("-" * 40)
+        print(f"    지원 언론사: {len(get_available_sources())}개")
+        seen_index = None if include_sent else SeenIndex()
+        articles = run_pipeline(keywords, limit_per_keyword=limit, summarize=not no_summary, seen_index=seen_index)
 
-    if not articles:
-        print("[경고] 수집된 기사가 없습니다.")
-        return
+        if not articles:
+            print("[안내] 새로운 기사가 없어 이메일을 보내지 않습니다.")
+            return
+    else:
+        # 1. 뉴스 수집
+        print("\n📥 [1단계] 뉴스 수집")
+        print("-" * 40)
+        print(f"    지원 언론사: {len(get_available_sources())}개")
+        articles = fetch_news_by_keywords(keywords, limit_per_keyword=limit)
 
-    print(f"\n✓ 총 {len(articles)}개 기사 수집 완료")
+        if not articles:
+            print("[경고] 수집된 기사가 없습니다.")
+            return
 
-    # 2. 기사 요약 (선택적)
-    if not no_summary:
-        print("\n📝 [2단계] 기사 요약")
-        print("-" * 40)
-        from src.summarizer import summarize_articles
-        articles = summarize_articles(articles)
-    else:
-        print("\n📝 [2단계] 기사 요약 - 건너뜀 (--no-summary)")
+        print(f"\n✓ 총 {len(articles)}개 기사 수집 완료")
+
+        # 이전에 보낸 기사 제외 (이후 단계는 새 기사만 처리)
+        seen_index = None
+        if not include_sent:
+            seen_index = SeenIndex()
+            new_articles = seen_index.filter_new(articles)
+            print(f"✓ 이미 보낸 기사 {len(articles) - len(new_articles)}개 제외 → 새 기사 {len(new_articles)}개")
+            articles = new_articles
+
+            if not articles:
+                print("[안내] 새로운 기사가 없어 이메일을 보내지 않습니다.")
+                return
+
+        # 2. 기사 요약 (선택적)
+        if not no_summary:
+            print("\n📝 [2단계] 기사 요약")
+            print("-" * 40)
+            from src.summarizer import summarize_articles
+            articles = summarize_articles(articles)
+        else:
+            print("\n📝 [2단계] 기사 요약 - 건너뜀 (--no-summary)")
+
+    print()
+    print_connection_stats()
 
     # 3. 이메일 전송
     print("\n📧 [3단계] 이메일 전송")
     print("-" * 40)
-    success = send_digest(
-        articles=articles,
-        recipients=recipients,
-        keywords=keywords,
-        smtp_server=Config.SMTP_SERVER,
-        smtp_port=Config.SMTP_PORT,
-        sender_email=Config.SENDER_EMAIL,
-        sender_password=Config.SENDER_PASSWORD,
-        dry_run=dry_run
-    )
+    # 발송 이력은 실제로 전송된 메일에 실린 기사만 기록 (발신함이면 전송 완료 시점에)
+    if recipient_keywords:
+        # 수신자별 키워드가 있으면 수신자마다 다른 메일 (지정하지 않은 수신자는 KEYWORDS 전체)
+        keywords_by_recipient = {
+            email: recipient_keywords.get(email, Config.get_keywords()) for email in recipients
+        }
+        success = send_personalized_digests(
+            articles=articles,
+            recipient_keywords=keywords_by_recipient,
+            smtp_server=Config.SMTP_SERVER,
+            smtp_port=Config.SMTP_PORT,
+            sender_email=Config.SENDER_EMAIL,
+            sender_password=Config.SENDER_PASSWORD,
+            dry_run=dry_run,
+            seen_index=seen_index
+        )
+    else:
+        success = send_digest(
+            articles=articles,
+            recipients=recipients,
+            keywords=keywords,
+            smtp_server=Config.SMTP_SERVER,
+            smtp_port=Config.SMTP_PORT,
+            sender_email=Config.SENDER_EMAIL,
+            sender_password=Config.SENDER_PASSWORD,
+            dry_run=dry_run,
+            seen_index=seen_index
+        )
 
     print("\n" + "=" * 60)
     if success:
@@ -97,6 +157,8 @@ def main():
   python main.py                          # 스케줄에 따라 실행
   python main.py --limit 10               # 키워드당 10개 기사만 수집
   python main.py --sources                # 지원 언론사 목록 출력
+  python main.py --now --include-sent     # 이전에 보낸 기사도 다시 포함
+  python main.py --now --with-summary --pipeline  # 수집과 요약을 겹쳐 실행
         """
     )
     parser.add_argument(
@@ -120,6 +182,16 @@ def main():
         action='store_true',
         help='기사 요약 기능 활성화 (기본: 비활성화)'
     )
+    parser.add_argument(
+        '--include-sent',
+        action='store_true',
+        help='이전 실행에서 이미 보낸 기사도 다시 포함'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='수집과 요약을 겹쳐 실행 (다음 키워드를 수집하는 동안 앞 키워드의 기사 요약)'
+    )
     parser.add_argument(
         '--sources',
         action='store_true',
@@ -160,7 +232,13 @@ def main():
     if args.now:
         # 즉시 실행
         print("\n[모드] 즉시 실행")
-        job(dry_run=args.dry_run, limit=args.limit, no_summary=not args.with_summary)
+        job(
+            dry_run=args.dry_run,
+            limit=args.limit,
+            no_summary=not args.with_summary,
+            include_sent=args.include_sent,
+            pipeline=args.pipeline
+        )
     else:
         # 스케줄 모드
         schedule_time = Config.SCHEDULE_TIME
@@ -173,7 +251,9 @@ def main():
             job,
             dry_run=args.dry_run,
             limit=args.limit,
-            no_summary=not args.with_summary
+            no_summary=not args.with_summary,
+            include_sent=args.include_sent,
+            pipeline=args.pipeline
         )
 
         # 스케줄 루프
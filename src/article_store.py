@@ -0,0 +1,132 @@
+"""
+기사 메타데이터 저장소 모듈
+포털 기사 페이지에서 얻은 제목/언론사/설명(/본문)을 링크별로 SQLite에 저장해
+같은 기사를 다시 만났을 때 페이지를 내려받지 않도록 합니다.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import NotRequired, TypedDict
+
+from .config import Config
+from .storage import connect
+
+
+class ArticleMeta(TypedDict):
+    """링크별로 저장되는 기사 메타데이터"""
+    link: str
+    title: str
+    source: str
+    published: str
+    description: str
+    body: NotRequired[str]  # PORTAL_FETCH_BODY가 켜져 있을 때 본문 앞부분
+    fetched_at: float
+
+
+class ArticleStore:
+    """
+    링크 -> 기사 메타데이터 저장소
+
+    Args:
+        path: SQLite 파일 경로 (None이면 캐시 디렉토리의 articles.db)
+        ttl_days: 보관 기간 (일, 지난 항목은 조회되지 않고 정리됨)
+        max_entries: 최대 보관 개수 (넘으면 오래된 항목부터 삭제)
+    """
+
+    def __init__(self, path: Path | None = None, ttl_days: float | None = None, max_entries: int | None = None):
+        self.path = path or Config.get_cache_path('articles.db')
+        self.ttl = (ttl_days if ttl_days is not None else Config.ARTICLE_STORE_TTL_DAYS) * 86400
+        self.max_entries = max_entries or Config.ARTICLE_STORE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS articles ('
+                ' link TEXT PRIMARY KEY, title TEXT, source TEXT, published TEXT,'
+                ' description TEXT, body TEXT, fetched_at REAL)'
+            )
+            # body 열이 없던 이전 버전 저장소 업그레이드
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(articles)')}
+            if 'body' not in columns:
+                self._conn.execute('ALTER TABLE articles ADD COLUMN body TEXT')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_articles_fetched_at ON articles (fetched_at)')
+        self.evict()
+
+    def get_many(self, links: list[str]) -> dict[str, ArticleMeta]:
+        """보관 기간 안에 있는 링크들의 메타데이터를 반환합니다."""
+        if not links:
+            return {}
+
+        found: dict[str, ArticleMeta] = {}
+        min_fetched_at = time.time() - self.ttl
+        with self._lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for i in range(0, len(links), 500):
+                chunk = links[i:i + 500]
+                rows = self._conn.execute(
+                    'SELECT link, title, source, published, description, body, fetched_at FROM articles'
+                    f' WHERE link IN ({",".join("?" * len(chunk))}) AND fetched_at >= ?',
+                    (*chunk, min_fetched_at)
+                ).fetchall()
+                for link, title, source, published, description, body, fetched_at in rows:
+                    found[link] = {
+                        'link': link,
+                        'title': title,
+                        'source': source,
+                        'published': published,
+                        'description': description,
+                        'body': body or '',
+                        'fetched_at': fetched_at,
+                    }
+        return found
+
+    def get(self, link: str) -> ArticleMeta | None:
+        """링크의 메타데이터를 반환합니다. (없거나 만료되면 None)"""
+        return self.get_many([link]).get(link)
+
+    def put_many(self, metas: list[ArticleMeta]) -> None:
+        """메타데이터를 저장하고 크기 제한을 적용합니다."""
+        if not metas:
+            return
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO articles (link, title, source, published, description, body, fetched_at)'
+                ' VALUES (:link, :title, :source, :published, :description, :body, :fetched_at)',
+                [{'body': '', **meta} for meta in metas]
+            )
+        self.evict()
+
+    def evict(self) -> None:
+        """만료된 항목과 최대 개수를 넘는 오래된 항목을 삭제합니다."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM articles WHERE fetched_at < ?', (time.time() - self.ttl,))
+            count = self._conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    'DELETE FROM articles WHERE link IN'
+                    ' (SELECT link FROM articles ORDER BY fetched_at LIMIT ?)',
+                    (count - self.max_entries,)
+                )
+
+
+_store: ArticleStore | None = None
+_store_failed = False
+_store_lock = threading.Lock()
+
+
+def get_article_store() -> ArticleStore | None:
+    """공유 저장소를 반환합니다. (ARTICLE_STORE가 꺼져 있거나 열 수 없으면 None)"""
+    global _store, _store_failed
+    if not Config.ARTICLE_STORE:
+        return None
+
+    with _store_lock:
+        if _store is None and not _store_failed:
+            try:
+                _store = ArticleStore()
+            except Exception as e:
+                print(f"    [경고] 기사 저장소를 열 수 없습니다: {e}")
+                _store_failed = True
+        return _store
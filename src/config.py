@@ -30,6 +30,19 @@ class Config:
             return []
         return [email.strip() for email in recipients_str.split(',') if email.strip()]
 
+    # 수신자별 키워드 ("이메일=키워드,키워드;이메일=키워드", 지정하지 않은 수신자는 KEYWORDS 전체)
+    @staticmethod
+    def get_recipient_keywords() -> dict[str, list[str]]:
+        recipient_keywords: dict[str, list[str]] = {}
+        for entry in os.getenv('RECIPIENT_KEYWORDS', '').split(';'):
+            email, separator, keywords_str = entry.partition('=')
+            if not separator or not email.strip():
+                continue
+            keywords = [kw.strip() for kw in keywords_str.split(',') if kw.strip()]
+            if keywords:
+                recipient_keywords[email.strip()] = keywords
+        return recipient_keywords
+
     # 검색 키워드 (쉼표로 구분된 문자열을 리스트로 변환)
     @staticmethod
     def get_keywords() -> list[str]:
@@ -38,9 +51,118 @@ class Config:
             return []
         return [kw.strip() for kw in keywords_str.split(',') if kw.strip()]
 
+    # 수신자별 다이제스트 전송 시 SMTP 연결 하나로 보낼 최대 메시지 수 (넘으면 다시 연결)
+    SMTP_MAX_MESSAGES_PER_SESSION: int = int(os.getenv('SMTP_MAX_MESSAGES_PER_SESSION', '100'))
+
+    # STARTTLS 사용 여부 (로컬 테스트 서버 등 TLS가 없는 서버에서만 끔)
+    SMTP_STARTTLS: bool = os.getenv('SMTP_STARTTLS', 'true').lower() in ('1', 'true', 'yes')
+
+    # 메일 발신함 (디스크에 먼저 저장 후 발송, 실패 시 재시도)
+    # 사용 여부, 동시 발송 작업자(SMTP 연결) 수, 최대 시도 횟수, 첫 재시도 간격 초(시도마다 2배), 한 번에 보내는 최대 시간 초
+    OUTBOX: bool = os.getenv('OUTBOX', 'true').lower() in ('1', 'true', 'yes')
+    OUTBOX_WORKERS: int = int(os.getenv('OUTBOX_WORKERS', '4'))
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv('OUTBOX_MAX_ATTEMPTS', '5'))
+    OUTBOX_RETRY_DELAY: float = float(os.getenv('OUTBOX_RETRY_DELAY', '5'))
+    OUTBOX_DRAIN_TIMEOUT: float = float(os.getenv('OUTBOX_DRAIN_TIMEOUT', '120'))
+    # 서버에 연결하지 못한 시도는 횟수에 세지 않고, 이 시간(시간)이 지나도록 못 보낸 메일만 실패 처리
+    OUTBOX_MAX_AGE_HOURS: float = float(os.getenv('OUTBOX_MAX_AGE_HOURS', '24'))
+
     # 스케줄 시간
     SCHEDULE_TIME: str = os.getenv('SCHEDULE_TIME', '08:00')
 
+    # RSS 수집 설정 (동시 수집 피드 수, 피드당 타임아웃 초)
+    RSS_MAX_WORKERS: int = int(os.getenv('RSS_MAX_WORKERS', '12'))
+    RSS_TIMEOUT: float = float(os.getenv('RSS_TIMEOUT', '10'))
+    # 피드 파서 백엔드 ('lxml': 빠른 스트리밍 파서, 'feedparser': 호환성 우선)
+    FEED_PARSER: str = os.getenv('FEED_PARSER', 'lxml')
+    # ETag/Last-Modified 조건부 요청 캐시 사용 여부
+    RSS_CACHE: bool = os.getenv('RSS_CACHE', 'true').lower() in ('1', 'true', 'yes')
+    # 키워드별 피드 적중률 기록 사용 여부 (적중률 높은 피드 우선, 매칭 없는 피드 건너뜀)
+    FEED_YIELD: bool = os.getenv('FEED_YIELD', 'true').lower() in ('1', 'true', 'yes')
+    # 건너뛰기 전 최소 기록 횟수 / 건너뛸 피드를 그래도 받아볼 확률
+    FEED_YIELD_MIN_RUNS: int = int(os.getenv('FEED_YIELD_MIN_RUNS', '5'))
+    FEED_YIELD_EXPLORE: float = float(os.getenv('FEED_YIELD_EXPLORE', '0.1'))
+
+    # 유사 기사 판정 임계값 (제목/설명 n-gram 유사도 0~1, 1이면 같은 제목만 중복 처리)
+    DEDUP_THRESHOLD: float = float(os.getenv('DEDUP_THRESHOLD', '0.8'))
+
+    # 발송 이력 보관 기간 (일) / 블룸 필터 초기 용량
+    SEEN_RETENTION_DAYS: float = float(os.getenv('SEEN_RETENTION_DAYS', '7'))
+    SEEN_BLOOM_CAPACITY: int = int(os.getenv('SEEN_BLOOM_CAPACITY', '100000'))
+
+    # 포털(네이버/다음) 기사 페이지 수집 설정 (동시 요청 수, 호스트당 초당 요청 수, 버스트)
+    PORTAL_MAX_WORKERS: int = int(os.getenv('PORTAL_MAX_WORKERS', '8'))
+    PORTAL_RATE: float = float(os.getenv('PORTAL_RATE', '5'))
+    PORTAL_BURST: float = float(os.getenv('PORTAL_BURST', '5'))
+
+    # 네이버/다음 기사 페이지를 본문까지 읽어 기사에 담을지 여부 (요약 시 다시 받지 않음)
+    PORTAL_FETCH_BODY: bool = os.getenv('PORTAL_FETCH_BODY', 'false').lower() in ('1', 'true', 'yes')
+
+    # 포털 기사 메타데이터 저장소 (사용 여부, 보관 기간 일, 최대 보관 개수)
+    ARTICLE_STORE: bool = os.getenv('ARTICLE_STORE', 'true').lower() in ('1', 'true', 'yes')
+    ARTICLE_STORE_TTL_DAYS: float = float(os.getenv('ARTICLE_STORE_TTL_DAYS', '7'))
+    ARTICLE_STORE_MAX_ENTRIES: int = int(os.getenv('ARTICLE_STORE_MAX_ENTRIES', '50000'))
+
+    # 소스 상태 관리 (재시도 횟수, 백오프 기본 초, 재시도 대기 상한 초)
+    HEALTH_RETRIES: int = int(os.getenv('HEALTH_RETRIES', '2'))
+    HEALTH_BACKOFF_BASE: float = float(os.getenv('HEALTH_BACKOFF_BASE', '0.5'))
+    HEALTH_MAX_RETRY_DELAY: float = float(os.getenv('HEALTH_MAX_RETRY_DELAY', '30'))
+    # 연속 실패 몇 번에 차단할지, 차단 유지 시간 초
+    HEALTH_FAILURE_THRESHOLD: int = int(os.getenv('HEALTH_FAILURE_THRESHOLD', '3'))
+    HEALTH_COOLDOWN: float = float(os.getenv('HEALTH_COOLDOWN', '1800'))
+    # 적응형 타임아웃 = 응답 시간 p95 x 배수 (최소값 초)
+    HEALTH_TIMEOUT_FACTOR: float = float(os.getenv('HEALTH_TIMEOUT_FACTOR', '3'))
+    HEALTH_MIN_TIMEOUT: float = float(os.getenv('HEALTH_MIN_TIMEOUT', '2'))
+
+    # 기사 요약 (동시 요약 기사 수, 같은 호스트 요청 간격 초, 전체 제한 시간 초 - 0이면 제한 없음)
+    SUMMARY_MAX_WORKERS: int = int(os.getenv('SUMMARY_MAX_WORKERS', '8'))
+    SUMMARY_HOST_DELAY: float = float(os.getenv('SUMMARY_HOST_DELAY', '0.5'))
+    SUMMARY_DEADLINE: float = float(os.getenv('SUMMARY_DEADLINE', '180'))
+    # 요약 방식 (lead: 본문 앞부분, extractive: 배치 TF-IDF 추출 요약), 추출 요약 문장 수
+    SUMMARY_STRATEGY: str = os.getenv('SUMMARY_STRATEGY', 'lead')
+    SUMMARY_SENTENCES: int = int(os.getenv('SUMMARY_SENTENCES', '3'))
+    # 일반 언론사 기사 파싱 (newspaper3k, 프로세스 풀 사용 여부, 프로세스 수 - 0이면 CPU 코어 수)
+    SUMMARY_PARSE_PROCESSES: bool = os.getenv('SUMMARY_PARSE_PROCESSES', 'true').lower() in ('1', 'true', 'yes')
+    SUMMARY_PARSE_WORKERS: int = int(os.getenv('SUMMARY_PARSE_WORKERS', '0'))
+
+    # 파이프라인 실행 (--pipeline): 수집과 요약 사이 대기 기사 최대 수, 수집+요약 전체 제한 시간 초 (0이면 제한 없음)
+    PIPELINE_QUEUE_SIZE: int = int(os.getenv('PIPELINE_QUEUE_SIZE', '100'))
+    PIPELINE_DEADLINE: float = float(os.getenv('PIPELINE_DEADLINE', '300'))
+
+    # 요약 캐시 (사용 여부, 보관 기간 일, 최대 보관 개수 - 넘으면 오래 조회되지 않은 것부터 삭제)
+    SUMMARY_CACHE: bool = os.getenv('SUMMARY_CACHE', 'true').lower() in ('1', 'true', 'yes')
+    SUMMARY_CACHE_TTL_DAYS: float = float(os.getenv('SUMMARY_CACHE_TTL_DAYS', '7'))
+    SUMMARY_CACHE_MAX_ENTRIES: int = int(os.getenv('SUMMARY_CACHE_MAX_ENTRIES', '20000'))
+
+    # HTTP 커넥션 풀 설정 (호스트 풀 수, 호스트당 최대 연결 수, 기본 타임아웃 초)
+    HTTP_POOL_CONNECTIONS: int = int(os.getenv('HTTP_POOL_CONNECTIONS', '64'))
+    HTTP_POOL_MAXSIZE: int = int(os.getenv('HTTP_POOL_MAXSIZE', '16'))
+    HTTP_TIMEOUT: float = float(os.getenv('HTTP_TIMEOUT', '10'))
+    # 메타 태그만 읽을 때 <head>를 찾기 위해 내려받을 최대 바이트 수
+    HTTP_HEAD_MAX_BYTES: int = int(os.getenv('HTTP_HEAD_MAX_BYTES', '131072'))
+    # <head>를 읽은 뒤 남은 응답이 이 바이트 수 이하면 끝까지 받아 연결을 재사용 (넘으면 연결을 닫음)
+    HTTP_HEAD_DRAIN_BYTES: int = int(os.getenv('HTTP_HEAD_DRAIN_BYTES', '65536'))
+    # 기사 본문 추출 시 본문 컨테이너부터 파싱할 최대 바이트 수
+    EXTRACT_MAX_BYTES: int = int(os.getenv('EXTRACT_MAX_BYTES', '262144'))
+
+    # 다이제스트 렌더링 시 기사별 HTML 조각 캐시 최대 개수 (한 실행 안에서 재사용)
+    RENDER_CACHE_MAX_ENTRIES: int = int(os.getenv('RENDER_CACHE_MAX_ENTRIES', '50000'))
+    # 다이제스트 한 통의 최대 본문 크기 (HTML + 텍스트 바이트, Gmail은 약 102KB부터 본문을 자름, 0이면 제한 없음)
+    DIGEST_MAX_BYTES: int = int(os.getenv('DIGEST_MAX_BYTES', '100000'))
+    # 크기를 넘을 때 처리 방식 (split: 여러 통으로 나눔, collapse: 하위 기사를 제목 목록으로 줄임)
+    DIGEST_OVERFLOW: str = os.getenv('DIGEST_OVERFLOW', 'split').strip().lower()
+    # 텍스트 본문(text/plain)에 제목과 링크를 싣는 최대 기사 수 (한 통 기준, 나머지는 "외 N개")
+    DIGEST_TEXT_MAX_ARTICLES: int = int(os.getenv('DIGEST_TEXT_MAX_ARTICLES', '20'))
+
+    # 로컬 캐시 디렉토리 (피드 캐시 등)
+    CACHE_DIR: Path = Path(os.getenv('CACHE_DIR', str(Path(__file__).parent.parent / '.cache')))
+
+    @classmethod
+    def get_cache_path(cls, filename: str) -> Path:
+        """캐시 디렉토리 아래 파일 경로를 반환합니다. (디렉토리가 없으면 생성)"""
+        cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        return cls.CACHE_DIR / filename
+
     @classmethod
     def validate(cls) -> tuple[bool, list[str]]:
         """설정값 유효성 검증"""
@@ -54,6 +176,11 @@ class Config:
             errors.append("RECIPIENT_EMAILS가 설정되지 않았습니다.")
         if not cls.get_keywords():
             errors.append("KEYWORDS가 설정되지 않았습니다.")
+        for email in cls.get_recipient_keywords():
+            if email not in cls.get_recipients():
+                errors.append(f"RECIPIENT_KEYWORDS의 {email}이(가) RECIPIENT_EMAILS에 없습니다.")
+        if cls.DIGEST_OVERFLOW not in ('split', 'collapse'):
+            errors.append(f"DIGEST_OVERFLOW는 split 또는 collapse여야 합니다. (현재: {cls.DIGEST_OVERFLOW})")
 
         return len(errors) == 0, errors
 
@@ -68,5 +195,9 @@ class Config:
         print(f"발신자 비밀번호: {'*' * 8 if hide_password else cls.SENDER_PASSWORD}")
         print(f"수신자 목록: {cls.get_recipients()}")
         print(f"검색 키워드: {cls.get_keywords()}")
+        for email, keywords in cls.get_recipient_keywords().items():
+            print(f"  {email}: {keywords}")
         print(f"스케줄 시간: {cls.SCHEDULE_TIME}")
+        print(f"RSS 동시 수집: {cls.RSS_MAX_WORKERS}개 (타임아웃 {cls.RSS_TIMEOUT}초)")
+        print(f"RSS 캐시: {'사용' if cls.RSS_CACHE else '사용 안함'} ({cls.CACHE_DIR})")
         print("=" * 50)
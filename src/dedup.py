@@ -0,0 +1,224 @@
+"""
+유사 기사 중복 제거 모듈
+제목/설명의 문자 n-gram MinHash 서명을 LSH 인덱스에 넣어
+제목이 조금씩 다른 같은 기사(통신사 재전송 등)를 골라냅니다.
+"""
+
+import random
+import re
+import unicodedata
+import zlib
+from typing import TYPE_CHECKING
+
+from .config import Config
+
+if TYPE_CHECKING:
+    from .fetcher import NewsArticle
+
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+# [속보], (종합), 【단독】 같은 말머리
+_BRACKET_TAG = re.compile(r'\[[^\]]*\]|\([^)]*\)|【[^】]*】')
+_NON_WORD = re.compile(r'[\W_]+')
+_NUMBER = re.compile(r'\d+')
+# 나머지가 같아도 뜻이 반대인 기사를 가르는 말 (상승/하락 등)
+_CONTRAST_WORDS = (
+    '상승', '하락', '증가', '감소', '인상', '인하', '급등', '급락', '확대', '축소',
+    '흑자', '적자', '호조', '부진', '찬성', '반대', '승인', '거부', '합격', '불합격',
+)
+
+
+def normalize_text(text: str) -> str:
+    """
+    비교용으로 텍스트를 정규화합니다.
+
+    HTML 태그와 말머리를 지우고, 유니코드 정규화(NFKC)와 casefold 후
+    공백/문장부호를 모두 제거합니다.
+    """
+    text = _HTML_TAG.sub(' ', text)
+    text = unicodedata.normalize('NFKC', text).casefold()
+    text = _BRACKET_TAG.sub(' ', text)
+    return _NON_WORD.sub('', text)
+
+
+def char_ngrams(text: str, n: int = 3) -> set[str]:
+    """정규화된 텍스트의 문자 n-gram 집합을 반환합니다. (한국어는 띄어쓰기와 무관하게 비교 가능)"""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def title_markers(title: str) -> frozenset[str]:
+    """
+    제목의 숫자와 상승/하락 같은 대조어 집합을 반환합니다.
+
+    제목 n-gram이 거의 같아도 이 집합이 다르면("3분기"/"2분기", "상승"/"하락")
+    다른 기사일 수 있으므로, 설명까지 비슷할 때만 중복으로 봅니다.
+    """
+    text = normalize_text(title)
+    return frozenset(_NUMBER.findall(text)) | frozenset(word for word in _CONTRAST_WORDS if word in text)
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    """두 집합의 자카드 유사도 (둘 다 비어 있으면 0)"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _choose_bands(num_perm: int, threshold: float) -> tuple[int, int]:
+    """
+    LSH 밴드 수와 밴드당 행 수를 고릅니다.
+
+    후보가 될 확률이 1/2인 유사도 (1/b)^(1/r)가 임계값 이하이면서 가장 가까운
+    조합을 선택합니다. 후보는 서명 전체로 다시 검증하므로 조금 낮게 잡아도 됩니다.
+    """
+    best = (num_perm, 1)
+    best_point = 0.0
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        point = (1 / bands) ** (1 / rows)
+        if best_point < point <= threshold:
+            best, best_point = (bands, rows), point
+    return best
+
+
+class _MinHashLSH:
+    """MinHash 서명 + 밴드 LSH 인덱스"""
+
+    def __init__(self, threshold: float, num_perm: int, ngram: int, min_ngrams: int):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.ngram = ngram
+        self.min_ngrams = min_ngrams
+
+        # 해시 함수 대신 32비트 무작위 마스크와의 XOR을 순열로 사용 (고정 시드)
+        rng = random.Random(1)
+        self._masks = [rng.getrandbits(32) for _ in range(num_perm)]
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+        self._buckets: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(self.bands)]
+        self._signatures: dict[int, tuple[int, ...]] = {}
+
+    def signature(self, text: str) -> tuple[int, ...] | None:
+        """MinHash 서명을 계산합니다. (n-gram이 너무 적으면 None)"""
+        grams = char_ngrams(text, self.ngram)
+        if len(grams) < self.min_ngrams:
+            return None
+
+        hashes = [zlib.crc32(gram.encode('utf-8')) for gram in grams]
+        return tuple(min([h ^ mask for h in hashes]) for mask in self._masks)
+
+    def _band_keys(self, signature: tuple[int, ...]):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start:start + self.rows]
+
+    def matches(self, signature: tuple[int, ...]) -> set[int]:
+        """임계값 이상으로 비슷한 서명의 문서 번호를 반환합니다."""
+        found: set[int] = set()
+        checked: set[int] = set()
+        for band, key in self._band_keys(signature):
+            for doc_id in self._buckets[band].get(key, ()):
+                if doc_id in checked:
+                    continue
+                checked.add(doc_id)
+
+                other = self._signatures[doc_id]
+                same = sum(1 for x, y in zip(signature, other) if x == y)
+                if same / self.num_perm >= self.threshold:
+                    found.add(doc_id)
+        return found
+
+    def insert(self, doc_id: int, signature: tuple[int, ...]) -> None:
+        self._signatures[doc_id] = signature
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, []).append(doc_id)
+
+
+class NearDuplicateIndex:
+    """
+    유사 기사 인덱스
+
+    제목이 같은 기사는 중복으로 판단합니다. 그 밖에는 제목의 n-gram 유사도(추정 자카드)가
+    임계값 이상인 기사가 있을 때, 두 제목의 숫자와 대조어(title_markers)가 같으면 중복으로 보고,
+    다르면 설명까지 비슷해야 중복으로 봅니다. ("3분기"/"2분기", "상승"/"하락" 기사를 지키기 위해)
+    설명만 비슷한 기사는 제목도 title_floor 이상 겹치고 숫자/대조어가 같을 때만 중복으로 봅니다.
+    (매체가 여러 기사에 같은 요약문을 붙이는 경우가 있어 설명만으로는 판단하지 않음)
+    밴드 LSH로 후보만 비교하므로 기사 수가 수만 개로 늘어도 조회 비용이 거의 일정합니다.
+
+    Args:
+        threshold: 유사도 임계값 (0~1, None이면 Config.DEDUP_THRESHOLD, 1 이상이면 정확히 같은 제목만 제거)
+        num_perm: MinHash 해시 함수 수
+        ngram: 문자 n-gram 길이
+        min_ngrams: 유사도 비교에 필요한 최소 n-gram 수 (짧은 제목은 정확히 같을 때만 중복)
+        min_description_ngrams: 설명을 비교할 최소 n-gram 수 (짧은 설명은 비교하지 않음)
+        title_floor: 설명만 비슷한 기사를 중복으로 볼 최소 제목 자카드 유사도
+    """
+
+    def __init__(
+        self,
+        threshold: float | None = None,
+        num_perm: int = 64,
+        ngram: int = 3,
+        min_ngrams: int = 8,
+        min_description_ngrams: int = 30,
+        title_floor: float = 0.5
+    ):
+        self.threshold = threshold if threshold is not None else Config.DEDUP_THRESHOLD
+        self._exact_titles: set[str] = set()
+        # 문서 번호별 제목 숫자/대조어
+        self._markers: list[frozenset[str]] = []
+        # 문서 번호별 제목 n-gram (설명만 비슷한 후보의 제목 유사도 확인용)
+        self._title_grams: list[set[str]] = []
+        self.ngram = ngram
+        self.title_floor = title_floor
+        self._near = self.threshold < 1
+        if self._near:
+            self._titles = _MinHashLSH(self.threshold, num_perm, ngram, min_ngrams)
+            self._descriptions = _MinHashLSH(self.threshold, num_perm, ngram, min_description_ngrams)
+
+    def add(self, title: str, description: str = '') -> bool:
+        """
+        기사를 인덱스에 추가합니다.
+
+        Returns:
+            새 기사면 True, 이미 있는 기사와 중복이면 False (중복이면 추가하지 않음)
+        """
+        title_key = title.lower().strip()
+        if title_key in self._exact_titles:
+            return False
+
+        title_signature = description_signature = None
+        markers = title_markers(title)
+        title_grams = char_ngrams(normalize_text(title), self.ngram)
+        if self._near:
+            title_signature = self._titles.signature(normalize_text(title))
+            similar_titles = self._titles.matches(title_signature) if title_signature else set()
+            similar_descriptions: set[int] = set()
+            if description:
+                # 설명은 앞부분만 비교 (매체마다 뒤에 붙는 문구가 다름)
+                description_signature = self._descriptions.signature(normalize_text(description)[:200])
+                if description_signature:
+                    similar_descriptions = self._descriptions.matches(description_signature)
+
+            for doc_id in similar_titles:
+                # 숫자나 대조어가 다르면 제목과 설명이 모두 비슷해야 같은 기사
+                if self._markers[doc_id] == markers or doc_id in similar_descriptions:
+                    return False
+            for doc_id in similar_descriptions - similar_titles:
+                if self._markers[doc_id] == markers and jaccard(title_grams, self._title_grams[doc_id]) >= self.title_floor:
+                    return False
+
+        doc_id = len(self._markers)
+        self._markers.append(markers)
+        self._title_grams.append(title_grams)
+        self._exact_titles.add(title_key)
+        if title_signature:
+            self._titles.insert(doc_id, title_signature)
+        if description_signature:
+            self._descriptions.insert(doc_id, description_signature)
+        return True
+
+    def add_article(self, article: 'NewsArticle') -> bool:
+        """NewsArticle을 제목과 설명으로 인덱스에 추가합니다. (add 참고)"""
+        return self.add(article['title'], article.get('description', ''))
@@ -0,0 +1,123 @@
+"""
+추출 요약 모듈
+한 번에 요약할 모든 기사의 문장으로 TF-IDF 행렬 하나를 만들고,
+기사마다 중심(centroid)과 가장 비슷한 문장 몇 개를 골라 요약으로 씁니다.
+"""
+
+import re
+from collections import Counter
+
+import numpy as np
+
+from .query import normalize_for_match
+
+
+_SENTENCE_END = re.compile(r'(?<=[.!?。])\s+|\n+')
+# 이보다 짧은 문장(바이라인, 사진 설명 등)은 다른 문장이 없을 때만 고름
+MIN_SENTENCE_CHARS = 20
+
+
+def split_sentences(text: str) -> list[str]:
+    """텍스트를 문장 단위로 나눕니다. (빈 문장 제외)"""
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+
+def _tokens(sentence: str) -> list[str]:
+    """문장의 색인 토큰 (단어별 문자 바이그램, 조사가 붙어도 같은 토큰이 나오도록)"""
+    tokens = []
+    for word in normalize_for_match(sentence).split():
+        if len(word) < 2:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def summarize_batch(texts: list[str], sentences: int = 3, max_chars: int = 400) -> list[str]:
+    """
+    여러 기사 본문을 한 번에 추출 요약합니다.
+
+    모든 기사의 문장을 행으로 하는 희소 TF-IDF 행렬 하나를 만들고(IDF도 전체
+    배치 기준이라 "무단 전재 및 재배포 금지"처럼 모든 기사에 나오는 문구는 점수가
+    낮아짐), 각 문장과 그 기사 문장들의 중심 벡터 사이 코사인 유사도를 NumPy로
+    한 번에 계산합니다. 기사마다 점수가 높은 문장을 max_chars 안에서 최대
+    sentences개 골라 본문 순서대로 잇습니다.
+
+    Args:
+        texts: 기사 본문 리스트
+        sentences: 기사당 최대 문장 수
+        max_chars: 요약 최대 길이 (첫 문장은 길이와 관계없이 포함)
+
+    Returns:
+        texts와 같은 순서의 요약 리스트 (본문이 비어 있으면 빈 문자열)
+    """
+    sentence_lists = [split_sentences(text) for text in texts]
+
+    # 희소 행렬을 (문장 번호, 토큰 번호, 빈도) 좌표 형식으로 만듦
+    vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    counts: list[int] = []
+    article_of_sentence: list[int] = []
+    for article_id, sentence_list in enumerate(sentence_lists):
+        for sentence in sentence_list:
+            row = len(article_of_sentence)
+            article_of_sentence.append(article_id)
+            for token, count in Counter(_tokens(sentence)).items():
+                rows.append(row)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+                counts.append(count)
+
+    if not rows:
+        return [''] * len(texts)
+
+    row_index = np.array(rows, dtype=np.int64)
+    col_index = np.array(cols, dtype=np.int64)
+    sentence_articles = np.array(article_of_sentence, dtype=np.int64)
+    sentence_count, token_count = len(article_of_sentence), len(vocabulary)
+
+    # TF-IDF (로그 빈도 x 평활 IDF) 후 문장 벡터를 단위 길이로
+    document_frequency = np.bincount(col_index, minlength=token_count)
+    idf = np.log((1 + sentence_count) / (1 + document_frequency)) + 1
+    weights = (1 + np.log(np.array(counts, dtype=np.float64))) * idf[col_index]
+    norms = np.sqrt(np.bincount(row_index, weights=weights * weights, minlength=sentence_count))
+    weights /= norms[row_index]
+
+    # 기사별 중심 벡터: (기사, 토큰) 쌍마다 문장 가중치를 합산
+    pair_keys = sentence_articles[row_index] * token_count + col_index
+    pairs, pair_of_entry = np.unique(pair_keys, return_inverse=True)
+    centroid = np.bincount(pair_of_entry, weights=weights)
+    centroid_norms = np.sqrt(np.bincount(pairs // token_count, weights=centroid * centroid, minlength=len(texts)))
+
+    # 문장 벡터와 자기 기사 중심 벡터의 코사인 유사도
+    scores = np.bincount(row_index, weights=weights * centroid[pair_of_entry], minlength=sentence_count)
+    scores /= np.maximum(centroid_norms[sentence_articles], 1e-12)
+
+    summaries = []
+    offset = 0
+    for sentence_list in sentence_lists:
+        article_scores = scores[offset:offset + len(sentence_list)]
+        offset += len(sentence_list)
+        if not sentence_list:
+            summaries.append('')
+            continue
+
+        short = np.array([len(sentence) < MIN_SENTENCE_CHARS for sentence in sentence_list])
+        # 짧은 문장은 뒤로, 같은 조건이면 점수 높은 순 (동점이면 앞 문장)
+        ranked = np.lexsort((np.arange(len(sentence_list)), -article_scores, short))
+        chosen: list[int] = []
+        length = 0
+        for position in ranked:
+            if len(chosen) == sentences:
+                break
+            sentence = sentence_list[position]
+            if chosen and (short[position] or length + len(sentence) > max_chars):
+                continue
+            # 본문에 되풀이된 문장(사진 설명, 반복 인용 등)은 한 번만
+            if any(sentence_list[other] == sentence for other in chosen):
+                continue
+            chosen.append(int(position))
+            length += len(sentence) + 1
+        summaries.append(' '.join(sentence_list[position] for position in sorted(chosen)))
+
+    return summaries
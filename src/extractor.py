@@ -0,0 +1,167 @@
+"""
+HTML 추출 모듈
+기사 페이지에서 메타 태그와 본문 등 필요한 정보를 추출합니다.
+"""
+
+import html as html_lib
+import re
+
+from lxml import etree
+
+from .config import Config
+
+
+_META_TAG = re.compile(r'<meta\b([^>]*)>', re.IGNORECASE)
+_ATTRIBUTE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+_TITLE_TAG = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+
+_META_PREFIXES = ('og:', 'article:')
+
+# 기사 본문 컨테이너 (우선순위 순): (속성, 값)
+_BODY_SELECTORS = [
+    # 네이버 뉴스
+    ('id', 'dic_area'),
+    ('id', 'newsct_article'),
+    ('class', 'newsct_article'),
+    ('id', '_article_body'),
+    ('id', 'articleBodyContents'),
+    # 다음 뉴스
+    ('class', 'article_view'),
+    ('id', 'harmonyContainer'),
+]
+# 값 앞에 와야 하는 속성 부분 (여는 태그의 '<'부터 값 직전까지)
+_ATTRIBUTE_PREFIX = {
+    'id': re.compile(r'\sid\s*=\s*["\']$'),
+    'class': re.compile(r'\sclass\s*=\s*["\'](?:[^"\'<>]*\s)?$'),
+}
+# 본문 텍스트에서 뺄 요소 (스크립트, 사진 설명 등)
+_SKIP_TAGS = ('script', 'style', 'noscript', 'figcaption', 'button')
+_WHITESPACE = re.compile(r'\s+')
+# 본문 컨테이너를 파서에 나눠 넣는 단위 (컨테이너가 닫히면 나머지는 읽지 않음)
+_FEED_CHUNK = 16384
+
+
+def extract_meta_tags(html: str) -> dict[str, str]:
+    """
+    og:/article: 메타 태그를 한 번의 순회로 모두 추출합니다.
+
+    Args:
+        html: HTML 문자열 (보통 <head> 부분만)
+
+    Returns:
+        {속성 이름: 내용} 딕셔너리 (같은 이름은 처음 나온 값, HTML 엔티티 디코딩됨)
+    """
+    metas: dict[str, str] = {}
+
+    for tag in _META_TAG.finditer(html):
+        attributes = {}
+        for name, double_quoted, single_quoted, bare in _ATTRIBUTE.findall(tag.group(1)):
+            attributes[name.lower()] = double_quoted or single_quoted or bare
+
+        key = attributes.get('property') or attributes.get('name')
+        if not key or 'content' not in attributes:
+            continue
+
+        key = key.lower()
+        if key.startswith(_META_PREFIXES) and key not in metas:
+            metas[key] = html_lib.unescape(attributes['content'])
+
+    return metas
+
+
+def extract_title_tag(html: str) -> str:
+    """<title> 태그 내용을 반환합니다. (없으면 빈 문자열)"""
+    match = _TITLE_TAG.search(html)
+    return html_lib.unescape(match.group(1)).strip() if match else ''
+
+
+def _iter_body_starts(html: str):
+    """
+    본문 컨테이너 후보의 여는 태그 위치를 선택자 우선순위 순으로 하나씩 돌려줍니다.
+
+    값 문자열을 str.find로 찾고(C 구현), 그 위치가 실제로 여는 태그의
+    id/class 속성 값인지 태그 앞부분만 확인합니다. 앞 순위 선택자에서 본문을
+    찾으면 뒤 선택자는 찾지 않습니다.
+    """
+    for kind, value in _BODY_SELECTORS:
+        prefix = _ATTRIBUTE_PREFIX[kind]
+        position = html.find(value)
+        while position >= 0:
+            end = position + len(value)
+            tag_start = html.rfind('<', 0, position)
+            if (
+                tag_start >= 0
+                and end < len(html)
+                and (html[end] in '"\'' or kind == 'class' and html[end].isspace())
+                and prefix.search(html, tag_start, position)
+            ):
+                yield tag_start
+                break
+            position = html.find(value, end)
+
+
+def _parse_container(html: str, start: int, limit: int):
+    """
+    start의 여는 태그부터 조금씩 파싱해 그 요소가 닫히는 즉시 반환합니다.
+
+    중첩된 태그는 파서가 짝을 맞추므로 안쪽 </div>에서 끊기지 않고,
+    컨테이너 뒤의 나머지 페이지는 파싱하지 않습니다. (최대 limit 바이트)
+    """
+    parser = etree.HTMLPullParser(events=('start', 'end'), encoding='utf-8', remove_comments=True)
+    container = None
+    fed = 0
+    for offset in range(start, len(html), _FEED_CHUNK):
+        if fed >= limit:
+            break
+        chunk = html[offset:offset + _FEED_CHUNK].encode('utf-8')
+        if fed + len(chunk) > limit:
+            # 상한에서 멀티바이트 문자가 반쯤 잘리지 않도록 문자 단위로 자름
+            chunk = chunk[:limit - fed].decode('utf-8', 'ignore').encode('utf-8')
+        fed += len(chunk)
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if container is None and event == 'start' and element.tag not in ('html', 'body'):
+                container = element
+            elif event == 'end' and element is container:
+                return container
+    # 상한에 걸려 닫히지 않은 채로 끝나면 지금까지 읽은 내용을 사용
+    parser.close()
+    return container
+
+
+def _element_text(element) -> str:
+    """요소의 텍스트를 태그 없이 모읍니다. (스크립트, 사진 설명 등 제외)"""
+    etree.strip_elements(element, *_SKIP_TAGS, with_tail=False)
+    return _WHITESPACE.sub(' ', ' '.join(element.itertext())).strip()
+
+
+def extract_article_body(html: str, max_bytes: int | None = None) -> str:
+    """
+    네이버/다음 뉴스 기사 페이지에서 본문 텍스트를 추출합니다.
+
+    본문 컨테이너(id/class)의 여는 태그를 우선순위 순으로 찾고,
+    그 태그부터 최대 max_bytes만 lxml로 파싱합니다. 컨테이너가 닫히면
+    파싱을 멈추므로 페이지 크기와 관계없이 본문 크기만큼만 파싱하고,
+    중첩된 </div>나 깨진 HTML에서도 본문이 잘리지 않습니다.
+
+    Args:
+        html: 기사 페이지 HTML
+        max_bytes: 컨테이너부터 파싱할 최대 바이트 수 (None이면 Config.EXTRACT_MAX_BYTES)
+
+    Returns:
+        태그를 지우고 공백을 정리한 본문 (100자 이하로 짧거나 없으면 빈 문자열)
+    """
+    limit = max_bytes or Config.EXTRACT_MAX_BYTES
+
+    for start in _iter_body_starts(html):
+        try:
+            container = _parse_container(html, start, limit)
+        except (etree.ParserError, etree.XMLSyntaxError, ValueError):
+            continue
+        if container is None:
+            continue
+
+        text = _element_text(container)
+        if len(text) > 100:
+            return text
+    return ''
@@ -0,0 +1,90 @@
+"""
+RSS 피드 캐시 모듈
+피드별 ETag/Last-Modified와 파싱된 엔트리를 디스크에 저장해
+조건부 요청(304 Not Modified) 시 다운로드와 재파싱을 생략합니다.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+from .config import Config
+
+if TYPE_CHECKING:
+    from .feed_parser import FeedEntry
+
+
+class CachedFeed(TypedDict):
+    """캐시된 피드 한 개"""
+    etag: str
+    last_modified: str
+    content_hash: str
+    fetched_at: float
+    entries: list['FeedEntry']
+
+
+class FeedCache:
+    """
+    URL별 피드 캐시 (JSON 파일 하나에 저장)
+
+    여러 스레드에서 동시에 get/put 할 수 있으며, save()는 임시 파일에 쓴 뒤
+    교체하므로 중간에 중단되어도 캐시 파일이 깨지지 않습니다.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or Config.get_cache_path('feeds.json')
+        self._lock = threading.Lock()
+        self._feeds: dict[str, CachedFeed] = self._read()
+        self._dirty = False
+
+    def _read(self) -> dict[str, CachedFeed]:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, url: str) -> CachedFeed | None:
+        """캐시된 피드를 반환합니다. (없으면 None)"""
+        with self._lock:
+            return self._feeds.get(url)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """캐시된 검증자로 조건부 요청 헤더를 만듭니다."""
+        cached = self.get(url)
+        headers: dict[str, str] = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def put(self, url: str, etag: str, last_modified: str, content_hash: str, entries: list['FeedEntry']) -> None:
+        """피드 응답을 캐시에 저장합니다."""
+        with self._lock:
+            self._feeds[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content_hash': content_hash,
+                'fetched_at': time.time(),
+                'entries': entries,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """변경 사항이 있으면 캐시 파일에 기록합니다."""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._feeds, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                print(f"    [경고] 피드 캐시 저장 실패: {e}")
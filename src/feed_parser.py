@@ -0,0 +1,201 @@
+"""
+RSS/Atom 피드 파싱 모듈
+수집에 필요한 필드(제목, 링크, 설명, 발행일)만 뽑는 파서 백엔드를 제공합니다.
+
+- lxml: iterparse로 엔트리를 하나씩 읽고 바로 해제하는 빠른 파서 (RSS 2.0, RSS 1.0, Atom)
+- feedparser: 느리지만 깨진 피드도 최대한 읽어내는 파서 (lxml 실패 시 대체)
+"""
+
+import html
+import io
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TypedDict
+
+import feedparser
+from lxml import etree
+
+from .config import Config
+
+
+class FeedEntry(TypedDict):
+    """파싱된 RSS 피드 엔트리 (수집에 필요한 필드만)"""
+    title: str
+    link: str
+    description: str
+    published: str
+
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+_WHITESPACE = re.compile(r'\s+')
+
+# 엔트리 요소 이름 (RSS의 item, Atom의 entry)
+_ENTRY_TAGS = {'item', 'entry'}
+_DESCRIPTION_TAGS = ('description', 'summary', 'encoded', 'content')
+_DATE_TAGS = ('pubDate', 'published', 'date', 'updated', 'modified')
+
+
+# ---------------------------------------------------------------------------
+# feedparser 백엔드
+# ---------------------------------------------------------------------------
+
+def _parse_published(entry) -> str:
+    """feedparser 엔트리의 발행일을 'YYYY-MM-DD HH:MM' 문자열로 변환합니다."""
+    published = ''
+    try:
+        if entry.get('published_parsed'):
+            pub_date = datetime(*entry.published_parsed[:6])
+            published = pub_date.strftime('%Y-%m-%d %H:%M')
+        elif entry.get('updated_parsed'):
+            pub_date = datetime(*entry.updated_parsed[:6])
+            published = pub_date.strftime('%Y-%m-%d %H:%M')
+    except:
+        published = datetime.now().strftime('%Y-%m-%d')
+    return published
+
+
+def parse_feed_feedparser(content: bytes, content_type: str = '') -> list[FeedEntry]:
+    """feedparser로 피드를 파싱합니다."""
+    feed = feedparser.parse(content, response_headers={'content-type': content_type})
+
+    return [
+        {
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'description': entry.get('summary', '') or entry.get('description', ''),
+            'published': _parse_published(entry),
+        }
+        for entry in feed.entries
+    ]
+
+
+# ---------------------------------------------------------------------------
+# lxml 백엔드
+# ---------------------------------------------------------------------------
+
+def _local_name(tag) -> str:
+    if not isinstance(tag, str):
+        return ''
+    return tag.rsplit('}', 1)[-1]
+
+
+def _format_date(value: str) -> str:
+    """
+    RFC 822(RSS) 또는 ISO 8601(Atom, dc:date) 날짜를 'YYYY-MM-DD HH:MM'으로 변환합니다.
+
+    feedparser 백엔드와 같은 결과가 나오도록 시간대가 있으면 UTC로 맞춥니다.
+    """
+    value = value.strip()
+    if not value:
+        return ''
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return ''
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime('%Y-%m-%d %H:%M')
+
+
+def _clean_title(text: str) -> str:
+    if '<' in text or '&' in text:
+        text = _HTML_TAG.sub('', html.unescape(text))
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def _entry_from_element(element) -> FeedEntry:
+    """<item>/<entry> 요소에서 필요한 필드를 뽑습니다."""
+    fields: dict[str, str] = {}
+    link = ''
+    has_alternate = False
+
+    for child in element:
+        name = _local_name(child.tag)
+        if not name:
+            continue
+
+        if name == 'link':
+            href = child.get('href')
+            if href is None:
+                # RSS: <link>URL</link>
+                if not link:
+                    link = (child.text or '').strip()
+            elif child.get('rel', 'alternate') == 'alternate' and not has_alternate:
+                # Atom: 첫 rel="alternate" 링크 (self, enclosure 등은 무시)
+                link, has_alternate = href, True
+        elif name not in fields:
+            fields[name] = child.text or ''
+
+    description = next((fields[name] for name in _DESCRIPTION_TAGS if fields.get(name)), '')
+    published = next((_format_date(fields[name]) for name in _DATE_TAGS if fields.get(name)), '')
+
+    return {
+        'title': _clean_title(fields.get('title', '')),
+        'link': link,
+        'description': description,
+        'published': published,
+    }
+
+
+def parse_feed_lxml(content: bytes) -> list[FeedEntry]:
+    """
+    lxml iterparse로 피드를 스트리밍 파싱합니다.
+
+    엔트리 요소가 끝날 때마다 필드를 뽑고 요소를 해제하므로 큰 피드도
+    메모리를 적게 씁니다.
+
+    Raises:
+        etree.XMLSyntaxError: XML이 올바르지 않은 경우
+        ValueError: RSS/Atom 피드가 아닌 경우
+    """
+    entries: list[FeedEntry] = []
+    context = etree.iterparse(io.BytesIO(content), events=('end',), resolve_entities=False, no_network=True)
+
+    for _, element in context:
+        if _local_name(element.tag) in _ENTRY_TAGS:
+            entries.append(_entry_from_element(element))
+            # 처리한 엔트리와 앞선 형제 요소를 해제
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    root_name = _local_name(context.root.tag)
+    if root_name not in ('rss', 'feed', 'RDF'):
+        raise ValueError(f'RSS/Atom 피드가 아닙니다: <{root_name}>')
+
+    return entries
+
+
+# ---------------------------------------------------------------------------
+# 공통 진입점
+# ---------------------------------------------------------------------------
+
+def parse_feed(content: bytes, content_type: str = '', backend: str | None = None) -> list[FeedEntry]:
+    """
+    피드를 파싱해 수집에 필요한 필드만 추출합니다.
+
+    Args:
+        content: 피드 XML 바이트
+        content_type: 응답의 Content-Type 헤더 (feedparser 인코딩 판단용)
+        backend: 'lxml' 또는 'feedparser' (None이면 Config.FEED_PARSER)
+
+    Returns:
+        피드 엔트리 리스트 (lxml이 실패하면 feedparser로 다시 파싱)
+    """
+    backend = backend or Config.FEED_PARSER
+
+    if backend == 'lxml':
+        try:
+            return parse_feed_lxml(content)
+        except (etree.XMLSyntaxError, ValueError):
+            pass
+
+    return parse_feed_feedparser(content, content_type)
@@ -0,0 +1,99 @@
+"""
+피드 적중률 통계 모듈
+키워드별로 어떤 RSS 피드에서 기사가 매칭되었는지 실행 간에 기록해
+잘 맞는 피드를 먼저 받고, 계속 한 건도 맞지 않는 피드는 건너뜁니다.
+"""
+
+import json
+import os
+import random
+import threading
+from pathlib import Path
+
+from .config import Config
+
+
+class FeedYieldStats:
+    """
+    (키워드, 언론사)별 매칭 기사 수 통계 (JSON 파일에 저장되어 실행 간에 유지)
+
+    적중률은 실행마다 매칭된 기사 수의 지수 이동 평균으로, 최근 실행에 더 큰
+    가중치를 둡니다. 아직 기록이 없는 피드는 먼저 받아서 통계를 쌓습니다.
+
+    Args:
+        path: 통계 파일 경로 (None이면 캐시 디렉토리의 feed_yield.json)
+    """
+
+    # 지수 이동 평균에서 새 관측값의 가중치
+    SMOOTHING = 0.3
+    # 이 값보다 적중률이 낮으면 매칭이 없는 피드로 봄
+    ZERO_YIELD = 0.05
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or Config.get_cache_path('feed_yield.json')
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, dict]] = self._read()
+
+    def _read(self) -> dict[str, dict[str, dict]]:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _key(keyword: str) -> str:
+        return keyword.strip().lower()
+
+    def expected(self, keyword: str, source: str) -> float | None:
+        """예상 매칭 기사 수 (기록이 없으면 None)"""
+        with self._lock:
+            state = self._stats.get(self._key(keyword), {}).get(source)
+        return state['yield'] if state else None
+
+    def should_skip(self, keyword: str, source: str) -> bool:
+        """
+        키워드에 대해 피드를 건너뛸지 결정합니다.
+
+        FEED_YIELD_MIN_RUNS번 이상 받았는데 매칭이 거의 없으면 건너뛰되,
+        FEED_YIELD_EXPLORE 확률로는 다시 받아 적중률 변화를 확인합니다.
+        """
+        with self._lock:
+            state = self._stats.get(self._key(keyword), {}).get(source)
+        if not state or state['runs'] < Config.FEED_YIELD_MIN_RUNS:
+            return False
+        if state['yield'] >= self.ZERO_YIELD:
+            return False
+        return random.random() >= Config.FEED_YIELD_EXPLORE
+
+    def priority(self, keywords: list[str], source: str) -> float:
+        """여러 키워드 중 가장 높은 예상 매칭 수 (기록이 없으면 무한대로 먼저 받음)"""
+        best = 0.0
+        for keyword in keywords:
+            value = self.expected(keyword, source)
+            if value is None:
+                return float('inf')
+            best = max(best, value)
+        return best
+
+    def record(self, keyword: str, source: str, matched: int) -> None:
+        """피드를 받아 매칭한 결과를 기록합니다."""
+        with self._lock:
+            state = self._stats.setdefault(self._key(keyword), {}).get(source)
+            if state is None:
+                self._stats[self._key(keyword)][source] = {'runs': 1, 'yield': float(matched)}
+                return
+            state['runs'] += 1
+            state['yield'] = round(state['yield'] * (1 - self.SMOOTHING) + matched * self.SMOOTHING, 4)
+
+    def save(self) -> None:
+        """통계를 파일에 기록합니다."""
+        with self._lock:
+            data = json.dumps(self._stats, ensure_ascii=False)
+        tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"    [경고] 피드 적중률 저장 실패: {e}")
@@ -3,12 +3,26 @@
 다양한 언론사에서 키워드 기반으로 뉴스를 수집합니다.
 """
 
-import feedparser
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote
 from datetime import datetime
-from typing import TypedDict
+from typing import Callable, Iterator, NotRequired, TypedDict
+import hashlib
 import re
+import threading
+import time
+
+from . import http_client
+from .article_store import ArticleMeta, get_article_store
+from .config import Config
+from .dedup import NearDuplicateIndex
+from .extractor import extract_article_body, extract_meta_tags, extract_title_tag
+from .feed_cache import FeedCache
+from .feed_parser import FeedEntry, parse_feed
+from .feed_yield import FeedYieldStats
+from .health import CircuitOpenError, get_source_health
+from .query import KeywordMatcher
+from .ratelimit import HostRateLimiter
 
 
 class NewsArticle(TypedDict):
@@ -18,6 +32,9 @@ class NewsArticle(TypedDict):
     published: str
     source: str
     summary: str
+    description: NotRequired[str]  # RSS description 또는 og:description
+    body: NotRequired[str]  # 수집 중 읽은 기사 본문 앞부분 (PORTAL_FETCH_BODY)
+    keywords: NotRequired[list[str]]  # 이 기사를 찾은 키워드 (fetch_news_by_keywords)
 
 
 # 주요 언론사 RSS 피드 목록
@@ -71,6 +88,133 @@ RSS_FEEDS = {
     'Ars Technica': 'https://feeds.arstechnica.com/arstechnica/index',
 }
 
+# RSS 결과를 병합할 때 언론사당 최대 기사 수
+RSS_PER_SOURCE_LIMIT = 10
+# 기사에 담아 둘 본문 최대 길이 (요약에는 앞 300자만 사용)
+ARTICLE_BODY_MAX_CHARS = 1000
+
+
+# 포털 기사 페이지 요청에 공유하는 호스트별 속도 제한기
+_portal_limiter = HostRateLimiter(Config.PORTAL_RATE, Config.PORTAL_BURST)
+
+
+def _meta_to_article(meta: ArticleMeta) -> NewsArticle:
+    article: NewsArticle = {
+        'title': meta['title'],
+        'link': meta['link'],
+        'published': meta['published'],
+        'source': meta['source'],
+        'summary': '',
+        'description': meta['description']
+    }
+    if meta.get('body'):
+        article['body'] = meta['body']
+    return article
+
+
+def _portal_call(source: str, url: str, request: Callable[[str, float], str], default_timeout: float) -> str:
+    """
+    포털 페이지를 소스 상태 관리(health.call)를 거쳐 요청합니다.
+
+    속도 제한 토큰은 시도마다 요청 직전에 받으며, 토큰을 기다린 시간은
+    응답 시간(적응형 타임아웃 계산)에 넣지 않습니다.
+    """
+    return get_source_health().call(
+        source, lambda timeout: request(url, timeout), default_timeout,
+        acquire=lambda: _portal_limiter.acquire(url)
+    )
+
+
+def _portal_get(url: str, timeout: float) -> str:
+    """포털 페이지를 요청하고 HTML을 반환합니다. (속도 제한은 _portal_call이 처리)"""
+    response = http_client.get(url, timeout=timeout)
+    response.raise_for_status()
+    response.encoding = 'utf-8'
+    return response.text
+
+
+def _portal_get_head(url: str, timeout: float) -> str:
+    """포털 기사 페이지의 <head>만 읽습니다. (속도 제한은 _portal_call이 처리)"""
+    return http_client.get_head(url, timeout=timeout)
+
+
+def _resolve_article_pages(
+    links: list[str],
+    parse_page: Callable[[str, str], ArticleMeta],
+    source: str,
+    max_workers: int | None = None,
+    full_page: bool = False
+) -> list[NewsArticle]:
+    """
+    검색 결과의 기사 페이지들을 병렬로 가져와 파싱합니다.
+
+    기사 저장소에 이미 있는 링크는 요청하지 않고 저장된 메타데이터를 씁니다.
+    나머지 요청은 호스트별 토큰 버킷을 거치므로 동시 작업 수와 무관하게
+    Config.PORTAL_RATE 이상의 속도로 요청하지 않습니다.
+
+    Args:
+        links: 기사 URL 리스트 (검색 결과 순서)
+        parse_page: (링크, HTML)을 받아 메타데이터를 만드는 함수
+        source: 소스 상태를 기록할 이름 (검색 페이지와 따로 - 기사 페이지 실패가 검색을 막지 않도록)
+        max_workers: 동시 요청 수 (None이면 Config.PORTAL_MAX_WORKERS)
+        full_page: 본문까지 필요하면 True (False면 <head>까지만 읽음)
+
+    Returns:
+        검색 결과 순서를 유지한 기사 리스트 (실패한 기사는 제외)
+    """
+    get_page = _portal_get if full_page else _portal_get_head
+
+    def resolve(link: str) -> ArticleMeta | None:
+        try:
+            html = _portal_call(source, link, get_page, 5)
+            return parse_page(link, html)
+        except Exception:
+            return None
+
+    if not links:
+        return []
+
+    store = get_article_store()
+    metas: dict[str, ArticleMeta] = store.get_many(links) if store else {}
+    missing = [link for link in links if link not in metas]
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers or Config.PORTAL_MAX_WORKERS) as executor:
+            fetched = [meta for meta in executor.map(resolve, missing) if meta is not None]
+
+        if store:
+            store.put_many(fetched)
+        metas.update((meta['link'], meta) for meta in fetched)
+
+    return [_meta_to_article(metas[link]) for link in links if link in metas]
+
+
+def _published_from_meta(metas: dict[str, str]) -> str:
+    """article:published_time 메타 태그로 발행일을 만듭니다. (없으면 오늘 날짜)"""
+    published_time = metas.get('article:published_time', '')
+    if published_time:
+        try:
+            return datetime.fromisoformat(published_time).strftime('%Y-%m-%d %H:%M')
+        except ValueError:
+            pass
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def _parse_naver_article(link: str, html: str) -> ArticleMeta:
+    """네이버 기사 페이지에서 제목, 언론사, 설명(, 본문)을 추출합니다."""
+    metas = extract_meta_tags(html)
+
+    return {
+        'link': link,
+        'title': metas.get('og:title') or extract_title_tag(html) or '제목 없음',
+        'source': metas.get('og:article:author') or '네이버뉴스',
+        'published': _published_from_meta(metas),
+        'description': metas.get('og:description', ''),
+        # <head>만 읽은 경우에는 빈 문자열
+        'body': extract_article_body(html)[:ARTICLE_BODY_MAX_CHARS],
+        'fetched_at': time.time()
+    }
+
 
 def fetch_news_from_naver(query: str, limit: int = 50) -> list[NewsArticle]:
     """
@@ -78,51 +222,18 @@ def fetch_news_from_naver(query: str, limit: int = 50) -> list[NewsArticle]:
     """
     encoded_query = quote(query)
     articles: list[NewsArticle] = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
 
     try:
         search_url = f"https://search.naver.com/search.naver?where=news&query={encoded_query}&sort=1"
-        response = requests.get(search_url, headers=headers, timeout=10)
-        response.encoding = 'utf-8'
+        html = _portal_call('네이버뉴스', search_url, _portal_get, 10)
 
+        # 검색 결과 순서를 유지하며 중복 링크 제거
         link_pattern = r'href="(https://n\.news\.naver\.com/mnews/article/[^"]+)"'
-        links = list(set(re.findall(link_pattern, response.text)))
+        links = list(dict.fromkeys(re.findall(link_pattern, html)))
 
-        seen = set()
-        for link in links[:limit]:
-            if link in seen:
-                continue
-            seen.add(link)
-
-            try:
-                article_response = requests.get(link, headers=headers, timeout=5)
-                article_response.encoding = 'utf-8'
-
-                title_match = re.search(r'<meta property="og:title" content="([^"]+)"', article_response.text)
-                if title_match:
-                    title = title_match.group(1)
-                else:
-                    title_match = re.search(r'<title>([^<]+)</title>', article_response.text)
-                    title = title_match.group(1) if title_match else '제목 없음'
-
-                source_match = re.search(r'<meta property="og:article:author" content="([^"]+)"', article_response.text)
-                source = source_match.group(1) if source_match else '네이버뉴스'
-
-                articles.append({
-                    'title': title,
-                    'link': link,
-                    'published': datetime.now().strftime('%Y-%m-%d'),
-                    'source': source,
-                    'summary': ''
-                })
-
-                if len(articles) >= limit:
-                    break
-
-            except Exception:
-                continue
+        articles = _resolve_article_pages(
+            links[:limit], _parse_naver_article, '네이버뉴스 기사', full_page=Config.PORTAL_FETCH_BODY
+        )
 
     except Exception as e:
         print(f"    [경고] 네이버 뉴스 검색 실패: {e}")
@@ -130,88 +241,358 @@ def fetch_news_from_naver(query: str, limit: int = 50) -> list[NewsArticle]:
     return articles
 
 
-def fetch_from_rss(rss_url: str, source_name: str, query: str = '', limit: int = 50) -> list[NewsArticle]:
+def download_feed(
+    rss_url: str,
+    timeout: float | None = None,
+    cache: FeedCache | None = None,
+    source_name: str | None = None
+) -> list[FeedEntry]:
     """
-    RSS 피드에서 뉴스를 수집합니다.
+    RSS 피드를 다운로드하고 필요한 필드만 남긴 엔트리 리스트로 파싱합니다.
+
+    캐시가 주어지면 ETag/Last-Modified로 조건부 요청을 보내고, 304 응답이거나
+    본문이 이전과 같으면 캐시된 엔트리를 그대로 재사용합니다.
+    요청은 소스 상태 관리(적응형 타임아웃, 재시도, 차단)를 거칩니다.
 
     Args:
         rss_url: RSS 피드 URL
+        timeout: 다운로드 타임아웃 상한 (초, None이면 Config.RSS_TIMEOUT)
+        cache: 조건부 요청에 사용할 피드 캐시
+        source_name: 상태를 기록할 소스 이름 (None이면 URL)
+
+    Returns:
+        피드 엔트리 리스트 (실패 시 예외 발생)
+    """
+    headers = {'Accept-Encoding': 'gzip, deflate'}
+    cached = cache.get(rss_url) if cache else None
+    if cached:
+        headers.update(cache.conditional_headers(rss_url))
+
+    def request(request_timeout: float):
+        response = http_client.get(rss_url, headers=headers, timeout=request_timeout)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    # 타임아웃을 지키도록 직접 다운로드한 뒤 파싱
+    response = get_source_health().call(source_name or rss_url, request, timeout or Config.RSS_TIMEOUT)
+    if response.status_code == 304:
+        return cached['entries'] if cached else []
+
+    content_hash = hashlib.sha1(response.content).hexdigest()
+    if cached and cached['content_hash'] == content_hash:
+        entries = cached['entries']
+    else:
+        entries = parse_feed(response.content, response.headers.get('content-type', ''))
+
+    if cache:
+        cache.put(
+            rss_url,
+            response.headers.get('ETag', ''),
+            response.headers.get('Last-Modified', ''),
+            content_hash,
+            entries
+        )
+    return entries
+
+
+def _entry_to_article(entry: FeedEntry, source_name: str) -> NewsArticle:
+    return {
+        'title': entry['title'],
+        'link': entry['link'],
+        'published': entry['published'],
+        'source': source_name,
+        'summary': '',
+        'description': entry['description']
+    }
+
+
+def filter_entries(entries: list[FeedEntry], source_name: str, query: str = '', limit: int = 50) -> list[NewsArticle]:
+    """
+    피드 엔트리 중 제목/설명이 키워드 검색식에 맞는 기사를 골라냅니다.
+
+    Args:
+        entries: download_feed로 파싱한 엔트리 리스트
         source_name: 언론사 이름
-        query: 검색 키워드 (빈 문자열이면 필터링 안함)
+        query: 키워드 검색식 (AND/OR/NOT, 따옴표 구문 지원, 빈 문자열이면 필터링 안함)
         limit: 최대 수집 개수
     """
     articles: list[NewsArticle] = []
+    matcher = KeywordMatcher([query]) if query else None
 
-    try:
-        feed = feedparser.parse(rss_url)
+    for entry in entries:
+        if len(articles) >= limit:
+            break
 
-        for entry in feed.entries:
-            if len(articles) >= limit:
-                break
+        # 키워드 검색식 필터링 (제목과 설명을 함께 검사)
+        if matcher and not matcher.match(entry['title'], entry['description']):
+            continue
 
-            title = entry.get('title', '')
+        articles.append(_entry_to_article(entry, source_name))
 
-            # 키워드 필터링 (query가 있으면)
-            if query and query.lower() not in title.lower():
-                # description에서도 검색
-                description = entry.get('summary', '') or entry.get('description', '')
-                if query.lower() not in description.lower():
-                    continue
+    return articles
 
-            # 발행일 파싱
-            published = ''
-            try:
-                if entry.get('published_parsed'):
-                    pub_date = datetime(*entry.published_parsed[:6])
-                    published = pub_date.strftime('%Y-%m-%d %H:%M')
-                elif entry.get('updated_parsed'):
-                    pub_date = datetime(*entry.updated_parsed[:6])
-                    published = pub_date.strftime('%Y-%m-%d %H:%M')
-            except:
-                published = datetime.now().strftime('%Y-%m-%d')
-
-            articles.append({
-                'title': title,
-                'link': entry.get('link', ''),
-                'published': published,
-                'source': source_name,
-                'summary': ''
-            })
 
+def fetch_from_rss(
+    rss_url: str,
+    source_name: str,
+    query: str = '',
+    limit: int = 50,
+    timeout: float | None = None
+) -> list[NewsArticle]:
+    """
+    RSS 피드에서 뉴스를 수집합니다.
+
+    Args:
+        rss_url: RSS 피드 URL
+        source_name: 언론사 이름
+        query: 검색 키워드 (빈 문자열이면 필터링 안함)
+        limit: 최대 수집 개수
+        timeout: 피드 다운로드 타임아웃 (초, None이면 Config.RSS_TIMEOUT)
+    """
+    try:
+        entries = download_feed(rss_url, timeout, source_name=source_name)
     except Exception as e:
         print(f"    [경고] {source_name} RSS 실패: {str(e)[:50]}")
+        return []
 
-    return articles
+    return filter_entries(entries, source_name, query, limit)
 
 
-def fetch_from_multiple_rss(query: str, limit: int = 50) -> list[NewsArticle]:
+class RssSnapshot:
     """
-    여러 RSS 피드에서 뉴스를 수집합니다.
+    실행 단위 RSS 피드 스냅샷
+
+    처음 필요할 때 모든 피드를 한 번만 다운로드/파싱하고, 등록된 키워드 전체를
+    엔트리 한 번 순회로 매칭해 둡니다. 여러 키워드로 수집할 때 같은 피드를
+    키워드 수만큼 다시 받지 않도록 fetch_news에 전달해 사용합니다.
+
+    적중률 통계가 있으면 키워드에 잘 맞는 피드부터 받고, 모든 키워드에서
+    매칭이 없던 피드는 건너뜁니다. target을 주면 모든 키워드가 target개 이상
+    매칭되는 순간 남은 피드 요청을 취소합니다.
+
+    Args:
+        keywords: 함께 매칭할 키워드 목록
+        max_workers: 동시에 수집할 피드 수 (None이면 Config.RSS_MAX_WORKERS)
+        timeout: 피드당 타임아웃 (초, None이면 Config.RSS_TIMEOUT)
+        cache: 피드 캐시 (None이면 Config.RSS_CACHE에 따라 생성)
+        target: 키워드당 필요한 기사 수 (None이면 모든 피드를 받음)
+        stats: 피드 적중률 통계 (None이면 Config.FEED_YIELD에 따라 생성)
     """
+
+    def __init__(
+        self,
+        keywords: list[str],
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        cache: FeedCache | None = None,
+        target: int | None = None,
+        stats: FeedYieldStats | None = None
+    ):
+        self.keywords = list(keywords)
+        self.max_workers = max_workers or Config.RSS_MAX_WORKERS
+        self.timeout = timeout
+        if cache is None and Config.RSS_CACHE:
+            cache = FeedCache()
+        self.cache = cache
+        self.target = target
+        if stats is None and Config.FEED_YIELD:
+            stats = FeedYieldStats()
+        self.stats = stats
+        self._feeds: dict[str, list[FeedEntry]] | None = None
+        # 다운로드에 실패한 피드 (적중률에 반영하지 않음)
+        self._failed: set[str] = set()
+        # 결과를 돌려줄 언론사 순서 (받은 순서가 아니라 적중률 순)
+        self._order: list[str] = list(RSS_FEEDS)
+        self._matches: dict[str, dict[str, list[NewsArticle]]] = {}
+        self._unique_index: dict[str, NearDuplicateIndex] = {}
+        self._unique_count: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _plan(self, queries: list[str]) -> list[tuple[str, str]]:
+        """받을 피드를 적중률 순으로 정렬하고, 모든 키워드에서 매칭이 없던 피드는 뺍니다."""
+        feeds = list(RSS_FEEDS.items())
+        if not self.stats:
+            return feeds
+
+        planned = [
+            (source_name, rss_url) for source_name, rss_url in feeds
+            if not all(self.stats.should_skip(query, source_name) for query in queries)
+        ]
+        if len(planned) < len(feeds):
+            print(f"    [건너뜀] 키워드와 맞지 않던 RSS {len(feeds) - len(planned)}개")
+
+        planned.sort(key=lambda item: self.stats.priority(queries, item[0]), reverse=True)
+        return planned
+
+    def _count_unique(self, source_name: str, queries: list[str]) -> None:
+        """조기 종료 판단용으로 키워드별 중복 아닌 매칭 수를 셉니다. (언론사당 상한 적용)"""
+        for query in queries:
+            index = self._unique_index.setdefault(query, NearDuplicateIndex())
+            added = sum(1 for article in self._matches[query][source_name][:RSS_PER_SOURCE_LIMIT] if index.add_article(article))
+            self._unique_count[query] = self._unique_count.get(query, 0) + added
+
+    def _enough(self, queries: list[str]) -> bool:
+        """모든 키워드가 target개 이상 매칭되었는지 확인합니다."""
+        return all(self._unique_count.get(query, 0) >= self.target for query in queries)
+
+    def _load(self, queries: list[str]) -> None:
+        """
+        피드를 병렬로 다운로드하며 적중률 순서대로 매칭합니다. (실패한 피드는 빈 리스트)
+
+        먼저 도착한 피드라도 앞 순위 피드가 모두 끝날 때까지 기다렸다가 순서대로 반영하므로,
+        조기 종료 시점과 결과가 도착 순서에 따라 달라지지 않습니다.
+        """
+        def load_one(source_name: str, rss_url: str) -> list[FeedEntry] | None:
+            try:
+                return download_feed(rss_url, self.timeout, self.cache, source_name)
+            except CircuitOpenError:
+                print(f"    [건너뜀] {source_name} RSS (연속 실패로 일시 차단 중)")
+                return None
+            except Exception as e:
+                print(f"    [경고] {source_name} RSS 실패: {str(e)[:50]}")
+                return None
+
+        self._feeds = {}
+        matcher = KeywordMatcher(queries)
+        planned = self._plan(queries)
+        self._order = [source_name for source_name, _ in planned]
+        self._order += [source_name for source_name in RSS_FEEDS if source_name not in self._order]
+        for query in queries:
+            self._matches[query] = {source_name: [] for source_name in self._order}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = [executor.submit(load_one, source_name, rss_url) for source_name, rss_url in planned]
+        position = {future: i for i, future in enumerate(futures)}
+        arrived: dict[int, list[FeedEntry] | None] = {}
+        next_index = 0
+        try:
+            for future in as_completed(futures):
+                arrived[position[future]] = future.result()
+                enough = False
+                # 앞 순위 피드가 모두 도착한 만큼만 순서대로 반영
+                while next_index in arrived:
+                    source_name = planned[next_index][0]
+                    entries = arrived.pop(next_index)
+                    next_index += 1
+                    self._feeds[source_name] = entries or []
+                    if entries is None:
+                        self._failed.add(source_name)
+                    # 다운로드에 실패한 피드는 적중률에 반영하지 않음
+                    self._match_feed(source_name, matcher, record=entries is not None)
+
+                    if self.target:
+                        self._count_unique(source_name, queries)
+                        enough = self._enough(queries)
+                        if enough:
+                            break
+
+                if enough:
+                    cancelled = sum(1 for pending in futures if pending.cancel())
+                    if cancelled:
+                        print(f"    [조기 종료] 필요한 기사를 모두 찾아 RSS {cancelled}개 요청 취소")
+                    break
+        finally:
+            # 시작하지 않은 요청은 취소하고, 진행 중인 요청은 끝날 때까지 기다림
+            # (캐시를 저장한 뒤에 캐시에 쓰지 않도록. 결과는 사용하지 않음)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if self.cache:
+            self.cache.save()
+        if self.stats:
+            self.stats.save()
+        get_source_health().save()
+
+    def _match_feed(self, source_name: str, matcher: KeywordMatcher, record: bool = True) -> None:
+        """피드 하나의 엔트리를 한 번씩만 정규화/순회하며 모든 키워드 검색식을 함께 매칭합니다."""
+        for entry in self._feeds[source_name]:
+            for query in matcher.match(entry['title'], entry['description']):
+                self._matches[query][source_name].append(_entry_to_article(entry, source_name))
+
+        if record and self.stats:
+            for query in matcher.queries:
+                self.stats.record(query, source_name, len(self._matches[query][source_name]))
+
+    def matches(self, query: str) -> dict[str, list[NewsArticle]]:
+        """
+        키워드에 매칭된 기사를 언론사별로 반환합니다. (적중률 순서, 통계가 없으면 RSS_FEEDS 순서)
+
+        스냅샷에 등록되지 않은 키워드는 이미 받아 둔 피드에서 추가로 매칭합니다.
+        (이번에 받지 못한 피드는 적중률에 반영하지 않음)
+        """
+        with self._lock:
+            if self._feeds is None:
+                self._load(list(dict.fromkeys(self.keywords + [query])))
+            elif query not in self._matches:
+                self._matches[query] = {source_name: [] for source_name in self._order}
+                matcher = KeywordMatcher([query])
+                for source_name in self._feeds:
+                    self._match_feed(source_name, matcher, record=source_name not in self._failed)
+                if self.stats:
+                    self.stats.save()
+
+            return {
+                source_name: [dict(article) for article in articles]
+                for source_name, articles in self._matches[query].items()
+            }
+
+
+def fetch_from_multiple_rss(
+    query: str,
+    limit: int = 50,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+    snapshot: RssSnapshot | None = None
+) -> list[NewsArticle]:
+    """
+    여러 RSS 피드에서 뉴스를 동시에 수집합니다.
+
+    피드는 RssSnapshot이 스레드 풀에서 병렬로 다운로드하고, 결과는 피드
+    적중률 순서대로 병합됩니다. 스냅샷을 새로 만들 때는 limit개를 찾는 즉시 남은
+    피드 요청을 취소합니다.
+
+    Args:
+        query: 검색 키워드
+        limit: 최대 수집 개수
+        max_workers: 동시에 수집할 피드 수 (None이면 Config.RSS_MAX_WORKERS)
+        timeout: 피드당 타임아웃 (초, None이면 Config.RSS_TIMEOUT)
+        snapshot: 재사용할 RSS 스냅샷 (None이면 이 키워드만으로 새로 수집)
+    """
+    if snapshot is None:
+        snapshot = RssSnapshot([query], max_workers=max_workers, timeout=timeout, target=limit)
+
     all_articles: list[NewsArticle] = []
-    seen_titles: set[str] = set()
+    dedup_index = NearDuplicateIndex()
 
-    for source_name, rss_url in RSS_FEEDS.items():
+    for source_name, articles in snapshot.matches(query).items():
         if len(all_articles) >= limit:
             break
 
-        try:
-            articles = fetch_from_rss(rss_url, source_name, query, limit=10)
+        for article in articles[:RSS_PER_SOURCE_LIMIT]:
+            # 중복 제거 (같은 제목 또는 유사 기사)
+            if dedup_index.add_article(article):
+                all_articles.append(article)
 
-            for article in articles:
-                # 중복 제거 (제목 기준)
-                title_normalized = article['title'].lower().strip()
-                if title_normalized not in seen_titles:
-                    seen_titles.add(title_normalized)
-                    all_articles.append(article)
+                if len(all_articles) >= limit:
+                    break
 
-                    if len(all_articles) >= limit:
-                        break
+    return all_articles
 
-        except Exception:
-            continue
 
-    return all_articles
+def _parse_daum_article(link: str, html: str) -> ArticleMeta:
+    """다음 기사 페이지에서 제목, 언론사, 설명(, 본문)을 추출합니다."""
+    metas = extract_meta_tags(html)
+
+    return {
+        'link': link,
+        'title': metas.get('og:title') or '제목 없음',
+        'source': metas.get('og:article:author') or '다음뉴스',
+        'published': _published_from_meta(metas),
+        'description': metas.get('og:description', ''),
+        # <head>만 읽은 경우에는 빈 문자열
+        'body': extract_article_body(html)[:ARTICLE_BODY_MAX_CHARS],
+        'fetched_at': time.time()
+    }
 
 
 def fetch_news_from_daum(query: str, limit: int = 50) -> list[NewsArticle]:
@@ -220,43 +601,18 @@ def fetch_news_from_daum(query: str, limit: int = 50) -> list[NewsArticle]:
     """
     encoded_query = quote(query)
     articles: list[NewsArticle] = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
 
     try:
         search_url = f"https://search.daum.net/search?w=news&q={encoded_query}&sort=recency"
-        response = requests.get(search_url, headers=headers, timeout=10)
-        response.encoding = 'utf-8'
+        html = _portal_call('다음뉴스', search_url, _portal_get, 10)
 
-        # 다음 뉴스 링크 패턴
+        # 다음 뉴스 링크 패턴 (검색 결과 순서 유지)
         link_pattern = r'href="(https://v\.daum\.net/v/[^"]+)"'
-        links = list(set(re.findall(link_pattern, response.text)))
-
-        for link in links[:limit]:
-            try:
-                article_response = requests.get(link, headers=headers, timeout=5)
-                article_response.encoding = 'utf-8'
-
-                title_match = re.search(r'<meta property="og:title" content="([^"]+)"', article_response.text)
-                title = title_match.group(1) if title_match else '제목 없음'
+        links = list(dict.fromkeys(re.findall(link_pattern, html)))
 
-                source_match = re.search(r'<meta property="og:article:author" content="([^"]+)"', article_response.text)
-                source = source_match.group(1) if source_match else '다음뉴스'
-
-                articles.append({
-                    'title': title,
-                    'link': link,
-                    'published': datetime.now().strftime('%Y-%m-%d'),
-                    'source': source,
-                    'summary': ''
-                })
-
-                if len(articles) >= limit:
-                    break
-
-            except Exception:
-                continue
+        articles = _resolve_article_pages(
+            links[:limit], _parse_daum_article, '다음뉴스 기사', full_page=Config.PORTAL_FETCH_BODY
+        )
 
     except Exception as e:
         print(f"    [경고] 다음 뉴스 검색 실패: {e}")
@@ -264,27 +620,26 @@ def fetch_news_from_daum(query: str, limit: int = 50) -> list[NewsArticle]:
     return articles
 
 
-def fetch_news(query: str, limit: int = 50) -> list[NewsArticle]:
+def fetch_news(query: str, limit: int = 50, rss_snapshot: RssSnapshot | None = None) -> list[NewsArticle]:
     """
     여러 소스에서 뉴스를 수집합니다.
 
     Args:
         query: 검색 키워드
         limit: 가져올 기사 수 (기본값: 50)
+        rss_snapshot: 여러 키워드가 공유할 RSS 스냅샷 (None이면 새로 수집)
 
     Returns:
         뉴스 기사 딕셔너리 리스트
     """
     all_articles: list[NewsArticle] = []
-    seen_titles: set[str] = set()
+    dedup_index = NearDuplicateIndex()
 
     # 1. 네이버 뉴스에서 수집
     print(f"    - 네이버 뉴스 검색 중...")
     naver_articles = fetch_news_from_naver(query, limit)
     for article in naver_articles:
-        title_normalized = article['title'].lower().strip()
-        if title_normalized not in seen_titles:
-            seen_titles.add(title_normalized)
+        if dedup_index.add_article(article):
             all_articles.append(article)
     print(f"      → {len(naver_articles)}개 수집")
 
@@ -294,9 +649,7 @@ def fetch_news(query: str, limit: int = 50) -> list[NewsArticle]:
         daum_articles = fetch_news_from_daum(query, limit - len(all_articles))
         added = 0
         for article in daum_articles:
-            title_normalized = article['title'].lower().strip()
-            if title_normalized not in seen_titles:
-                seen_titles.add(title_normalized)
+            if dedup_index.add_article(article):
                 all_articles.append(article)
                 added += 1
         print(f"      → {added}개 추가")
@@ -304,44 +657,82 @@ def fetch_news(query: str, limit: int = 50) -> list[NewsArticle]:
     # 3. 다양한 언론사 RSS에서 수집
     if len(all_articles) < limit:
         print(f"    - RSS 피드 검색 중 (30개 언론사)...")
-        rss_articles = fetch_from_multiple_rss(query, limit - len(all_articles))
+        rss_articles = fetch_from_multiple_rss(query, limit - len(all_articles), snapshot=rss_snapshot)
         added = 0
         for article in rss_articles:
-            title_normalized = article['title'].lower().strip()
-            if title_normalized not in seen_titles:
-                seen_titles.add(title_normalized)
+            if dedup_index.add_article(article):
                 all_articles.append(article)
                 added += 1
         print(f"      → {added}개 추가")
 
+    get_source_health().save()
+
     return all_articles[:limit]
 
 
-def fetch_news_by_keywords(keywords: list[str], limit_per_keyword: int = 50) -> list[NewsArticle]:
+def iter_news_by_keywords(
+    keywords: list[str],
+    limit_per_keyword: int = 50,
+    stop: threading.Event | None = None
+) -> Iterator[tuple[str, list[NewsArticle]]]:
     """
-    여러 키워드로 뉴스를 수집합니다.
+    키워드를 하나씩 수집하면서 새로 찾은 기사를 바로 넘겨줍니다.
+
+    앞 키워드에서 이미 찾은 기사(같은 링크 또는 유사 기사)는 다시 넘기지 않고,
+    같은 링크면 먼저 넘긴 기사의 keywords에 찾은 키워드만 추가합니다.
+    다음 키워드를 수집하는 동안 호출 측이 앞 키워드의 기사를 처리할 수 있습니다.
 
     Args:
         keywords: 검색 키워드 리스트
         limit_per_keyword: 키워드당 가져올 기사 수
+        stop: 설정되면 다음 키워드를 수집하지 않고 멈춤 (None이면 끝까지 수집)
 
-    Returns:
-        중복 제거된 뉴스 기사 리스트
+    Yields:
+        (키워드, 이 키워드로 새로 찾은 기사 리스트)
     """
-    all_articles: list[NewsArticle] = []
-    seen_links: set[str] = set()
+    by_link: dict[str, NewsArticle] = {}
+    # 키워드가 달라도 같은 기사를 다른 매체가 다시 보낸 경우를 걸러냄
+    dedup_index = NearDuplicateIndex()
+
+    # RSS 피드는 실행당 한 번만 받아 모든 키워드에 함께 매칭
+    rss_snapshot = RssSnapshot(keywords, target=limit_per_keyword)
 
     for keyword in keywords:
+        if stop is not None and stop.is_set():
+            return
         print(f"[수집] '{keyword}' 키워드로 뉴스 수집 중...")
-        articles = fetch_news(keyword, limit_per_keyword)
+        articles = fetch_news(keyword, limit_per_keyword, rss_snapshot=rss_snapshot)
 
+        added: list[NewsArticle] = []
         for article in articles:
-            if article['link'] not in seen_links:
-                seen_links.add(article['link'])
-                all_articles.append(article)
+            existing = by_link.get(article['link'])
+            if existing is not None:
+                # 다른 키워드로 이미 찾은 기사 - 찾은 키워드만 추가
+                if keyword not in existing['keywords']:
+                    existing['keywords'].append(keyword)
+            elif dedup_index.add_article(article):
+                article['keywords'] = [keyword]
+                by_link[article['link']] = article
+                added.append(article)
+
+        print(f"  → {len(articles)}개 기사 수집됨 (중복 제외 후 총 {len(by_link)}개)")
+        yield keyword, added
 
-        print(f"  → {len(articles)}개 기사 수집됨 (중복 제외 후 총 {len(all_articles)}개)")
 
+def fetch_news_by_keywords(keywords: list[str], limit_per_keyword: int = 50) -> list[NewsArticle]:
+    """
+    여러 키워드로 뉴스를 수집합니다.
+
+    Args:
+        keywords: 검색 키워드 리스트
+        limit_per_keyword: 키워드당 가져올 기사 수
+
+    Returns:
+        중복(같은 링크 또는 유사 기사) 제거된 뉴스 기사 리스트 (기사마다 찾은 키워드를 keywords에 기록)
+    """
+    all_articles: list[NewsArticle] = []
+    for _, added in iter_news_by_keywords(keywords, limit_per_keyword):
+        all_articles.extend(added)
     return all_articles
 
 
@@ -0,0 +1,195 @@
+"""
+소스 상태 관리 모듈
+RSS 피드와 포털별 응답 시간/실패를 추적해 적응형 타임아웃을 정하고,
+연속으로 실패하는 소스는 일정 시간 건너뛰며(서킷 브레이커),
+429/5xx 응답은 Retry-After를 지키며 지터가 있는 백오프로 재시도합니다.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, TypeVar
+
+import requests
+
+from .config import Config
+
+
+T = TypeVar('T')
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """연속 실패로 소스가 일시 차단된 상태"""
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(percent / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def _retry_after_seconds(response: requests.Response | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다."""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class SourceHealth:
+    """
+    소스별 상태 기록 (JSON 파일에 저장되어 실행 간에 유지)
+
+    Args:
+        path: 상태 파일 경로 (None이면 캐시 디렉토리의 source_health.json)
+    """
+
+    # 소스당 보관할 최근 응답 시간 수
+    MAX_SAMPLES = 50
+    # 적응형 타임아웃을 쓰기 위한 최소 샘플 수
+    MIN_SAMPLES = 5
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or Config.get_cache_path('source_health.json')
+        self._lock = threading.Lock()
+        self._sources: dict[str, dict] = self._read()
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _state(self, source: str) -> dict:
+        return self._sources.setdefault(source, {'latencies': [], 'failures': 0, 'opened_until': 0.0})
+
+    def is_open(self, source: str) -> bool:
+        """소스가 차단(서킷 열림) 상태인지 확인합니다."""
+        with self._lock:
+            state = self._sources.get(source)
+            return bool(state) and state['opened_until'] > time.time()
+
+    def timeout_for(self, source: str, default: float) -> float:
+        """
+        관측된 응답 시간으로 타임아웃을 정합니다.
+
+        샘플이 충분하면 p95의 HEALTH_TIMEOUT_FACTOR배를 쓰되,
+        HEALTH_MIN_TIMEOUT 이상 default 이하로 제한합니다.
+        """
+        with self._lock:
+            latencies = list(self._sources.get(source, {}).get('latencies', []))
+        if len(latencies) < self.MIN_SAMPLES:
+            return default
+        adaptive = _percentile(latencies, 95) * Config.HEALTH_TIMEOUT_FACTOR
+        return min(max(adaptive, Config.HEALTH_MIN_TIMEOUT), default)
+
+    def record_success(self, source: str, latency: float) -> None:
+        with self._lock:
+            state = self._state(source)
+            state['latencies'] = (state['latencies'] + [round(latency, 3)])[-self.MAX_SAMPLES:]
+            state['failures'] = 0
+            state['opened_until'] = 0.0
+
+    def record_failure(self, source: str) -> None:
+        with self._lock:
+            state = self._state(source)
+            state['failures'] += 1
+            if state['failures'] >= Config.HEALTH_FAILURE_THRESHOLD:
+                state['opened_until'] = time.time() + Config.HEALTH_COOLDOWN
+                print(f"    [경고] {source}: 연속 {state['failures']}회 실패, {Config.HEALTH_COOLDOWN:.0f}초간 건너뜁니다.")
+
+    def call(
+        self,
+        source: str,
+        request: Callable[[float], T],
+        default_timeout: float,
+        acquire: Callable[[], None] | None = None
+    ) -> T:
+        """
+        소스에 요청을 보냅니다. (차단 확인, 적응형 타임아웃, 재시도 포함)
+
+        Args:
+            source: 소스 이름 (RSS 언론사 이름, 포털 이름 등)
+            request: 타임아웃(초)을 받아 요청하는 함수 (HTTP 오류는 예외로 올려야 함)
+            default_timeout: 관측값이 부족할 때 쓸 타임아웃이자 상한
+            acquire: 시도마다 요청 전에 부를 함수 (속도 제한 대기 등 - 응답 시간에서 제외)
+
+        Returns:
+            request의 반환값
+
+        Raises:
+            CircuitOpenError: 소스가 차단 상태인 경우
+            request가 마지막 시도에서 발생시킨 예외
+        """
+        if self.is_open(source):
+            raise CircuitOpenError(f"{source} 일시 차단 중 (연속 실패)")
+
+        retries = Config.HEALTH_RETRIES
+        for attempt in range(retries + 1):
+            if acquire is not None:
+                acquire()
+            started = time.monotonic()
+            try:
+                result = request(self.timeout_for(source, default_timeout))
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                response = getattr(e, 'response', None)
+                # 429/5xx와 연결 오류만 소스 장애로 봄 (404 등은 개별 기사 문제)
+                if response is not None and response.status_code not in RETRY_STATUS:
+                    raise
+                # 타임아웃은 재시도하면 지연만 늘어나므로 바로 실패 처리
+                if attempt == retries or isinstance(e, requests.Timeout):
+                    self.record_failure(source)
+                    raise
+
+                delay = _retry_after_seconds(response)
+                if delay is None:
+                    delay = Config.HEALTH_BACKOFF_BASE * (2 ** attempt) * random.uniform(0.5, 1.5)
+                time.sleep(min(delay, Config.HEALTH_MAX_RETRY_DELAY))
+                continue
+
+            self.record_success(source, time.monotonic() - started)
+            return result
+
+        raise AssertionError('unreachable')
+
+    def save(self) -> None:
+        """상태를 파일에 기록합니다."""
+        with self._lock:
+            data = json.dumps(self._sources, ensure_ascii=False)
+        tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"    [경고] 소스 상태 저장 실패: {e}")
+
+
+_health: SourceHealth | None = None
+_health_lock = threading.Lock()
+
+
+def get_source_health() -> SourceHealth:
+    """공유 소스 상태 객체를 반환합니다."""
+    global _health
+    with _health_lock:
+        if _health is None:
+            _health = SourceHealth()
+        return _health
@@ -0,0 +1,233 @@
+"""
+HTTP 클라이언트 모듈
+프로세스 전체에서 공유하는 keep-alive 커넥션 풀 기반 세션을 제공합니다.
+"""
+
+import re
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .config import Config
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+# 호스트별 통계: 풀에서 밀려나 닫힌 호스트 풀의 요청 수, 실제로 맺은 TCP 연결 수
+_closed_pool_requests: dict[str, int] = {}
+_connects: dict[str, int] = {}
+_stats_lock = threading.Lock()
+
+
+def _count_connect(host: str) -> None:
+    with _stats_lock:
+        _connects[host] = _connects.get(host, 0) + 1
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    """소켓을 실제로 열 때마다 호스트별 연결 수를 세는 연결"""
+
+    def connect(self) -> None:
+        super().connect()
+        _count_connect(self.host)
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    """소켓을 실제로 열 때마다 호스트별 연결 수를 세는 연결 (TLS)"""
+
+    def connect(self) -> None:
+        super().connect()
+        _count_connect(self.host)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+def _dispose_pool(pool) -> None:
+    """호스트 풀이 제거될 때 요청 수를 보존한 뒤 닫습니다."""
+    with _stats_lock:
+        _closed_pool_requests[pool.host] = _closed_pool_requests.get(pool.host, 0) + pool.num_requests
+    pool.close()
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    for prefix in ('http://', 'https://'):
+        adapter = HTTPAdapter(
+            pool_connections=Config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=Config.HTTP_POOL_MAXSIZE
+        )
+        adapter.poolmanager.pools.dispose_func = _dispose_pool
+        # urllib3의 num_connections는 끊긴 연결을 다시 여는 경우를 세지 않으므로 connect()에서 직접 셈
+        adapter.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
+        }
+        session.mount(prefix, adapter)
+
+    return session
+
+
+def get_session() -> requests.Session:
+    """공유 세션을 반환합니다. (최초 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def get(url: str, timeout: float | None = None, **kwargs) -> requests.Response:
+    """
+    공유 세션으로 GET 요청을 보냅니다.
+
+    Args:
+        url: 요청 URL
+        timeout: 타임아웃 (초, None이면 Config.HTTP_TIMEOUT)
+        **kwargs: requests.Session.get에 그대로 전달할 인자 (headers 등)
+    """
+    return get_session().get(url, timeout=timeout or Config.HTTP_TIMEOUT, **kwargs)
+
+
+def connection_stats() -> dict[str, dict[str, int]]:
+    """
+    호스트별 연결 통계를 반환합니다.
+
+    Returns:
+        {호스트: {'requests': 요청 수, 'new': 실제로 맺은 연결 수, 'reused': 재사용 수}}
+    """
+    with _stats_lock:
+        requests_by_host = dict(_closed_pool_requests)
+        connects = dict(_connects)
+
+    if _session is not None:
+        for adapter in set(_session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_by_host[pool.host] = requests_by_host.get(pool.host, 0) + pool.num_requests
+
+    return {
+        host: {
+            'requests': requests_by_host.get(host, 0),
+            'new': connects.get(host, 0),
+            'reused': max(requests_by_host.get(host, 0) - connects.get(host, 0), 0)
+        }
+        for host in requests_by_host.keys() | connects.keys()
+    }
+
+
+def print_connection_stats() -> None:
+    """연결 재사용 통계를 출력합니다."""
+    stats = connection_stats()
+    if not stats:
+        return
+
+    total_requests = sum(s['requests'] for s in stats.values())
+    total_new = sum(s['new'] for s in stats.values())
+    print(f"[HTTP] 요청 {total_requests}회, 새 연결 {total_new}개, 재사용 {max(total_requests - total_new, 0)}회")
+    for host, s in sorted(stats.items(), key=lambda x: x[1]['requests'], reverse=True)[:5]:
+        print(f"  {host}: 요청 {s['requests']}회 (새 연결 {s['new']}, 재사용 {s['reused']})")
+
+
+_HEAD_END = re.compile(rb'</head\s*>', re.IGNORECASE)
+
+
+def get_head(
+    url: str,
+    timeout: float | None = None,
+    max_bytes: int | None = None,
+    encoding: str = 'utf-8',
+    chunk_size: int = 8192
+) -> str:
+    """
+    HTML 문서의 <head> 부분만 스트리밍으로 읽어 반환합니다.
+
+    Range 헤더로 앞부분(max_bytes)만 요청하고, 본문을 조금씩 읽다가 </head>가 보이거나
+    max_bytes에 도달하면 멈춥니다. 남은 응답은 마저 받아 연결을 풀로 돌려보내되,
+    Range를 무시하고 전체 문서를 보내는 서버면 남은 양이 HTTP_HEAD_DRAIN_BYTES 이하일 때만 받고
+    그보다 크면 연결을 닫습니다.
+
+    Args:
+        url: 요청 URL
+        timeout: 타임아웃 (초, None이면 Config.HTTP_TIMEOUT)
+        max_bytes: 최대로 읽을 바이트 수 (None이면 Config.HTTP_HEAD_MAX_BYTES)
+        encoding: 디코딩에 사용할 인코딩
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        지금까지 읽은 HTML 문자열 (</head>까지)
+
+    Raises:
+        requests.HTTPError: 응답 상태 코드가 4xx/5xx인 경우
+    """
+    max_bytes = max_bytes or Config.HTTP_HEAD_MAX_BYTES
+    buffer = bytearray()
+    headers = {'Range': f'bytes=0-{max_bytes - 1}'}
+
+    with get_session().get(url, timeout=timeout or Config.HTTP_TIMEOUT, stream=True, headers=headers) as response:
+        # 빈 문서는 범위를 만족할 수 없다는 416으로 응답함
+        if response.status_code == 416:
+            return ''
+        response.raise_for_status()
+
+        chunks = response.iter_content(chunk_size)
+        for chunk in chunks:
+            # 청크 경계에 걸친 태그도 찾도록 직전 몇 바이트를 겹쳐 검색
+            search_from = max(len(buffer) - 8, 0)
+            buffer += chunk
+
+            match = _HEAD_END.search(buffer, search_from)
+            if match:
+                del buffer[match.end():]
+                break
+            if len(buffer) >= max_bytes:
+                del buffer[max_bytes:]
+                break
+
+        _drain(response, chunks)
+
+    return buffer.decode(encoding, errors='replace')
+
+
+def _drain(response: requests.Response, chunks) -> None:
+    """
+    남은 응답이 작으면 끝까지 읽어 연결이 풀로 돌아가게 합니다.
+
+    다 읽지 않은 응답은 닫힐 때 소켓도 함께 닫히므로, 새 요청마다 TCP/TLS 연결을 다시 맺게 됩니다.
+    부분 응답(206)은 요청한 범위(max_bytes) 안이므로 항상 끝까지 읽습니다.
+    """
+    if response.status_code == 206:
+        for _ in chunks:
+            pass
+        return
+
+    length = response.headers.get('Content-Length')
+    if length is not None and length.isdigit():
+        # 전송 바이트 기준 (압축된 응답이면 압축된 크기)
+        if int(length) - response.raw.tell() > Config.HTTP_HEAD_DRAIN_BYTES:
+            return
+
+    drained = 0
+    for chunk in chunks:
+        drained += len(chunk)
+        if drained > Config.HTTP_HEAD_DRAIN_BYTES:
+            return
@@ -5,39 +5,22 @@
 
 import smtplib
 from email.mime.text import MIMEText
+from email.message import Message
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, TypedDict
+
+from .config import Config
+from .query import KeywordMatcher
+from .renderer import FragmentCache, Markup, Template, minify
 
 if TYPE_CHECKING:
     from .fetcher import NewsArticle
+    from .seen_index import SeenIndex
 
 
-def create_html_digest(articles: list['NewsArticle'], keywords: list[str]) -> str:
-    """
-    뉴스 기사들을 HTML 테이블 형식으로 변환합니다.
-
-    Args:
-        articles: 뉴스 기사 리스트
-        keywords: 검색에 사용된 키워드 리스트
-
-    Returns:
-        HTML 형식의 뉴스 다이제스트
-    """
-    today = datetime.now().strftime('%Y년 %m월 %d일')
-    keywords_str = ', '.join(keywords)
-
-    # 언론사별 기사 수 집계
-    source_counts = {}
-    for article in articles:
-        source = article['source']
-        source_counts[source] = source_counts.get(source, 0) + 1
-
-    # 상위 5개 언론사
-    top_sources = sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-    sources_summary = ', '.join([f"{name}({count})" for name, count in top_sources])
-
-    html = f"""
+# 다이제스트 템플릿 (모듈을 불러올 때 공백을 줄여 한 번만 컴파일)
+_DIGEST_HEAD = Template(minify("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -147,20 +130,28 @@ def create_html_digest(articles: list['NewsArticle'], keywords: list[str]) -> st
                 color: #666;
                 margin-top: 10px;
             }}
+            .more {{
+                margin-top: 20px;
+                font-size: 13px;
+            }}
+            .more a {{
+                color: #1a73e8;
+                text-decoration: none;
+            }}
         </style>
     </head>
     <body>
         <div class="container">
-            <h1>📰 오늘의 뉴스 다이제스트</h1>
+            <h1>📰 오늘의 뉴스 다이제스트{part}</h1>
 
             <div class="meta">
                 <div class="meta-item"><strong>📅 날짜:</strong> {today}</div>
-                <div class="meta-item"><strong>🔑 키워드:</strong> {keywords_str}</div>
+                <div class="meta-item"><strong>🔑 키워드:</strong> {keywords}</div>
                 <div class="meta-item">
-                    <span class="stats">총 {len(articles)}개 기사</span>
-                    <span class="stats">{len(source_counts)}개 언론사</span>
+                    <span class="stats">총 {article_count}개 기사</span>
+                    <span class="stats">{source_count}개 언론사</span>
                 </div>
-                <div class="source-list"><strong>주요 출처:</strong> {sources_summary}</div>
+                <div class="source-list"><strong>주요 출처:</strong> {top_sources}</div>
             </div>
 
             <table>
@@ -173,23 +164,36 @@ def create_html_digest(articles: list['NewsArticle'], keywords: list[str]) -> st
                     </tr>
                 </thead>
                 <tbody>
-    """
+"""))
 
-    for i, article in enumerate(articles, 1):
-        title = article['title'][:80] + '...' if len(article['title']) > 80 else article['title']
-
-        html += f"""
+_ARTICLE_ROW_START = Template(minify("""
                 <tr>
-                    <td class="num">{i}</td>
-                    <td><a href="{article['link']}" class="title-link" target="_blank">{title}</a></td>
-                    <td><span class="source">{article['source']}</span></td>
-                    <td class="time">{article['published']}</td>
+                    <td class="num">{number}</td>"""))
+
+# 번호를 뺀 행의 나머지 - 기사 내용이 같으면 다이제스트가 달라도 같으므로 캐시
+_ARTICLE_ROW = Template(minify("""
+                    <td><a href="{link}" class="title-link" target="_blank">{title}</a></td>
+                    <td><span class="source">{source}</span></td>
+                    <td class="time">{published}</td>
                 </tr>
-        """
+        """))
+
+# 크기 제한으로 줄인(collapse) 하위 기사 목록
+_COLLAPSED_START = Template(minify("""
+        <div class="more">
+            <strong>그 밖의 기사</strong>
+            <ul>"""))
 
-    html += """
+_COLLAPSED_ITEM = Template(minify("""
+                <li><a href="{link}" target="_blank">{title}</a> · <span class="time">{source}</span></li>"""))
+
+_COLLAPSED_END = Template(minify("""
+            </ul>{omitted}
+        </div>"""))
+
+_DIGEST_FOOT = Template(minify("""
             </tbody>
-        </table>
+        </table>{collapsed}
 
         <div class="footer">
             이 이메일은 자동으로 생성되었습니다.<br>
@@ -198,9 +202,310 @@ def create_html_digest(articles: list['NewsArticle'], keywords: list[str]) -> st
         </div>
     </body>
     </html>
+"""))
+
+# 한 실행 안의 여러 다이제스트가 공유하는 기사 행 캐시 (HTML, UTF-8 바이트 수)
+_row_cache = FragmentCache()
+
+# 머리말의 부분 표시(예: " (12/12)")가 들어갈 자리로 남겨 두는 바이트 수
+_LABEL_RESERVE = 16
+
+
+class DigestPart(TypedDict):
+    """크기 제한에 맞춘 다이제스트 한 통"""
+    html: str
+    text: str
+    label: str                       # 제목과 머리말 뒤에 붙는 부분 표시 (한 통이면 빈 문자열)
+    articles: list['NewsArticle']    # 이 통에 실린 기사 (제목 목록으로 줄인 기사 포함)
+
+
+def _article_row(article: 'NewsArticle') -> tuple[str, int]:
+    """기사 행 HTML과 그 UTF-8 바이트 수 (번호 칸 제외, 기사 내용을 키로 캐시)"""
+    title, link, source, published = article['title'], article['link'], article['source'], article['published']
+
+    def render() -> tuple[str, int]:
+        row = _ARTICLE_ROW.render(
+            link=link,
+            title=title[:80] + '...' if len(title) > 80 else title,
+            source=source,
+            published=published
+        )
+        return row, len(row.encode('utf-8'))
+
+    return _row_cache.get_or_render((title, link, source, published), render)
+
+
+def _text_row(number: int, article: 'NewsArticle') -> str:
+    """텍스트 본문의 기사 줄 (번호와 제목, 다음 줄에 링크)"""
+    title = article['title']
+    title = title[:80] + '...' if len(title) > 80 else title
+    return f"{number}. {title}\n   {article['link']}"
+
+
+def _row_size(number: int, article: 'NewsArticle') -> int:
+    """번호 칸을 포함한 기사 행의 UTF-8 바이트 수 (번호 칸은 ASCII)"""
+    return len(_ARTICLE_ROW_START.render(number=number)) + _article_row(article)[1]
+
+
+def prerender_articles(articles: list['NewsArticle']) -> None:
+    """기사 행을 미리 렌더링해 조각 캐시에 넣습니다. (파이프라인에서 요약이 끝난 기사부터)"""
+    for article in articles:
+        _article_row(article)
+
+
+def _collapsed_item(article: 'NewsArticle') -> str:
+    title = article['title']
+    return _COLLAPSED_ITEM.render(
+        link=article['link'],
+        title=title[:80] + '...' if len(title) > 80 else title,
+        source=article['source']
+    )
+
+
+def _omitted_notice(omitted: int) -> Markup:
+    return Markup(f'<p class="time">외 {omitted}개 기사는 크기 제한으로 생략했습니다.</p>' if omitted else '')
+
+
+def _head_values(articles: list['NewsArticle'], keywords: list[str]) -> dict:
+    """머리말 템플릿 값 (날짜, 키워드, 기사 수, 언론사 통계)"""
+    # 언론사별 기사 수 집계
+    source_counts = {}
+    for article in articles:
+        source = article['source']
+        source_counts[source] = source_counts.get(source, 0) + 1
+
+    # 상위 5개 언론사
+    top_sources = sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+
+    return {
+        'today': datetime.now().strftime('%Y년 %m월 %d일'),
+        'keywords': ', '.join(keywords),
+        'article_count': len(articles),
+        'source_count': len(source_counts),
+        'top_sources': ', '.join([f"{name}({count})" for name, count in top_sources]),
+    }
+
+
+def _iter_body(
+    articles: list['NewsArticle'],
+    first_number: int = 1,
+    collapsed: list['NewsArticle'] | None = None,
+    omitted: int = 0
+) -> Iterator[str]:
+    """기사 행들과 (줄인 기사 목록이 들어간) 꼬리말을 차례로 만들어 냅니다."""
+    for i, article in enumerate(articles, first_number):
+        yield _ARTICLE_ROW_START.render(number=i) + _article_row(article)[0]
+
+    more = ''
+    if collapsed or omitted:
+        more = Markup(''.join([
+            _COLLAPSED_START.render(),
+            *(_collapsed_item(article) for article in collapsed or []),
+            _COLLAPSED_END.render(omitted=_omitted_notice(omitted)),
+        ]))
+    yield _DIGEST_FOOT.render(collapsed=more)
+
+
+def iter_html_digest(articles: list['NewsArticle'], keywords: list[str]) -> Iterator[str]:
+    """
+    뉴스 다이제스트 HTML을 조각 단위로 차례로 만들어 냅니다.
+
+    문자열을 이어 붙이지 않으므로 기사 수에 비례하는 시간만 들고,
+    파일이나 소켓에 바로 흘려 쓸 수도 있습니다. 제목, 링크, 언론사 등
+    모든 값은 HTML 이스케이프됩니다. 크기 제한 없이 모든 기사를 싣습니다.
+
+    Args:
+        articles: 뉴스 기사 리스트
+        keywords: 검색에 사용된 키워드 리스트
+
+    Yields:
+        HTML 조각
+    """
+    yield _DIGEST_HEAD.render(part='', **_head_values(articles, keywords))
+    yield from _iter_body(articles)
+
+
+def create_html_digest(articles: list['NewsArticle'], keywords: list[str]) -> str:
+    """
+    뉴스 기사들을 HTML 테이블 형식으로 변환합니다.
+
+    Args:
+        articles: 뉴스 기사 리스트
+        keywords: 검색에 사용된 키워드 리스트
+
+    Returns:
+        HTML 형식의 뉴스 다이제스트
+    """
+    return ''.join(iter_html_digest(articles, keywords))
+
+
+def create_text_digest(
+    articles: list['NewsArticle'],
+    keywords: list[str],
+    part: str = '',
+    first_number: int = 1,
+    total: int | None = None,
+    omitted: int = 0,
+    max_articles: int | None = None
+) -> str:
     """
+    HTML을 표시하지 않는 메일 프로그램용 텍스트 다이제스트를 만듭니다.
 
-    return html
+    메일 크기를 늘리지 않도록 앞쪽 max_articles개 기사의 제목과 링크만 싣고
+    나머지는 개수만 적습니다.
+
+    Args:
+        articles: 실을 기사 리스트
+        keywords: 검색에 사용된 키워드 리스트
+        part: 제목 뒤에 붙일 부분 표시 (예: " (1/3)")
+        first_number: 첫 기사 번호
+        total: 전체 기사 수 (None이면 articles 수)
+        omitted: articles 밖에 더 있는 기사 수 (제목 목록으로 줄이거나 생략한 기사)
+        max_articles: 제목과 링크를 실을 최대 기사 수 (None이면 Config.DIGEST_TEXT_MAX_ARTICLES)
+
+    Returns:
+        text/plain 본문
+    """
+    lines = [
+        f"📰 오늘의 뉴스 다이제스트{part} - {datetime.now().strftime('%Y년 %m월 %d일')}",
+        f"키워드: {', '.join(keywords)} / 총 {len(articles) if total is None else total}개 기사",
+        '',
+    ]
+    max_articles = Config.DIGEST_TEXT_MAX_ARTICLES if max_articles is None else max_articles
+    shown = articles[:max_articles]
+    lines += [_text_row(i, article) for i, article in enumerate(shown, first_number)]
+    omitted += len(articles) - len(shown)
+    if omitted:
+        lines.append(f"외 {omitted}개 기사 (HTML 메일에서 확인)")
+    lines += ['', '-- ', '이 이메일은 자동으로 생성되었습니다.']
+    return '\n'.join(lines) + '\n'
+
+
+def build_digest_parts(
+    articles: list['NewsArticle'],
+    keywords: list[str],
+    max_bytes: int | None = None,
+    overflow: str | None = None
+) -> list[DigestPart]:
+    """
+    크기 제한에 맞춰 다이제스트를 한 통 이상으로 만듭니다.
+
+    기사 행은 렌더링할 때 UTF-8 바이트 수를 함께 재어 캐시하므로, 전체
+    HTML을 만들기 전에 머리말/꼬리말 크기와 더해 제한을 넘는지 알 수 있습니다.
+    넘으면 overflow에 따라 순서대로 여러 통에 나눠 담거나(split, 번호는 이어짐),
+    앞쪽 기사만 표로 싣고 나머지는 제목 목록으로 줄인 뒤 그래도 남는 기사는
+    개수만 적습니다(collapse). 어느 경우든 표의 앞쪽 기사 제목과 링크만 담은
+    text/plain 본문을 함께 만들고, 그 크기도 제한에 포함합니다.
+
+    Args:
+        articles: 뉴스 기사 리스트 (순위 순)
+        keywords: 검색에 사용된 키워드 리스트
+        max_bytes: 한 통의 최대 본문(HTML + 텍스트) 바이트 수 (None이면 Config.DIGEST_MAX_BYTES, 0이면 제한 없음)
+        overflow: 'split' 또는 'collapse' (None이면 Config.DIGEST_OVERFLOW)
+
+    Returns:
+        다이제스트 리스트 (기사가 없어도 한 통)
+    """
+    max_bytes = Config.DIGEST_MAX_BYTES if max_bytes is None else max_bytes
+    overflow = overflow or Config.DIGEST_OVERFLOW
+    head = _head_values(articles, keywords)
+
+    text_limit = Config.DIGEST_TEXT_MAX_ARTICLES
+
+    def make_part(group, first_number=1, label='', collapsed=None, omitted=0) -> DigestPart:
+        html = _DIGEST_HEAD.render(part=label, **head) + ''.join(_iter_body(group, first_number, collapsed, omitted))
+        text = create_text_digest(
+            group, keywords, label, first_number, len(articles), len(collapsed or []) + omitted, text_limit
+        )
+        return {'html': html, 'text': text, 'label': label, 'articles': group + (collapsed or [])}
+
+    sizes = [_row_size(i, article) for i, article in enumerate(articles, 1)]
+    # 텍스트 본문의 기사 줄 (한 통의 앞쪽 text_limit개만 실림)
+    text_sizes = [len(_text_row(i, article).encode('utf-8')) + 1 for i, article in enumerate(articles, 1)]
+    overhead = (
+        len(_DIGEST_HEAD.render(part='', **head).encode('utf-8')) + _LABEL_RESERVE
+        + len(_DIGEST_FOOT.render(collapsed='').encode('utf-8'))
+        + len(create_text_digest([], keywords, '', total=len(articles), omitted=len(articles)).encode('utf-8'))
+        + _LABEL_RESERVE
+    )
+    budget = max_bytes - overhead
+    if not max_bytes or sum(sizes) + sum(text_sizes[:text_limit]) <= budget:
+        return [make_part(articles)]
+
+    if overflow == 'collapse':
+        # 생략 안내는 자릿수가 가장 긴 경우로 미리 빼 둠
+        budget -= len((_COLLAPSED_START.render() + _COLLAPSED_END.render(
+            omitted=_omitted_notice(len(articles)))).encode('utf-8'))
+        items = [len(_collapsed_item(article).encode('utf-8')) for article in articles]
+        # 나머지를 모두 제목 목록에 담을 수 있는 범위에서 표로 싣는 기사를 최대로
+        rest = sum(items)
+        used = 0
+        full = 0
+        sizes = [size + (text_sizes[i] if i < text_limit else 0) for i, size in enumerate(sizes)]
+        for size, item in zip(sizes, items):
+            rest -= item
+            if used + size + rest > budget:
+                break
+            used += size
+            full += 1
+        if full == 0:
+            # 제목 목록도 다 들어가지 않으면 절반은 표, 나머지는 들어가는 만큼 목록
+            while full < len(articles) and (full == 0 or used + sizes[full] <= budget // 2):
+                used += sizes[full]
+                full += 1
+        collapsed = []
+        for article, item in zip(articles[full:], items[full:]):
+            if used + item > budget:
+                break
+            used += item
+            collapsed.append(article)
+        omitted = len(articles) - full - len(collapsed)
+        print(f"[안내] 다이제스트가 {max_bytes:,}바이트를 넘어 {full}개만 표로 싣고 "
+              f"{len(collapsed)}개는 제목 목록, {omitted}개는 생략합니다.")
+        return [make_part(articles[:full], collapsed=collapsed, omitted=omitted)]
+
+    # split: 한 통에 최소 한 기사, 제한을 넘기 전까지 차례로 담음
+    groups: list[tuple[int, int]] = []
+    start, used = 0, 0
+    for index, size in enumerate(sizes):
+        if index > start and used + size + (text_sizes[index] if index - start < text_limit else 0) > budget:
+            groups.append((start, index))
+            start, used = index, 0
+        used += size + (text_sizes[index] if index - start < text_limit else 0)
+    groups.append((start, len(articles)))
+
+    print(f"[안내] 다이제스트가 {max_bytes:,}바이트를 넘어 {len(groups)}통으로 나눕니다.")
+    return [
+        make_part(articles[begin:end], begin + 1, f" ({number}/{len(groups)})")
+        for number, (begin, end) in enumerate(groups, 1)
+    ]
+
+
+def _mime_bodies(part: DigestPart) -> tuple[MIMEText, MIMEText, str]:
+    """다이제스트 한 통의 (text/plain 파트, text/html 파트, 부분 표시)"""
+    return MIMEText(part['text'], 'plain', 'utf-8'), MIMEText(part['html'], 'html', 'utf-8'), part['label']
+
+
+def _build_message(
+    bodies: tuple[MIMEText, MIMEText, str],
+    keywords: list[str],
+    sender_email: str,
+    recipients: list[str]
+) -> MIMEMultipart:
+    """다이제스트 메일 메시지를 만듭니다. (본문 파트는 _mime_bodies()로 만들어 여러 메시지가 공유 가능)"""
+    text_part, html_part, label = bodies
+    today = datetime.now().strftime('%Y-%m-%d')
+    keywords_str = ', '.join(keywords[:3])
+
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = f"[뉴스 다이제스트] {today} - {keywords_str}{label}"
+    msg['From'] = sender_email
+    msg['To'] = ', '.join(recipients)
+
+    # 메일 프로그램은 마지막 대안(HTML)을 우선 표시하므로 텍스트를 먼저 추가
+    msg.attach(text_part)
+    msg.attach(html_part)
+    return msg
 
 
 def send_digest(
@@ -211,11 +516,15 @@ def send_digest(
     smtp_port: int,
     sender_email: str,
     sender_password: str,
-    dry_run: bool = False
+    dry_run: bool = False,
+    seen_index: 'SeenIndex | None' = None
 ) -> bool:
     """
     뉴스 다이제스트를 이메일로 전송합니다.
 
+    HTML이 DIGEST_MAX_BYTES를 넘으면 DIGEST_OVERFLOW에 따라 여러 통으로 나누거나
+    하위 기사를 제목 목록으로 줄이며, 각 메일에는 text/plain 대안 본문이 함께 들어갑니다.
+
     Args:
         articles: 뉴스 기사 리스트
         recipients: 수신자 이메일 리스트
@@ -225,12 +534,13 @@ def send_digest(
         sender_email: 발신자 이메일
         sender_password: 발신자 앱 비밀번호
         dry_run: True면 실제 전송하지 않고 HTML만 출력
+        seen_index: 실제로 전송된 메일에 실린 기사를 기록할 발송 이력 (None이면 기록하지 않음)
 
     Returns:
-        성공 여부
+        모든 메일을 보냈는지 여부 (발신함에 남은 메일이 있으면 False)
     """
-    # HTML 생성
-    html_content = create_html_digest(articles, keywords)
+    # 크기 제한에 맞춘 HTML/텍스트 본문 생성
+    parts = build_digest_parts(articles, keywords)
 
     if dry_run:
         print("\n" + "=" * 60)
@@ -238,6 +548,9 @@ def send_digest(
         print("=" * 60)
         print(f"수신자: {', '.join(recipients)}")
         print(f"기사 수: {len(articles)}개")
+        for part in parts:
+            print(f"메일{part['label']}: HTML {len(part['html'].encode('utf-8')):,}바이트, "
+                  f"텍스트 {len(part['text'].encode('utf-8')):,}바이트, 기사 {len(part['articles'])}개")
 
         # 언론사별 통계
         source_counts = {}
@@ -251,38 +564,239 @@ def send_digest(
 
         print("\n[HTML 미리보기 - 처음 500자]")
         print("-" * 60)
-        print(html_content[:500])
+        print(parts[0]['html'][:500])
         print("...")
         print("-" * 60)
         return True
 
-    # 이메일 메시지 생성
-    today = datetime.now().strftime('%Y-%m-%d')
-    keywords_str = ', '.join(keywords[:3])
+    # 이메일 메시지 생성 (나눈 경우 한 통씩)
+    messages = [
+        (_build_message(_mime_bodies(part), keywords, sender_email, recipients), recipients, part['articles'])
+        for part in parts
+    ]
 
-    msg = MIMEMultipart('alternative')
-    msg['Subject'] = f"[뉴스 다이제스트] {today} - {keywords_str}"
-    msg['From'] = sender_email
-    msg['To'] = ', '.join(recipients)
+    return _deliver(messages, smtp_server, smtp_port, sender_email, sender_password, seen_index)
 
-    # HTML 본문 추가
-    html_part = MIMEText(html_content, 'html', 'utf-8')
-    msg.attach(html_part)
 
-    try:
-        print(f"\n[이메일] SMTP 서버 연결 중... ({smtp_server}:{smtp_port})")
+class SmtpSession:
+    """
+    인증된 SMTP 연결 하나로 여러 메시지를 보내는 세션
 
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            print("[이메일] 로그인 중...")
-            server.login(sender_email, sender_password)
+    처음 보낼 때 연결하고 로그인하며, 한 연결로 max_messages개를 보내면
+    (서버의 연결당 메시지 수 제한) 연결을 닫고 다시 로그인합니다.
+    보내는 중에 서버가 연결을 끊으면 한 번 다시 연결해 같은 메시지를 보냅니다.
 
-            print(f"[이메일] 전송 중... (수신자: {len(recipients)}명)")
-            server.sendmail(sender_email, recipients, msg.as_string())
+    Args:
+        smtp_server: SMTP 서버 주소
+        smtp_port: SMTP 포트
+        sender_email: 발신자 이메일
+        sender_password: 발신자 앱 비밀번호
+        max_messages: 연결당 최대 메시지 수 (None이면 Config.SMTP_MAX_MESSAGES_PER_SESSION)
+    """
 
-        print("[이메일] ✓ 전송 완료!")
+    def __init__(
+        self,
+        smtp_server: str,
+        smtp_port: int,
+        sender_email: str,
+        sender_password: str,
+        max_messages: int | None = None
+    ):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.max_messages = max_messages or Config.SMTP_MAX_MESSAGES_PER_SESSION
+        self.connections = 0
+        self._server: smtplib.SMTP | None = None
+        self._sent = 0
+
+    def _connect(self) -> None:
+        print(f"[이메일] SMTP 서버 연결 중... ({self.smtp_server}:{self.smtp_port})")
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            if Config.SMTP_STARTTLS:
+                server.starttls()
+            # 서버 기능(AUTH 지원 여부)은 EHLO 응답으로만 알 수 있음 (STARTTLS 뒤에는 다시)
+            server.ehlo()
+            # 인증을 받지 않는 로컬 릴레이/테스트 서버는 로그인 생략
+            if server.has_extn('auth'):
+                server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+        self._sent = 0
+        self.connections += 1
+
+    def close(self) -> None:
+        """연결을 닫습니다. (이미 끊긴 연결이면 무시)"""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+    def send(self, msg: Message | bytes, recipients: list[str], sender: str | None = None) -> None:
+        """
+        메시지를 보냅니다.
+
+        Args:
+            msg: 메시지 (발신함에 저장된 바이트도 가능)
+            recipients: 봉투 수신자 리스트
+            sender: 봉투 발신자 (None이면 sender_email)
+
+        Raises:
+            smtplib.SMTPException: 인증 실패, 수신자 거부 등 재연결로 해결되지 않는 오류
+        """
+        if self._server is not None and self._sent >= self.max_messages:
+            self.close()
+        if self._server is None:
+            self._connect()
+
+        data = msg if isinstance(msg, bytes) else msg.as_string()
+        sender = sender or self.sender_email
+        try:
+            self._server.sendmail(sender, recipients, data)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            self._connect()
+            self._server.sendmail(sender, recipients, data)
+        self._sent += 1
+
+    def __enter__(self) -> 'SmtpSession':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def select_articles(articles: list['NewsArticle'], keywords: list[str]) -> list['NewsArticle']:
+    """
+    키워드에 해당하는 기사만 고릅니다.
+
+    수집할 때 기록한 키워드(article['keywords'])가 겹치거나, 제목/설명이
+    키워드 검색식에 맞는 기사를 고릅니다. (다른 키워드의 유사 기사로 걸러진 경우 대비)
+    """
+    wanted = set(keywords)
+    matcher = KeywordMatcher(keywords)
+    return [
+        article for article in articles
+        if wanted.intersection(article.get('keywords', ()))
+        or matcher.match(article['title'], article.get('description', ''))
+    ]
+
+
+def send_personalized_digests(
+    articles: list['NewsArticle'],
+    recipient_keywords: dict[str, list[str]],
+    smtp_server: str,
+    smtp_port: int,
+    sender_email: str,
+    sender_password: str,
+    dry_run: bool = False,
+    seen_index: 'SeenIndex | None' = None
+) -> bool:
+    """
+    수신자마다 자기 키워드의 기사만 담은 다이제스트를 보냅니다.
+
+    모든 수신자가 같은 기사 풀을 나눠 쓰며, 키워드 구성이 같은 수신자끼리는
+    본문을 한 번만 만들고 기사 행은 조각 캐시로 공유합니다. 크기 제한을 넘는
+    다이제스트는 send_digest와 같이 나누거나 줄입니다. 메시지는 발신함을
+    거쳐 여러 SMTP 연결로 보내거나(OUTBOX), SMTP 연결 하나로 보내며 연결당
+    메시지 수 제한에 닿으면 다시 연결합니다. (SmtpSession)
+
+    Args:
+        articles: 뉴스 기사 리스트 (모든 수신자의 키워드로 수집한 기사)
+        recipient_keywords: {수신자 이메일: 키워드 리스트}
+        smtp_server: SMTP 서버 주소
+        smtp_port: SMTP 포트
+        sender_email: 발신자 이메일
+        sender_password: 발신자 앱 비밀번호
+        dry_run: True면 실제 전송하지 않고 수신자별 기사 수만 출력
+        seen_index: 실제로 전송된 메일에 실린 기사를 기록할 발송 이력 (None이면 기록하지 않음,
+            어느 수신자에게도 실리지 않은 기사는 기록되지 않음)
+
+    Returns:
+        모든 수신자에게 보냈는지 여부 (보낼 기사가 없는 수신자는 성공으로 봄)
+    """
+    # 키워드 구성이 같은 수신자는 같은 메일을 받음
+    groups: dict[tuple[str, ...], list[str]] = {}
+    for email, keywords in recipient_keywords.items():
+        groups.setdefault(tuple(keywords), []).append(email)
+
+    digests = []
+    for keywords, emails in groups.items():
+        selected = select_articles(articles, list(keywords))
+        if not selected:
+            print(f"[건너뜀] {', '.join(emails)}: 키워드({', '.join(keywords)})에 해당하는 기사 없음")
+            continue
+        bodies = [(_mime_bodies(part), part['articles']) for part in build_digest_parts(selected, list(keywords))]
+        digests.append((list(keywords), emails, len(selected), bodies))
+
+    if dry_run:
+        print("\n" + "=" * 60)
+        print("[DRY RUN] 수신자별 이메일 전송을 건너뜁니다.")
+        print("=" * 60)
+        for keywords, emails, count, bodies in digests:
+            print(f"  {', '.join(emails)}: {count}개 기사, {len(bodies)}통 (키워드: {', '.join(keywords)})")
         return True
 
+    messages = [
+        (_build_message(body, keywords, sender_email, [email]), [email], part_articles)
+        for keywords, emails, _, bodies in digests
+        for email in emails
+        for body, part_articles in bodies
+    ]
+    print(f"[이메일] 수신자별 메일 {len(messages)}통 전송")
+    return _deliver(messages, smtp_server, smtp_port, sender_email, sender_password, seen_index)
+
+
+def _deliver(
+    messages: list[tuple[MIMEMultipart, list[str], list['NewsArticle']]],
+    smtp_server: str,
+    smtp_port: int,
+    sender_email: str,
+    sender_password: str,
+    seen_index: 'SeenIndex | None' = None
+) -> bool:
+    """
+    메시지들을 보냅니다.
+
+    OUTBOX가 켜져 있으면 먼저 발신함에 저장한 뒤 여러 작업자로 보내고
+    (Outbox.drain), 이번에 다 보내지 못한 메일은 발신함에 남겨 다음 실행에서
+    이어서 보냅니다. 꺼져 있으면 SMTP 연결 하나로 바로 보냅니다.
+    seen_index가 있으면 실제로 전송된 메시지에 실린 기사만 발송 이력에 기록합니다.
+
+    Args:
+        messages: (메시지, 수신자 리스트, 메시지에 실린 기사) 리스트
+
+    Returns:
+        모든 메일을 보냈는지 여부 (실패했거나 발신함에 남은 메일이 있으면 False)
+    """
+    if Config.OUTBOX:
+        return _deliver_via_outbox(messages, smtp_server, smtp_port, sender_email, sender_password, seen_index)
+
+    total = sum(len(recipients) for _, recipients, _ in messages)
+    failed = 0
+    try:
+        with SmtpSession(smtp_server, smtp_port, sender_email, sender_password) as session:
+            print(f"[이메일] 전송 중... (수신자: {total}명)")
+            for msg, recipients, articles in messages:
+                try:
+                    session.send(msg, recipients)
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError) as e:
+                    failed += len(recipients)
+                    print(f"  [경고] {', '.join(recipients)} 전송 실패: {e}")
+                    continue
+                if seen_index is not None:
+                    seen_index.mark_sent(articles)
+
+        print(f"[이메일] ✓ 전송 완료! ({total - failed}/{total}명, SMTP 연결 {session.connections}회)")
+        return failed == 0
+
     except smtplib.SMTPAuthenticationError:
         print("[오류] 이메일 인증 실패. 이메일 주소와 앱 비밀번호를 확인하세요.")
         return False
@@ -294,6 +808,60 @@ def send_digest(
         return False
 
 
+def _deliver_via_outbox(
+    messages: list[tuple[MIMEMultipart, list[str], list['NewsArticle']]],
+    smtp_server: str,
+    smtp_port: int,
+    sender_email: str,
+    sender_password: str,
+    seen_index: 'SeenIndex | None' = None
+) -> bool:
+    """
+    메시지를 발신함에 저장하고 발신함 전체를 보냅니다. (_deliver 참고)
+
+    기사 기록은 발신함이 전송 완료 시점에 하므로, 이번에 못 보내고 다음 실행에서
+    보낸 메일의 기사도 그때 기록됩니다.
+    """
+    from .outbox import FAILED, PENDING, Outbox
+    from .seen_index import article_keys
+
+    try:
+        outbox = Outbox(seen_index=seen_index)
+        message_ids = [
+            outbox.enqueue(
+                msg, sender_email, recipients,
+                seen_keys=[key for article in articles for key in article_keys(article)] if seen_index is not None else None
+            )
+            for msg, recipients, articles in messages
+        ]
+    except Exception as e:
+        print(f"[오류] 발신함 저장 실패: {e}")
+        return False
+
+    print(f"[이메일] 발신함에서 전송 중... (작업자 {Config.OUTBOX_WORKERS}개)")
+    try:
+        counts = outbox.drain(smtp_server, smtp_port, sender_email, sender_password)
+        print(f"[이메일] 완료 {counts['sent']}건, 재시도 예약 {counts['retry']}건, 실패 {counts['failed']}건")
+    except smtplib.SMTPAuthenticationError:
+        print("[오류] 이메일 인증 실패. 이메일 주소와 앱 비밀번호를 확인하세요.")
+    except Exception as e:
+        print(f"[오류] 발신함 전송 중 오류: {e}")
+
+    statuses = outbox.statuses(message_ids)
+    failed = [(recipient, error) for _, recipient, status, _, error in statuses if status == FAILED]
+    pending = [recipient for _, recipient, status, _, _ in statuses if status == PENDING]
+    for recipient, error in failed:
+        print(f"  [경고] {recipient}: 전송 실패 ({error})")
+    if pending:
+        print(f"[안내] {len(pending)}명에게 보낼 메일은 발신함에 남아 다음 실행 때 다시 보냅니다.")
+    outbox.purge()
+
+    if not failed and not pending:
+        print("[이메일] ✓ 전송 완료!")
+    # 인증 실패나 서버 장애로 발신함에 남은 메일은 아직 보내지 않은 것
+    return not failed and not pending
+
+
 if __name__ == "__main__":
     # 테스트 데이터
     test_articles = [
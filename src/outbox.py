@@ -0,0 +1,314 @@
+"""
+메일 발신함(outbox) 모듈
+만든 메일을 먼저 디스크(SQLite)에 쌓아 두고, 여러 발송 작업자가 각자의
+SMTP 연결로 꺼내 보냅니다. 일시적인 오류는 간격을 늘려 가며 다시 시도하고,
+다 보내지 못한 메일은 다음 실행에서 이어서 보냅니다.
+"""
+
+import json
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .config import Config
+from .storage import connect
+
+if TYPE_CHECKING:
+    from .seen_index import SeenIndex
+
+
+# 수신자별 전송 상태
+PENDING = 'pending'   # 보낼 차례를 기다림 (재시도 대기 포함)
+SENDING = 'sending'   # 작업자가 보내는 중
+SENT = 'sent'         # 전송 완료
+FAILED = 'failed'     # 영구 오류 또는 재시도 횟수 초과
+
+# 발신함을 열 때 이보다(OUTBOX_DRAIN_TIMEOUT + 초) 오래 '전송 중'인 항목은 중단된 것으로 봄
+_SENDING_GRACE = 300
+
+
+def _is_temporary(error: Exception) -> bool:
+    """다시 시도하면 성공할 수 있는 오류인지 판단합니다. (4xx 응답, 연결 오류)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError))
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """서버에 닿지 못했거나 연결이 끊긴 오류인지 판단합니다. (수신자나 메시지 문제가 아님)"""
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    # SMTPException도 OSError의 하위 클래스이므로 서버 응답 오류는 제외
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class Outbox:
+    """
+    디스크 기반 메일 발신함
+
+    메시지는 한 번만 저장하고, 수신자마다 전송 상태(대기/전송 중/완료/실패),
+    시도 횟수, 다음 시도 시각, 마지막 오류를 따로 기록합니다. 프로세스가 보내는
+    도중 종료되어 '전송 중'으로 남은 항목은 한 번의 발송 시간(OUTBOX_DRAIN_TIMEOUT)보다
+    오래 지난 뒤 발신함을 열 때 대기 상태로 되돌립니다.
+
+    메시지에 실린 기사의 발송 이력 키를 함께 저장하면, 그 메시지가 한 수신자에게라도
+    전송 완료될 때 발송 이력(SeenIndex)에 기록합니다. 다음 실행에서 마저 보낸
+    메일도 그때 기록되므로, 보내지 못한 기사가 다음 다이제스트에서 빠지지 않습니다.
+
+    Args:
+        path: SQLite 파일 경로 (None이면 캐시 디렉토리의 outbox.db)
+        seen_index: 전송 완료한 기사를 기록할 발송 이력 (None이면 필요할 때 새로 엶)
+    """
+
+    def __init__(self, path: Path | None = None, seen_index: 'SeenIndex | None' = None):
+        self.path = path or Config.get_cache_path('outbox.db')
+        self._seen_index = seen_index
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS messages ('
+                ' id INTEGER PRIMARY KEY, sender TEXT, body BLOB, created_at REAL, seen_keys TEXT)'
+            )
+            # 발송 이력 키 열이 없던 이전 발신함
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(messages)')}
+            if 'seen_keys' not in columns:
+                self._conn.execute('ALTER TABLE messages ADD COLUMN seen_keys TEXT')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS deliveries ('
+                ' id INTEGER PRIMARY KEY, message_id INTEGER, recipient TEXT, status TEXT,'
+                ' attempts INTEGER DEFAULT 0, next_attempt_at REAL, last_error TEXT, updated_at REAL)'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_deliveries_due ON deliveries (status, next_attempt_at)'
+            )
+            # 보내는 도중 종료된 항목만 되돌림 (다른 프로세스가 지금 보내는 항목은 그대로)
+            self._conn.execute(
+                'UPDATE deliveries SET status = ? WHERE status = ? AND updated_at < ?',
+                (PENDING, SENDING, time.time() - Config.OUTBOX_DRAIN_TIMEOUT - _SENDING_GRACE)
+            )
+
+    def enqueue(self, msg: Message, sender: str, recipients: list[str], seen_keys: list[str] | None = None) -> int:
+        """
+        메시지를 발신함에 저장합니다. (수신자마다 따로 전송)
+
+        Args:
+            msg: 보낼 메시지
+            sender: 봉투 발신자
+            recipients: 수신자 리스트
+            seen_keys: 전송 완료 시 발송 이력에 기록할 기사 키 (None이면 기록하지 않음)
+
+        Returns:
+            메시지 번호
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            message_id = self._conn.execute(
+                'INSERT INTO messages (sender, body, created_at, seen_keys) VALUES (?, ?, ?, ?)',
+                # sendmail은 바이트 메시지의 줄바꿈을 고치지 않으므로 CRLF로 저장
+                (
+                    sender, msg.as_bytes(policy=msg.policy.clone(linesep='\r\n')), now,
+                    json.dumps(seen_keys) if seen_keys else None
+                )
+            ).lastrowid
+            self._conn.executemany(
+                'INSERT INTO deliveries (message_id, recipient, status, next_attempt_at, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                [(message_id, recipient, PENDING, now, now) for recipient in recipients]
+            )
+        return message_id
+
+    def _claim(self) -> tuple[int, str, str, bytes, int, float] | None:
+        """
+        보낼 차례가 된 항목 하나를 '전송 중'으로 바꾸고 반환합니다.
+
+        같은 발신함을 여러 프로세스(스케줄러와 수동 실행 등)가 함께 비워도 한 항목은
+        한 곳에서만 보내도록, 아직 대기 상태일 때만 바꾸고 바뀐 행이 없으면
+        (다른 프로세스가 먼저 가져감) 다음 항목을 찾습니다.
+        """
+        while True:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    'SELECT d.id, m.sender, d.recipient, m.body, d.attempts, m.created_at'
+                    ' FROM deliveries d JOIN messages m ON m.id = d.message_id'
+                    ' WHERE d.status = ? AND d.next_attempt_at <= ?'
+                    ' ORDER BY d.next_attempt_at LIMIT 1',
+                    (PENDING, time.time())
+                ).fetchone()
+                if row is None:
+                    return None
+                claimed = self._conn.execute(
+                    'UPDATE deliveries SET status = ?, updated_at = ? WHERE id = ? AND status = ?',
+                    (SENDING, time.time(), row[0], PENDING)
+                ).rowcount
+            if claimed:
+                return row
+
+    def _next_due(self) -> float | None:
+        """대기 중인 항목의 가장 이른 다음 시도 시각 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT MIN(next_attempt_at) FROM deliveries WHERE status = ?', (PENDING,)
+            ).fetchone()
+        return row[0]
+
+    def _finish(self, delivery_id: int, status: str, attempts: int, error: str = '', retry_at: float = 0) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE deliveries SET status = ?, attempts = ?, last_error = ?, next_attempt_at = ?, updated_at = ?'
+                ' WHERE id = ?',
+                (status, attempts, error, retry_at, time.time(), delivery_id)
+            )
+
+    def _record_seen(self, delivery_id: int) -> None:
+        """전송 완료한 항목의 메시지에 실린 기사를 발송 이력에 기록합니다. (메시지당 한 번)"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT m.id, m.seen_keys FROM messages m JOIN deliveries d ON d.message_id = m.id WHERE d.id = ?',
+                (delivery_id,)
+            ).fetchone()
+            if row is None or not row[1]:
+                return
+            self._conn.execute('UPDATE messages SET seen_keys = NULL WHERE id = ?', (row[0],))
+            if self._seen_index is None:
+                from .seen_index import SeenIndex
+                self._seen_index = SeenIndex()
+            seen_index = self._seen_index
+        seen_index.mark_keys(json.loads(row[1]))
+
+    def statuses(self, message_ids: list[int] | None = None) -> list[tuple[int, str, str, int, str]]:
+        """
+        수신자별 전송 상태를 반환합니다.
+
+        Args:
+            message_ids: 조회할 메시지 번호 (None이면 전체)
+
+        Returns:
+            (메시지 번호, 수신자, 상태, 시도 횟수, 마지막 오류) 리스트
+        """
+        query = 'SELECT message_id, recipient, status, attempts, last_error FROM deliveries'
+        params: tuple = ()
+        if message_ids is not None:
+            query += f" WHERE message_id IN ({','.join('?' * len(message_ids))})"
+            params = tuple(message_ids)
+        with self._lock:
+            return [(m, r, s, a, e or '') for m, r, s, a, e in self._conn.execute(query + ' ORDER BY id', params)]
+
+    def purge(self, older_than_days: float = 7) -> None:
+        """오래전에 끝난(완료/실패) 항목과 더 보낼 곳이 없는 메시지를 지웁니다."""
+        cutoff = time.time() - older_than_days * 86400
+        with self._lock, self._conn:
+            self._conn.execute(
+                'DELETE FROM deliveries WHERE status IN (?, ?) AND updated_at < ?', (SENT, FAILED, cutoff)
+            )
+            self._conn.execute(
+                'DELETE FROM messages WHERE id NOT IN (SELECT DISTINCT message_id FROM deliveries)'
+            )
+
+    def drain(
+        self,
+        smtp_server: str,
+        smtp_port: int,
+        sender_email: str,
+        sender_password: str,
+        workers: int | None = None,
+        timeout: float | None = None
+    ) -> dict[str, int]:
+        """
+        발신함의 대기 중인 메일을 여러 작업자로 보냅니다.
+
+        작업자마다 SMTP 연결을 하나씩 열어(SmtpSession) 발신함에서 항목을 하나씩
+        꺼내 보냅니다. 일시적인 오류(4xx, 연결 끊김)는 OUTBOX_RETRY_DELAY x 2^(시도-1)초
+        뒤에 다시 시도하고, 영구 오류(5xx)나 OUTBOX_MAX_ATTEMPTS회 실패는 실패로
+        기록합니다. 서버에 연결하지 못한 시도는 횟수에 세지 않으므로 실행 내내
+        서버가 멈춰 있어도 메일은 대기 상태로 남고, 발신함에 들어온 지
+        OUTBOX_MAX_AGE_HOURS가 지난 메일만 실패로 기록합니다. 제한 시간 안에 다시 시도할 수 없는 항목은 대기 상태로 남겨
+        다음 실행에서 보냅니다. 인증 오류가 나면 모든 작업자가 멈춥니다.
+
+        Args:
+            smtp_server: SMTP 서버 주소
+            smtp_port: SMTP 포트
+            sender_email: 발신자 이메일 (로그인용)
+            sender_password: 발신자 앱 비밀번호
+            workers: 동시 발송 작업자 수 (None이면 Config.OUTBOX_WORKERS)
+            timeout: 최대 발송 시간 (초, None이면 Config.OUTBOX_DRAIN_TIMEOUT)
+
+        Returns:
+            이번에 처리한 결과 수 {'sent': 완료, 'retry': 재시도 예약, 'failed': 실패}
+
+        Raises:
+            smtplib.SMTPAuthenticationError: 로그인 실패
+        """
+        from .mailer import SmtpSession
+
+        workers = workers or Config.OUTBOX_WORKERS
+        timeout = Config.OUTBOX_DRAIN_TIMEOUT if timeout is None else timeout
+        ends_at = time.monotonic() + timeout
+        stop = threading.Event()
+        counts = {'sent': 0, 'retry': 0, 'failed': 0}
+        counts_lock = threading.Lock()
+
+        def count(result: str) -> None:
+            with counts_lock:
+                counts[result] += 1
+
+        def work() -> None:
+            with SmtpSession(smtp_server, smtp_port, sender_email, sender_password) as session:
+                while not stop.is_set():
+                    # 제한 시간이 지나면 남은 항목은 대기 상태로 두고 다음 실행에서 보냄
+                    if time.monotonic() >= ends_at:
+                        return
+                    item = self._claim()
+                    if item is None:
+                        # 재시도 대기 중인 항목이 제한 시간 안에 차례가 오면 기다림
+                        next_due = self._next_due()
+                        if next_due is None or next_due - time.time() > ends_at - time.monotonic():
+                            return
+                        stop.wait(min(max(next_due - time.time(), 0.05), 1.0))
+                        continue
+
+                    delivery_id, sender, recipient, body, attempts, created_at = item
+                    if time.time() - created_at > Config.OUTBOX_MAX_AGE_HOURS * 3600:
+                        self._finish(delivery_id, FAILED, attempts, 'expired')
+                        count('failed')
+                        print(f"  [경고] {recipient} 전송 실패: {Config.OUTBOX_MAX_AGE_HOURS:g}시간 동안 보내지 못함")
+                        continue
+                    attempts += 1
+                    try:
+                        session.send(body, [recipient], sender=sender)
+                    except smtplib.SMTPAuthenticationError:
+                        self._finish(delivery_id, PENDING, attempts - 1, 'authentication failed', time.time())
+                        stop.set()
+                        raise
+                    except Exception as e:
+                        error = str(e)[:200]
+                        if _is_connection_error(e):
+                            # 서버 장애는 수신자 탓이 아니므로 시도 횟수에 세지 않음 (기한까지 재시도)
+                            attempts -= 1
+                        if _is_temporary(e) and attempts < Config.OUTBOX_MAX_ATTEMPTS:
+                            delay = Config.OUTBOX_RETRY_DELAY * 2 ** max(attempts - 1, 0)
+                            self._finish(delivery_id, PENDING, attempts, error, time.time() + delay)
+                            count('retry')
+                            # 연결이 끊겼을 수 있으므로 다음 전송 때 다시 연결
+                            session.close()
+                        else:
+                            self._finish(delivery_id, FAILED, attempts, error)
+                            count('failed')
+                            print(f"  [경고] {recipient} 전송 실패: {error}")
+                        continue
+
+                    self._finish(delivery_id, SENT, attempts)
+                    self._record_seen(delivery_id)
+                    count('sent')
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(work) for _ in range(workers)]
+        for future in futures:
+            future.result()
+        return counts
@@ -0,0 +1,179 @@
+"""
+파이프라인 실행 모듈
+수집 단계와 요약/렌더링 단계를 크기가 정해진 큐로 이어, 다음 키워드를 수집하는
+동안 앞 키워드의 기사를 요약합니다. 전체 시간이 단계별 시간의 합이 아니라
+가장 느린 단계에 가까워집니다.
+"""
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .config import Config
+from .fetcher import iter_news_by_keywords
+from .mailer import prerender_articles
+
+if TYPE_CHECKING:
+    from .fetcher import NewsArticle
+    from .seen_index import SeenIndex
+
+
+# 수집 단계가 끝났음을 알리는 표시
+_DONE = object()
+
+
+def run_pipeline(
+    keywords: list[str],
+    limit_per_keyword: int = 50,
+    summarize: bool = True,
+    seen_index: 'SeenIndex | None' = None,
+    queue_size: int | None = None,
+    deadline: float | None = None
+) -> list['NewsArticle']:
+    """
+    수집과 요약을 겹쳐 실행합니다.
+
+    수집 스레드는 키워드마다 새로 찾은 기사를(이미 보낸 기사 제외) 큐에 넣고,
+    호출한 스레드는 큐에 쌓인 기사를 한 번에 꺼내 요약한 뒤 기사 행을 미리
+    렌더링합니다. 요약 세션(SummarySession)은 실행 전체에 하나만 두고 배치마다
+    재사용합니다. 큐가 가득 차면 요약이 따라올 때까지 수집이 기다리고(backpressure),
+    제한 시간이 지나거나 요약 단계가 끝나면 수집 스레드도 다음 키워드로 넘어가지 않고
+    멈춥니다. 그때까지 모은 기사로 끝냅니다. (요약하지 못한 기사는 '(시간 초과)')
+
+    추출 요약(extractive)은 꺼낸 배치마다 TF-IDF를 계산하므로, 모든 기사를 한 번에
+    요약할 때와 문장 점수가 조금 다를 수 있습니다.
+
+    Args:
+        keywords: 검색 키워드 리스트
+        limit_per_keyword: 키워드당 가져올 기사 수
+        summarize: False면 요약 없이 수집과 렌더링만 겹침
+        seen_index: 이미 보낸 기사를 거를 발송 이력 (None이면 거르지 않음)
+        queue_size: 수집과 요약 사이에 쌓아 둘 최대 기사 수 (None이면 Config.PIPELINE_QUEUE_SIZE)
+        deadline: 수집+요약 전체 제한 시간 (초, None이면 Config.PIPELINE_DEADLINE, 0이면 제한 없음)
+
+    Returns:
+        수집 순서대로의 기사 리스트 (summarize면 요약 포함)
+    """
+    queue_size = queue_size or Config.PIPELINE_QUEUE_SIZE
+    deadline = Config.PIPELINE_DEADLINE if deadline is None else deadline
+    started = time.monotonic()
+    ends_at = started + deadline if deadline > 0 else None
+    pending: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    stats = {'skipped': 0, 'blocked': 0.0}
+
+    def remaining() -> float | None:
+        return None if ends_at is None else ends_at - time.monotonic()
+
+    def put(item, until_deadline: bool = True) -> bool:
+        """큐에 넣습니다. (가득 차면 기다림, 중단되거나 제한 시간이 지나면 False)"""
+        waited_from = time.monotonic()
+        try:
+            while not stop.is_set():
+                left = remaining()
+                if until_deadline and left is not None and left <= 0:
+                    stop.set()
+                    return False
+                try:
+                    pending.put(item, timeout=0.5 if left is None or left <= 0 else min(left, 0.5))
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            stats['blocked'] += time.monotonic() - waited_from
+
+    def produce() -> None:
+        try:
+            for keyword, added in iter_news_by_keywords(keywords, limit_per_keyword, stop=stop):
+                if seen_index is not None:
+                    new_articles = seen_index.filter_new(added)
+                    stats['skipped'] += len(added) - len(new_articles)
+                    added = new_articles
+                for article in added:
+                    if not put(article):
+                        return
+                left = remaining()
+                if left is not None and left <= 0:
+                    stop.set()
+                    return
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            # 요약 단계가 제한 시간까지 큐를 비우므로 끝 표시는 제한 시간과 관계없이 넣음
+            put(_DONE, until_deadline=False)
+
+    producer = threading.Thread(target=produce, name='pipeline-fetch', daemon=True)
+    producer.start()
+
+    session = None
+    if summarize:
+        from .summarizer import SummarySession
+        print("\n[요약] 수집되는 대로 요약 시작...")
+        session = SummarySession()
+
+    articles: list['NewsArticle'] = []
+    batches = 0
+    fetching = True
+    try:
+        while fetching:
+            left = remaining()
+            try:
+                item = pending.get(timeout=None if left is None else max(left, 0))
+            except queue.Empty:
+                print(f"  [경고] 파이프라인 제한 시간({deadline:g}초) 초과, 지금까지 모은 기사로 진행합니다.")
+                break
+
+            # 큐에 쌓인 기사를 모두 꺼내 한 배치로 요약
+            batch: list['NewsArticle'] = []
+            while True:
+                if item is _DONE:
+                    fetching = False
+                    break
+                batch.append(item)
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+            if not batch:
+                continue
+
+            batches += 1
+            if session is not None:
+                left = remaining()
+                session.summarize(batch, deadline=0 if left is None else max(left, 0.01))
+            prerender_articles(batch)
+            articles.extend(batch)
+    finally:
+        # 수집 스레드가 다음 키워드로 넘어가지 않도록 (제한 시간 초과, 요약 중 오류 모두)
+        stop.set()
+        if session is not None:
+            session.close()
+
+    if fetching:
+        # 제한 시간이 지나 큐에 남은 기사는 요약 없이 포함 (수집 중인 키워드는 기다리지 않음)
+        while True:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _DONE:
+                if summarize:
+                    item['summary'] = '(시간 초과)'
+                articles.append(item)
+    else:
+        producer.join()
+        if errors:
+            raise errors[0]
+
+    if session is not None:
+        session.print_result()
+    if seen_index is not None:
+        print(f"✓ 이미 보낸 기사 {stats['skipped']}개 제외")
+    print(
+        f"✓ 파이프라인: 기사 {len(articles)}개, 요약 배치 {batches}회, "
+        f"{time.monotonic() - started:.1f}초 (수집이 요약을 기다린 시간 {stats['blocked']:.1f}초)"
+    )
+    return articles
@@ -0,0 +1,259 @@
+"""
+키워드 검색식 모듈
+KEYWORDS의 검색식(AND/OR/NOT, 따옴표 구문, 제외어)을 컴파일하고
+모든 검색식의 검색어를 아호-코라식 자동자 하나로 한 번에 찾습니다.
+
+검색식 문법:
+    인공지능 반도체        두 검색어 모두 포함 (AND는 생략 가능)
+    AI OR 인공지능         둘 중 하나 포함 (| 도 가능)
+    반도체 -광고           광고 제외 (NOT 광고 와 같음)
+    "생성형 AI"            구문 그대로 포함
+    (AI | 인공지능) 규제   괄호로 묶기
+"""
+
+import html
+import re
+import unicodedata
+from collections import deque
+
+
+class QueryError(ValueError):
+    """검색식 문법 오류"""
+
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+_WHITESPACE = re.compile(r'\s+')
+_TOKEN = re.compile(r'"([^"]*)"?|([()|])|(-?)([^\s()|"]+)')
+
+
+def normalize_for_match(text: str) -> str:
+    """매칭용으로 텍스트를 정규화합니다. (HTML 엔티티 복원, 태그 제거, NFKC, casefold, 공백 통일)"""
+    # RSS 제목/설명에는 R&amp;D처럼 엔티티가 그대로 남아 있는 경우가 많음
+    if '&' in text:
+        text = html.unescape(text)
+    if '<' in text:
+        text = _HTML_TAG.sub(' ', text)
+    if not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
+    text = text.casefold()
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+# ---------------------------------------------------------------------------
+# 아호-코라식 자동자
+# ---------------------------------------------------------------------------
+
+class PatternAutomaton:
+    """
+    여러 검색어를 텍스트 한 번 순회로 찾는 아호-코라식 자동자
+
+    검색어 수가 늘어도 찾는 비용은 텍스트 길이에만 비례합니다.
+
+    Args:
+        patterns: 찾을 검색어 목록 (정규화된 문자열)
+    """
+
+    def __init__(self, patterns: list[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+
+        outputs: list[set[int]] = [set()]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(pattern_id)
+
+        # 너비 우선으로 실패 링크를 만들고, 실패 상태의 출력을 합침 (루트 자식의 실패 링크는 루트)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output = [frozenset(output) for output in outputs]
+        # 루트 상태에서는 검색어 첫 글자가 나올 때까지 정규식(C 구현)으로 건너뜀
+        first_chars = ''.join(re.escape(char) for char in self._goto[0])
+        self._first_chars = re.compile(f'[{first_chars}]' if first_chars else '(?!)')
+
+    def find(self, text: str) -> set[int]:
+        """텍스트에 포함된 검색어 번호 집합을 반환합니다."""
+        goto, fail, output = self._goto, self._fail, self._output
+        search = self._first_chars.search
+        found: set[int] = set()
+        state = 0
+        position, length = 0, len(text)
+
+        while position < length:
+            if not state:
+                match = search(text, position)
+                if match is None:
+                    break
+                position = match.start()
+
+            char = text[position]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+            position += 1
+
+        return found
+
+
+# ---------------------------------------------------------------------------
+# 검색식 컴파일
+# ---------------------------------------------------------------------------
+
+# 검색식 노드: ('term', 검색어 번호) | ('and', [노드...]) | ('or', [노드...]) | ('not', 노드)
+Node = tuple
+
+
+class _Parser:
+    """검색식을 노드 트리로 바꾸는 재귀 하강 파서"""
+
+    def __init__(self, query: str, intern):
+        self.tokens = self._tokenize(query)
+        self.position = 0
+        self.intern = intern
+
+    @staticmethod
+    def _tokenize(query: str) -> list[tuple[str, str]]:
+        tokens = []
+        for match in _TOKEN.finditer(query):
+            phrase, symbol, minus, word = match.groups()
+            if phrase is not None:
+                tokens.append(('term', phrase))
+            elif symbol:
+                tokens.append(('or' if symbol == '|' else symbol, symbol))
+            elif minus and word:
+                tokens.append(('not', '-'))
+                tokens.append(('term', word))
+            elif word in ('AND', 'OR', 'NOT'):
+                tokens.append((word.lower(), word))
+            else:
+                tokens.append(('term', word))
+
+        # '-"구문"' 처럼 따옴표 앞에 붙은 제외 기호
+        for index, (kind, value) in enumerate(tokens):
+            if kind == 'term' and value == '-' and index + 1 < len(tokens) and tokens[index + 1][0] == 'term':
+                tokens[index] = ('not', '-')
+        return tokens
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def _take(self) -> tuple[str, str]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            return ('and', [])
+        node = self._or()
+        if self.position < len(self.tokens):
+            raise QueryError(f"예상하지 못한 '{self.tokens[self.position][1]}'")
+        return node
+
+    def _or(self) -> Node:
+        nodes = [self._and()]
+        while self._peek() == 'or':
+            self._take()
+            nodes.append(self._and())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def _and(self) -> Node:
+        nodes = [self._unary()]
+        while self._peek() in ('and', 'not', 'term', '('):
+            if self._peek() == 'and':
+                self._take()
+            nodes.append(self._unary())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def _unary(self) -> Node:
+        kind = self._peek()
+        if kind is None:
+            raise QueryError('검색식이 연산자로 끝났습니다')
+        if kind == 'not':
+            self._take()
+            return ('not', self._unary())
+        if kind == '(':
+            self._take()
+            node = self._or()
+            if self._peek() != ')':
+                raise QueryError("닫는 괄호 ')'가 없습니다")
+            self._take()
+            return node
+        if kind == 'term':
+            pattern = normalize_for_match(self._take()[1])
+            if not pattern:
+                raise QueryError('빈 검색어')
+            return ('term', self.intern(pattern))
+        raise QueryError(f"예상하지 못한 '{self.tokens[self.position][1]}'")
+
+
+def _evaluate(node: Node, found: set[int]) -> bool:
+    kind = node[0]
+    if kind == 'term':
+        return node[1] in found
+    if kind == 'and':
+        return all(_evaluate(child, found) for child in node[1])
+    if kind == 'or':
+        return any(_evaluate(child, found) for child in node[1])
+    return not _evaluate(node[1], found)
+
+
+class KeywordMatcher:
+    """
+    여러 키워드 검색식을 한 번에 평가하는 매처
+
+    모든 검색식의 검색어를 자동자 하나에 넣어 두고, 엔트리마다 텍스트를 한 번
+    정규화하고 한 번 순회해 찾은 검색어로 각 검색식을 평가합니다.
+    문법이 잘못된 검색식은 경고 후 전체를 구문 하나로 취급합니다.
+
+    Args:
+        queries: 키워드 검색식 목록
+    """
+
+    def __init__(self, queries: list[str]):
+        self.queries = list(dict.fromkeys(queries))
+        self._patterns: dict[str, int] = {}
+        self._compiled: list[tuple[str, Node]] = []
+
+        for query in self.queries:
+            try:
+                node = _Parser(query, self._intern).parse()
+            except QueryError as e:
+                print(f"    [경고] 검색식 '{query}' 오류({e}), 구문 그대로 검색합니다.")
+                pattern = normalize_for_match(query)
+                node = ('term', self._intern(pattern)) if pattern else ('and', [])
+            self._compiled.append((query, node))
+
+        self._automaton = PatternAutomaton(list(self._patterns))
+
+    def _intern(self, pattern: str) -> int:
+        return self._patterns.setdefault(pattern, len(self._patterns))
+
+    def match_text(self, text: str) -> list[str]:
+        """정규화된 텍스트에 맞는 검색식 목록을 반환합니다. (입력 순서)"""
+        found = self._automaton.find(text) if self._patterns else set()
+        return [query for query, node in self._compiled if _evaluate(node, found)]
+
+    def match(self, title: str, description: str = '') -> list[str]:
+        """제목과 설명을 함께 검사해 맞는 검색식 목록을 반환합니다."""
+        # 구문이 제목과 설명에 걸쳐 매칭되지 않도록 구분 문자를 넣음
+        return self.match_text(normalize_for_match(title) + '\n' + normalize_for_match(description))
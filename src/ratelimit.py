@@ -0,0 +1,67 @@
+"""
+요청 속도 제한 모듈
+호스트별 토큰 버킷으로 포털 서버에 보내는 요청 속도를 제한합니다.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓입니다.
+    acquire()는 토큰이 생길 때까지 호출 스레드를 대기시킵니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰 하나를 소비합니다. (부족하면 대기)"""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷 모음
+
+    Args:
+        rate: 호스트당 초당 요청 수 (0 이하면 제한 없음)
+        burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        """URL의 호스트에 요청을 보내도 될 때까지 대기합니다."""
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        bucket.acquire()
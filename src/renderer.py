@@ -0,0 +1,126 @@
+"""
+HTML 렌더링 모듈
+한 번 컴파일한 템플릿에 값을 HTML 이스케이프해서 채우고,
+기사별 조각은 내용을 키로 캐시해 한 실행의 여러 다이제스트가 재사용합니다.
+"""
+
+import html
+import re
+import string
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, TypeVar
+
+from .config import Config
+
+T = TypeVar('T')
+
+
+_WHITESPACE = re.compile(r'\s+')
+_BETWEEN_TAGS = re.compile(r'>\s+<')
+_STYLE_BLOCK = re.compile(r'(<style[^>]*>)(.*?)(</style>)', re.DOTALL)
+_CSS_PUNCTUATION = re.compile(r'\s*([{};:,>])\s*')
+
+
+def minify(source: str) -> str:
+    """
+    템플릿 원문의 들여쓰기, 줄바꿈, 태그 사이 공백과 <style> 안의 CSS 공백을 없앱니다.
+
+    템플릿을 컴파일할 때 한 번만 쓰며, 렌더링하는 값에는 적용하지 않습니다.
+    """
+    def minify_css(match: re.Match) -> str:
+        css = _CSS_PUNCTUATION.sub(r'\1', _WHITESPACE.sub(' ', match.group(2))).replace(';}', '}')
+        return match.group(1) + css.strip() + match.group(3)
+
+    source = _STYLE_BLOCK.sub(minify_css, source)
+    source = _BETWEEN_TAGS.sub('><', source)
+    return _WHITESPACE.sub(' ', source).strip()
+
+
+class Markup(str):
+    """이미 안전한 HTML (템플릿에 넣을 때 이스케이프하지 않음)"""
+
+
+def escape(value) -> str:
+    """값을 HTML 텍스트/속성 값으로 안전하게 바꿉니다. (Markup은 그대로)"""
+    if isinstance(value, Markup):
+        return value
+    if isinstance(value, int):
+        return str(value)
+    return html.escape(str(value), quote=True)
+
+
+class Template:
+    """
+    str.format 문법({name}, 중괄호는 {{ }})의 HTML 템플릿
+
+    생성할 때 한 번만 파싱해 '%s' 형식 문자열과 필드 순서로 바꿔 두므로,
+    렌더링은 값 이스케이프와 C로 구현된 % 연산 한 번으로 끝납니다.
+
+    Args:
+        source: 템플릿 문자열 (필드는 이름만 허용, 형식 지정자 불가)
+
+    Raises:
+        ValueError: 필드 이름이 없거나 형식 지정자가 있는 경우
+    """
+
+    def __init__(self, source: str):
+        parts = []
+        fields = []
+        for literal, field, format_spec, conversion in string.Formatter().parse(source):
+            parts.append(literal.replace('%', '%%'))
+            if field is None:
+                continue
+            if not field or format_spec or conversion:
+                raise ValueError(f"지원하지 않는 템플릿 필드: {{{field}}}")
+            parts.append('%s')
+            fields.append(field)
+        self._format = ''.join(parts)
+        self.fields = tuple(fields)
+
+    def render(self, **values) -> str:
+        """필드 값을 이스케이프해서 채운 문자열을 반환합니다."""
+        return self._format % tuple(escape(values[name]) for name in self.fields)
+
+
+class FragmentCache:
+    """
+    렌더링한 HTML 조각의 LRU 캐시
+
+    키는 조각을 만든 값들의 튜플이라 내용이 같으면 같은 조각을 돌려주고,
+    문자열 해시는 파이썬이 문자열마다 캐시하므로 조회 비용이 거의 없습니다.
+    같은 기사가 여러 다이제스트(수신자별, 재시도 등)에 들어가도 한 번만
+    렌더링합니다. 여러 스레드에서 함께 써도 됩니다.
+
+    Args:
+        max_entries: 최대 보관 조각 수 (None이면 Config.RENDER_CACHE_MAX_ENTRIES)
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = max_entries or Config.RENDER_CACHE_MAX_ENTRIES
+        self._fragments: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key: Hashable, render: Callable[[], T]) -> T:
+        """캐시된 조각을 반환하고, 없으면 render()로 만들어 저장합니다. (조각과 함께 크기 등을 담아도 됨)"""
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return fragment
+
+        fragment = render()
+        with self._lock:
+            self.misses += 1
+            self._fragments[key] = fragment
+            if len(self._fragments) > self.max_entries:
+                self._fragments.popitem(last=False)
+        return fragment
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+            self.hits = self.misses = 0
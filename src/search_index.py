@@ -0,0 +1,173 @@
+"""
+결과 내 검색 인덱스 모듈
+수집한 기사의 제목/요약/언론사를 문자 바이그램으로 색인해
+수천 개 기사에서도 결과 내 검색이 바로 끝나도록 합니다.
+"""
+
+import math
+from typing import TYPE_CHECKING
+
+from .query import normalize_for_match
+
+if TYPE_CHECKING:
+    from .fetcher import NewsArticle
+
+
+# 색인할 필드와 점수 가중치
+FIELD_WEIGHTS = {'title': 3.0, 'source': 2.0, 'summary': 1.0}
+
+
+def _bigrams(word: str) -> list[str]:
+    """단어의 문자 바이그램 목록 (한 글자 단어는 그 글자 하나)"""
+    if len(word) < 2:
+        return [word] if word else []
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+class ArticleSearchIndex:
+    """
+    기사 역색인 (문자 바이그램)
+
+    한국어는 띄어쓰기와 조사 때문에 단어 단위 색인이 잘 맞지 않으므로 단어를
+    두 글자씩 잘라 색인합니다. 검색어의 바이그램을 모두 가진 기사만 후보로 보고,
+    후보는 정규화된 원문에 검색어가 실제로 들어 있는지 다시 확인합니다.
+    한 글자 검색어는 그 글자가 들어 있는 바이그램 전체로 찾습니다. (원문 어디에 있든)
+
+    기사를 도착하는 대로 add()로 추가할 수 있고, 같은 링크를 다시 추가하면
+    (요약이 채워진 경우 등) 기존 색인을 바꿉니다.
+    """
+
+    def __init__(self):
+        self._articles: list['NewsArticle'] = []
+        self._doc_ids: dict[str, int] = {}
+        # 토큰 -> {문서 번호: 가중 빈도}
+        self._postings: dict[str, dict[int, float]] = {}
+        # 문서 번호 -> {필드: 정규화된 텍스트}
+        self._texts: dict[int, dict[str, str]] = {}
+        # 글자 -> 그 글자가 들어 있는 토큰 (한 글자 검색용, 바이그램은 두 글자 모두에 등록)
+        self._by_char: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def _remove(self, doc_id: int) -> None:
+        tokens = {
+            token
+            for text in self._texts.pop(doc_id, {}).values()
+            for word in text.split()
+            for token in _bigrams(word)
+        }
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+
+    def add(self, article: 'NewsArticle') -> int:
+        """
+        기사를 색인에 추가합니다. (같은 링크가 이미 있으면 새 내용으로 교체)
+
+        Returns:
+            문서 번호
+        """
+        key = article['link'] or article['title']
+        doc_id = self._doc_ids.get(key)
+        if doc_id is None:
+            doc_id = len(self._articles)
+            self._doc_ids[key] = doc_id
+            self._articles.append(article)
+        else:
+            self._remove(doc_id)
+            self._articles[doc_id] = article
+
+        texts = {field: normalize_for_match(article.get(field) or '') for field in FIELD_WEIGHTS}
+        self._texts[doc_id] = texts
+
+        for field, text in texts.items():
+            weight = FIELD_WEIGHTS[field]
+            for word in text.split():
+                for token in _bigrams(word):
+                    postings = self._postings.get(token)
+                    if postings is None:
+                        postings = self._postings[token] = {}
+                        for char in set(token):
+                            self._by_char.setdefault(char, set()).add(token)
+                    postings[doc_id] = postings.get(doc_id, 0.0) + weight
+
+        return doc_id
+
+    def add_many(self, articles: list['NewsArticle']) -> None:
+        """여러 기사를 색인에 추가합니다."""
+        for article in articles:
+            self.add(article)
+
+    def _word_scores(self, word: str) -> dict[int, float]:
+        """검색어 하나에 맞는 문서와 점수 (TF-IDF 합)"""
+        total = len(self._doc_ids)
+
+        if len(word) == 1:
+            # 이 글자가 들어 있는 모든 토큰 (단어 끝 글자도 찾도록 두 번째 글자로도 등록됨)
+            scores: dict[int, float] = {}
+            for token in self._by_char.get(word, ()):
+                postings = self._postings[token]
+                idf = math.log(1 + total / (1 + len(postings)))
+                for doc_id, weight in postings.items():
+                    scores[doc_id] = max(scores.get(doc_id, 0.0), weight * idf)
+            for doc_id in scores:
+                if self._texts[doc_id]['title'].startswith(word):
+                    scores[doc_id] *= 1.5
+            return scores
+
+        token_postings = [self._postings.get(token, {}) for token in dict.fromkeys(_bigrams(word))]
+        token_postings.sort(key=len)
+        if not token_postings[0]:
+            return {}
+
+        # 가장 짧은 포스팅 목록부터 교집합
+        candidates = set(token_postings[0])
+        for postings in token_postings[1:]:
+            candidates.intersection_update(postings)
+            if not candidates:
+                return {}
+
+        scores = {}
+        for doc_id in candidates:
+            texts = self._texts[doc_id]
+            # 바이그램이 흩어져 있을 뿐 검색어가 실제로 없는 경우 제외
+            if not any(word in text for text in texts.values()):
+                continue
+            score = 0.0
+            for postings in token_postings:
+                score += postings[doc_id] * math.log(1 + total / (1 + len(postings)))
+            if texts['title'].startswith(word):
+                score *= 1.5
+            scores[doc_id] = score
+        return scores
+
+    def search(self, query: str, limit: int | None = None) -> list['NewsArticle']:
+        """
+        검색어를 모두 포함한 기사를 관련도 순으로 반환합니다.
+
+        Args:
+            query: 공백으로 구분한 검색어 (모두 포함해야 함)
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            기사 리스트 (점수가 같으면 추가된 순서)
+        """
+        words = list(dict.fromkeys(normalize_for_match(query).split()))
+        if not words:
+            return self._articles[:limit]
+
+        totals: dict[int, float] | None = None
+        # 긴 검색어가 후보를 더 빨리 줄임
+        for word in sorted(words, key=len, reverse=True):
+            scores = self._word_scores(word)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {doc_id: totals[doc_id] + score for doc_id, score in scores.items() if doc_id in totals}
+            if not totals:
+                return []
+
+        ranked = sorted(totals, key=lambda doc_id: (-totals[doc_id], doc_id))
+        return [self._articles[doc_id] for doc_id in ranked[:limit]]
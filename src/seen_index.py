@@ -0,0 +1,138 @@
+"""
+발송 이력 인덱스 모듈
+이미 보낸 기사를 실행 간에 기억해 다이제스트에 새 기사만 담기도록 합니다.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .config import Config
+from .dedup import normalize_text
+from .storage import canonical_url, connect
+
+if TYPE_CHECKING:
+    from .fetcher import NewsArticle
+
+
+class BloomFilter:
+    """
+    메모리 블룸 필터
+
+    Args:
+        capacity: 예상 항목 수
+        error_rate: 허용할 거짓 양성 비율
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.num_bits = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        # 128비트 해시 하나를 둘로 나눠 더블 해싱
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+def title_fingerprint(title: str) -> str:
+    """정규화한 제목의 해시를 반환합니다. (정규화 후 비어 있으면 빈 문자열)"""
+    normalized = normalize_text(title)
+    if not normalized:
+        return ''
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=12).hexdigest()
+
+
+def article_keys(article: 'NewsArticle') -> list[str]:
+    """기사를 식별하는 키 목록 (정규화 링크, 제목 지문)"""
+    keys = []
+    if article['link']:
+        keys.append('url:' + canonical_url(article['link']))
+    fingerprint = title_fingerprint(article['title'])
+    if fingerprint:
+        keys.append('title:' + fingerprint)
+    return keys
+
+
+class SeenIndex:
+    """
+    이미 보낸 기사 인덱스
+
+    조회는 메모리 블룸 필터가 먼저 걸러내고, 블룸 필터가 '있을 수도 있음'이라고
+    한 키만 SQLite 저장소에서 정확히 확인합니다. 보관 기간이 지난 키는 열 때
+    정리되며, 블룸 필터는 남은 키로 다시 만듭니다.
+
+    Args:
+        path: SQLite 파일 경로 (None이면 캐시 디렉토리의 seen.db)
+        retention_days: 보관 기간 (일, None이면 Config.SEEN_RETENTION_DAYS)
+    """
+
+    def __init__(self, path: Path | None = None, retention_days: float | None = None):
+        self.path = path or Config.get_cache_path('seen.db')
+        days = retention_days if retention_days is not None else Config.SEEN_RETENTION_DAYS
+        self.retention = days * 86400
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+
+        with self._lock, self._conn:
+            self._conn.execute('CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, sent_at REAL)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_seen_sent_at ON seen (sent_at)')
+            self._conn.execute('DELETE FROM seen WHERE sent_at < ?', (time.time() - self.retention,))
+            keys = [row[0] for row in self._conn.execute('SELECT key FROM seen')]
+
+        self._bloom = BloomFilter(max(len(keys) * 2, Config.SEEN_BLOOM_CAPACITY))
+        for key in keys:
+            self._bloom.add(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+
+    def contains(self, key: str) -> bool:
+        """키가 보관 기간 안에 기록되어 있는지 확인합니다."""
+        if key not in self._bloom:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT 1 FROM seen WHERE key = ? AND sent_at >= ?',
+                (key, time.time() - self.retention)
+            ).fetchone()
+        return row is not None
+
+    def is_seen(self, article: 'NewsArticle') -> bool:
+        """링크나 제목 지문 중 하나라도 이미 보낸 기사면 True"""
+        return any(self.contains(key) for key in article_keys(article))
+
+    def filter_new(self, articles: list['NewsArticle']) -> list['NewsArticle']:
+        """아직 보내지 않은 기사만 반환합니다. (순서 유지)"""
+        return [article for article in articles if not self.is_seen(article)]
+
+    def mark_sent(self, articles: list['NewsArticle']) -> None:
+        """기사들을 보낸 것으로 기록합니다."""
+        self.mark_keys([key for article in articles for key in article_keys(article)])
+
+    def mark_keys(self, keys: list[str]) -> None:
+        """기사 키(article_keys)들을 보낸 것으로 기록합니다. (발신함이 전송 완료 시 사용)"""
+        now = time.time()
+        rows = [(key, now) for key in keys]
+        if not rows:
+            return
+
+        with self._lock, self._conn:
+            self._conn.executemany('INSERT OR REPLACE INTO seen (key, sent_at) VALUES (?, ?)', rows)
+        for key, _ in rows:
+            self._bloom.add(key)
@@ -0,0 +1,49 @@
+"""
+로컬 저장소 공통 모듈
+캐시/인덱스가 함께 쓰는 SQLite 연결 설정과 키 정규화 함수를 제공합니다.
+"""
+
+import sqlite3
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """
+    여러 스레드와 프로세스에서 함께 쓸 수 있도록 설정된 SQLite 연결을 엽니다.
+
+    연결 객체는 스레드 간에 공유되므로 호출 측에서 잠금으로 보호해야 합니다.
+    """
+    conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+# 링크 비교 시 무시할 추적용 쿼리 파라미터
+_TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid'}
+# 쿼리 없이도 기사가 식별되는 포털 호스트 (sid 등 섹션 파라미터 제거)
+_QUERYLESS_HOSTS = {'n.news.naver.com', 'v.daum.net'}
+
+
+def canonical_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 링크가 같은 키가 되도록 URL을 정규화합니다.
+
+    스킴/호스트 소문자화, 프래그먼트와 추적용 파라미터(utm_* 등) 제거,
+    나머지 쿼리 파라미터 정렬, 끝 슬래시 제거를 수행합니다.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+
+    if host in _QUERYLESS_HOSTS:
+        query = ''
+    else:
+        params = [
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith('utm_') and key.lower() not in _TRACKING_PARAMS
+        ]
+        query = urlencode(sorted(params))
+
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), host, path, query, ''))
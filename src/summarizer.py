@@ -1,57 +1,72 @@
 """
 기사 본문 추출 및 요약 모듈
-네이버 뉴스 등 한국 뉴스 사이트에서 본문을 추출합니다.
+네이버/다음 뉴스 등 한국 뉴스 사이트에서 본문을 추출합니다.
+
+요약은 두 단계로 나눠 처리합니다.
+    1. 다운로드 (스레드 풀): 기사 페이지를 받아 원본 바이트 그대로 넘김
+    2. 파싱 (프로세스 풀): newspaper3k 파싱은 CPU를 쓰고 GIL을 잡으므로 코어 수만큼의 프로세스에서 실행
+       (풀은 프로세스당 하나를 처음 필요할 때 만들어 재사용하고, 종료 시 닫음)
 """
 
-import requests
-import re
-from typing import TYPE_CHECKING
+import atexit
+import multiprocessing
+import os
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from . import http_client
+from .config import Config
+from .extractor import extract_article_body, extract_meta_tags
+from .ratelimit import HostRateLimiter
+from .summary_cache import get_summary_cache
 
 if TYPE_CHECKING:
     from .fetcher import NewsArticle
 
 
-def extract_naver_article(url: str) -> str:
-    """
-    네이버 뉴스 기사 본문을 추출합니다.
+def _truncate(text: str, length: int = 300) -> str:
+    return text[:length] + '...' if len(text) > length else text
+
+
+# 요약 대신 넣는 실패 표시 (본문이 "(서울=연합뉴스)"처럼 괄호로 시작해도 실패로 보지 않도록 구분)
+_FAILURE_PREFIXES = ('(본문 추출 실패)', '(추출 오류:', '(요약 실패:', '(시간 초과)')
+
+
+def is_failed_summary(summary: str) -> bool:
+    """요약 대신 실패 표시가 들어 있는지 확인합니다."""
+    return summary.startswith(_FAILURE_PREFIXES)
+
+
+def _is_portal_article(url: str) -> bool:
+    """네이버/다음 뉴스 기사 페이지인지 확인합니다."""
+    return 'naver.com' in url or 'v.daum.net' in url
+
+
+def extract_portal_article(url: str, full_text: bool = False) -> str:
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
+    네이버/다음 뉴스 기사 본문을 추출합니다.
 
+    Args:
+        url: 기사 URL
+        full_text: True면 og:description 대신 본문 전체를 반환 (추출 요약용)
+    """
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.encoding = 'utf-8'
-        html = response.text
-
-        # og:description 메타 태그에서 요약 추출 (가장 신뢰성 높음)
-        desc_match = re.search(r'<meta property="og:description" content="([^"]+)"', html)
-        if desc_match:
-            description = desc_match.group(1)
-            # HTML 엔티티 디코딩
-            description = description.replace('&quot;', '"').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
+        # og:description 메타 태그에서 요약 추출 (가장 신뢰성 높음, <head>만 읽음)
+        if not full_text:
+            description = extract_meta_tags(http_client.get_head(url, timeout=10)).get('og:description', '')
             if len(description) > 50:  # 의미있는 길이인 경우
                 return description
 
+        response = http_client.get(url, timeout=10)
+        response.encoding = 'utf-8'
+
         # article 본문에서 추출 시도
-        # 네이버 뉴스 본문은 주로 _article_body 또는 newsct_article 클래스에 있음
-        body_patterns = [
-            r'<article[^>]*id="dic_area"[^>]*>(.*?)</article>',
-            r'<div[^>]*class="[^"]*newsct_article[^"]*"[^>]*>(.*?)</div>',
-            r'<div[^>]*id="_article_body"[^>]*>(.*?)</div>',
-        ]
-
-        for pattern in body_patterns:
-            match = re.search(pattern, html, re.DOTALL)
-            if match:
-                body = match.group(1)
-                # HTML 태그 제거
-                text = re.sub(r'<[^>]+>', ' ', body)
-                # 연속 공백 정리
-                text = re.sub(r'\s+', ' ', text).strip()
-                if len(text) > 100:
-                    return text[:300] + '...' if len(text) > 300 else text
+        body = extract_article_body(response.text)
+        if body:
+            return body if full_text else _truncate(body)
 
         return '(본문 추출 실패)'
 
@@ -59,71 +74,401 @@ def extract_naver_article(url: str) -> str:
         return f'(추출 오류: {str(e)[:20]})'
 
 
-def extract_and_summarize(url: str, language: str = 'ko') -> str:
+def summary_from_content(article: 'NewsArticle', full_text: bool = False) -> str | None:
     """
-    URL에서 기사 본문을 추출합니다.
+    수집 단계에서 기사에 담아 둔 설명/본문으로 요약을 만듭니다. (네트워크 요청 없음)
+
+    포털 기사는 수집할 때 이미 기사 페이지를 읽었으므로, extract_portal_article이
+    같은 페이지를 다시 받아 얻을 결과를 그대로 만들 수 있습니다.
 
     Args:
-        url: 기사 URL
-        language: 언어 코드 (기본값: 'ko')
+        article: 뉴스 기사
+        full_text: True면 담아 둔 본문만 그대로 반환 (추출 요약용)
 
     Returns:
-        요약된 텍스트 (실패 시 에러 메시지)
+        요약 텍스트 (담긴 내용이 부족하면 None)
     """
-    # 네이버 뉴스인 경우 직접 추출
-    if 'naver.com' in url:
-        return extract_naver_article(url)
+    if not _is_portal_article(article['link']):
+        return None
 
-    # 다른 사이트는 newspaper3k 시도
+    if full_text:
+        return article.get('body') or None
+
+    description = article.get('description', '')
+    if len(description) > 50:
+        return description
+
+    body = article.get('body', '')
+    if body:
+        return _truncate(body)
+
+    return None
+
+
+def download_article(url: str) -> bytes:
+    """
+    기사 페이지를 내려받아 디코딩하지 않은 원본 바이트로 반환합니다.
+
+    Raises:
+        requests.RequestException: 요청 실패 또는 응답 상태 코드가 4xx/5xx인 경우
+    """
+    response = http_client.get(url, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+
+def parse_article_html(url: str, html: bytes, language: str = 'ko', full_text: bool = False) -> str:
+    """
+    내려받은 기사 HTML을 newspaper3k로 파싱해 본문 앞부분을 반환합니다.
+
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 두고, 인자는 원본 바이트를
+    그대로 받아 (문자열로 디코딩한 사본 없이) 한 번만 직렬화되도록 합니다.
+
+    Args:
+        url: 기사 URL (상대 링크 처리용)
+        html: 기사 페이지 원본 바이트
+        language: 언어 코드 (기본값: 'ko')
+        full_text: True면 본문 전체를 반환 (추출 요약용)
+
+    Returns:
+        본문의 첫 300자 (full_text면 본문 전체, 실패 시 에러 메시지)
+    """
     try:
         from newspaper import Article
         article = Article(url, language=language)
-        article.download()
+        article.download(input_html=html)
         article.parse()
 
-        # 본문의 첫 300자 반환
         if article.text:
-            text = article.text[:300]
-            return text + '...' if len(article.text) > 300 else text
-        else:
-            return '(본문 추출 실패)'
+            return article.text if full_text else _truncate(article.text)
+        return '(본문 추출 실패)'
 
     except Exception as e:
         return f'(요약 실패: {str(e)[:30]})'
 
 
-def summarize_articles(articles: list['NewsArticle'], delay: float = 0.5) -> list['NewsArticle']:
+def extract_and_summarize(url: str, language: str = 'ko') -> str:
     """
-    기사 리스트의 각 기사에 대해 요약을 생성합니다.
+    URL에서 기사 본문을 추출합니다.
 
     Args:
-        articles: 뉴스 기사 리스트
-        delay: 요청 간 대기 시간 (초, 서버 부하 방지)
+        url: 기사 URL
+        language: 언어 코드 (기본값: 'ko')
 
     Returns:
-        요약이 추가된 기사 리스트
+        요약된 텍스트 (실패 시 에러 메시지)
+    """
+    # 네이버/다음 뉴스인 경우 직접 추출
+    if _is_portal_article(url):
+        return extract_portal_article(url)
+
+    # 다른 사이트는 newspaper3k 시도
+    try:
+        html = download_article(url)
+    except Exception as e:
+        return f'(요약 실패: {str(e)[:30]})'
+    return parse_article_html(url, html, language)
+
+
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_failed = False
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor | None:
+    """
+    공유 파싱 프로세스 풀을 반환합니다. (꺼져 있거나 만들 수 없으면 None - 스레드에서 파싱)
+
+    스레드가 떠 있는 프로세스(Streamlit 등)에서 fork하면 잠금 상태까지 복사되어 멈출 수 있으므로
+    forkserver(없으면 spawn) 방식으로 작업 프로세스를 띄웁니다.
+    """
+    global _parse_pool, _parse_pool_failed
+    if not Config.SUMMARY_PARSE_PROCESSES:
+        return None
+
+    with _parse_pool_lock:
+        if _parse_pool is None and not _parse_pool_failed:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            try:
+                _parse_pool = ProcessPoolExecutor(
+                    max_workers=Config.SUMMARY_PARSE_WORKERS or os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context(method)
+                )
+            except (OSError, ValueError, NotImplementedError) as e:
+                print(f"  [경고] 파싱 프로세스 풀을 만들 수 없어 스레드에서 파싱합니다: {e}")
+                _parse_pool_failed = True
+            else:
+                atexit.register(_shutdown_parse_pool)
+        return _parse_pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """작업 프로세스가 죽어 못 쓰게 된 풀을 버립니다. (다음 요약 때 새로 만듦)"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _shutdown_parse_pool() -> None:
+    """공유 파싱 프로세스 풀을 닫습니다. (프로세스 종료 시 호출)"""
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class SummarySession:
+    """
+    요약 세션
+
+    요약 방식 확인, 호스트별 요청 간격(HostRateLimiter), 다운로드 스레드 풀, 요약 캐시를
+    한 번만 준비해 두고 여러 배치를 요약합니다. 파이프라인처럼 기사가 나눠 도착할 때
+    배치마다 준비 비용을 다시 치르지 않고, 같은 호스트 간격도 배치를 넘어 지켜집니다.
+    with 문으로 사용하며, 닫을 때 진행 중인 다운로드는 기다리지 않습니다.
+
+    Args:
+        delay: 같은 호스트 요청 간 최소 간격 (초, None이면 Config.SUMMARY_HOST_DELAY)
+        max_workers: 동시에 내려받을 기사 수 (None이면 Config.SUMMARY_MAX_WORKERS)
+        strategy: 요약 방식 ('lead' 또는 'extractive', None이면 Config.SUMMARY_STRATEGY)
     """
-    total = len(articles)
-    print(f"\n[요약] 총 {total}개 기사 요약 시작...")
 
-    for i, article in enumerate(articles, 1):
-        print(f"  [{i}/{total}] {article['title'][:40]}... ", end='', flush=True)
+    def __init__(self, delay: float | None = None, max_workers: int | None = None, strategy: str | None = None):
+        delay = Config.SUMMARY_HOST_DELAY if delay is None else delay
+        strategy = (strategy or Config.SUMMARY_STRATEGY).lower()
+        if strategy not in ('lead', 'extractive'):
+            print(f"  [경고] 알 수 없는 요약 방식 '{strategy}', lead 방식을 사용합니다.")
+            strategy = 'lead'
+        self.strategy = strategy
+        self.full_text = strategy == 'extractive'
+        self.limiter = HostRateLimiter(1 / delay if delay > 0 else 0)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or Config.SUMMARY_MAX_WORKERS)
+        self.cache = get_summary_cache()
+        # 세션 전체 집계 (요청한 기사 수, 요약을 끝낸 기사 수, 성공 수, 캐시에서 가져온 수)
+        self.total = 0
+        self.done = 0
+        self.succeeded = 0
+        self.reused = 0
+
+    def __enter__(self) -> 'SummarySession':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """다운로드 스레드 풀을 닫습니다. (진행 중인 다운로드는 기다리지 않음)"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def print_result(self) -> None:
+        """세션 전체의 요약 결과를 출력합니다."""
+        if self.reused:
+            print(f"  캐시된 요약 {self.reused}개 재사용")
+        print(f"\n[요약] 완료! 성공: {self.succeeded}/{self.total}개")
+
+    def summarize(self, articles: list['NewsArticle'], deadline: float = 0) -> list['NewsArticle']:
+        """
+        기사 한 배치를 요약합니다. (summarize_articles 참고)
+
+        Args:
+            articles: 뉴스 기사 리스트
+            deadline: 이 배치의 제한 시간 (초, 0이면 제한 없음)
 
-        summary = extract_and_summarize(article['link'])
-        article['summary'] = summary
+        Returns:
+            요약이 추가된 기사 리스트
+        """
+        if not articles:
+            return articles
 
-        if summary.startswith('('):
-            print("실패")
-        else:
-            print("완료")
+        full_text = self.full_text
+        limiter = self.limiter
+        cache = self.cache
+        self.total += len(articles)
+        ends_at = time.monotonic() + deadline if deadline > 0 else None
+        summaries: dict[int, str] = {}
+        # 이번에 새로 만든 요약 (링크, 요약, 요약 방법) - 캐시에 저장
+        created: list[tuple[str, str, str]] = []
+        # 추출 요약할 본문 (기사 번호 -> 본문) - 모두 모은 뒤 한 번에 요약
+        texts: dict[int, str] = {}
 
-        # 서버 부하 방지를 위한 딜레이
-        if i < total:
-            time.sleep(delay)
+        def report(index: int, article: 'NewsArticle', summary: str) -> None:
+            summaries[index] = summary
+            self.done += 1
+            status = "실패" if is_failed_summary(summary) else "완료"
+            print(f"  [{self.done}/{self.total}] {article['title'][:40]}... {status}")
+
+        def fetch_one(article: 'NewsArticle') -> str | Future | None:
+            """
+            다운로드 단계 (스레드 풀)
+
+            Returns:
+                요약 텍스트, 파싱 단계의 Future (일반 언론사 기사), 제한 시간이 지나 건너뛰면 None
+            """
+            # 수집 단계에서 받은 내용이 있으면 네트워크 요청 없이 요약
+            summary = summary_from_content(article, full_text)
+            if summary is not None:
+                return summary
+
+            url = article['link']
+            limiter.acquire(url)
+            if finished.is_set() or (ends_at is not None and time.monotonic() >= ends_at):
+                return None
+            # 포털 기사는 본문 컨테이너만 파싱하므로 이 스레드에서 바로 처리
+            if _is_portal_article(url):
+                return extract_portal_article(url, full_text)
+
+            try:
+                html = download_article(url)
+            except Exception as e:
+                return f'(요약 실패: {str(e)[:30]})'
+            if finished.is_set():
+                return None
+            if parse_pool is not None:
+                try:
+                    return parse_pool.submit(parse_article_html, url, html, full_text=full_text)
+                except BrokenProcessPool:
+                    _discard_parse_pool(parse_pool)
+                except RuntimeError:
+                    # 프로세스 종료 중이라 풀이 이미 닫힘
+                    return None
+            return parse_article_html(url, html, full_text=full_text)
+
+        # 이전 실행이나 다른 프로세스(웹 앱 등)가 같은 방식으로 만든 요약은 그대로 사용
+        cached = cache.get_many([article['link'] for article in articles]) if cache else {}
+        cached = {
+            link: entry for link, entry in cached.items()
+            if (entry['extractor'] == 'extractive') == full_text
+        }
+        self.reused += sum(1 for article in articles if article['link'] in cached)
+        pending = []
+        for index, article in enumerate(articles):
+            if article['link'] in cached:
+                report(index, article, cached[article['link']]['summary'])
+            else:
+                pending.append((index, article))
+
+        needs_parse = any(
+            summary_from_content(article, full_text) is None and not _is_portal_article(article['link'])
+            for _, article in pending
+        )
+        parse_pool = _get_parse_pool() if needs_parse else None
+        # 반환한 뒤에도 남아 있는 다운로드 스레드가 파싱을 새로 맡기지 않도록 표시
+        finished = threading.Event()
+        # 다운로드/파싱 중인 Future -> (기사 번호, 기사)
+        in_flight: dict[Future, tuple[int, 'NewsArticle']] = {
+            self.executor.submit(fetch_one, article): (index, article) for index, article in pending
+        }
+        try:
+            while in_flight:
+                remaining = None if ends_at is None else max(ends_at - time.monotonic(), 0)
+                done, _ = wait(in_flight, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    print(f"  [경고] 요약 제한 시간({deadline:g}초) 초과, 남은 기사는 요약하지 않습니다.")
+                    break
+
+                for future in done:
+                    index, article = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool as e:
+                        _discard_parse_pool(parse_pool)
+                        result = f'(요약 실패: {str(e)[:30]})'
+                    if isinstance(result, Future):
+                        # 다운로드가 끝나 파싱 단계로 넘어감
+                        in_flight[result] = (index, article)
+                        continue
+                    if result is None:
+                        continue
+                    if full_text and not is_failed_summary(result):
+                        texts[index] = result
+                        continue
+
+                    report(index, article, result)
+                    if not is_failed_summary(result):
+                        if summary_from_content(article) is not None:
+                            extractor = 'content'
+                        elif _is_portal_article(article['link']):
+                            extractor = 'portal'
+                        else:
+                            extractor = 'newspaper'
+                        created.append((article['link'], result, extractor))
+        finally:
+            # 진행 중인 요청/파싱은 기다리지 않음 (공유하는 풀은 닫지 않고, 시작하지 않은 작업만 취소)
+            finished.set()
+            for future in in_flight:
+                future.cancel()
+
+        if texts:
+            from .extractive import summarize_batch
+            started = time.perf_counter()
+            batch = summarize_batch(list(texts.values()), sentences=Config.SUMMARY_SENTENCES)
+            print(f"  추출 요약: 기사 {len(texts)}개 ({time.perf_counter() - started:.2f}초)")
+            for index, summary in zip(texts, batch):
+                article = articles[index]
+                if not summary:
+                    report(index, article, '(본문 추출 실패)')
+                    continue
+                report(index, article, summary)
+                created.append((article['link'], summary, 'extractive'))
+
+        for index, article in enumerate(articles):
+            article['summary'] = summaries.get(index, '(시간 초과)')
+
+        # 실패한 요약은 일시적인 오류일 수 있으므로 저장하지 않음
+        if cache:
+            cache.put_many(created)
+
+        self.succeeded += sum(1 for a in articles if not is_failed_summary(a['summary']))
+        return articles
+
+
+def summarize_articles(
+    articles: list['NewsArticle'],
+    delay: float | None = None,
+    max_workers: int | None = None,
+    deadline: float | None = None,
+    strategy: str | None = None
+) -> list['NewsArticle']:
+    """
+    기사 리스트의 각 기사에 대해 요약을 생성합니다.
+
+    여러 기사를 스레드 풀에서 동시에 처리하되, 같은 호스트에는 delay초에 한 번만
+    요청합니다. (호스트가 다르면 기다리지 않음) 전체 제한 시간이 지나면 남은
+    기사는 '(시간 초과)'로 표시하고 바로 반환합니다. 요약 캐시에 있는 기사는
+    다시 요약하지 않습니다.
+
+    일반 언론사 기사는 스레드에서 내려받은 뒤 파싱을 프로세스 풀
+    (SUMMARY_PARSE_WORKERS개)로 넘기므로, 파싱이 밀려도 다운로드 스레드는
+    다음 기사를 계속 받습니다.
+
+    요약 방식(strategy):
+        lead: 본문 앞 300자 (포털 기사는 og:description)
+        extractive: 모든 기사의 본문 전체를 모은 뒤 한 번의 TF-IDF 계산으로
+            기사마다 핵심 문장 SUMMARY_SENTENCES개를 고름 (extractive 모듈)
+
+    여러 배치로 나눠 요약할 때는 SummarySession을 직접 사용합니다.
+
+    Args:
+        articles: 뉴스 기사 리스트
+        delay: 같은 호스트 요청 간 최소 간격 (초, None이면 Config.SUMMARY_HOST_DELAY)
+        max_workers: 동시에 내려받을 기사 수 (None이면 Config.SUMMARY_MAX_WORKERS)
+        deadline: 전체 제한 시간 (초, None이면 Config.SUMMARY_DEADLINE, 0이면 제한 없음)
+        strategy: 요약 방식 ('lead' 또는 'extractive', None이면 Config.SUMMARY_STRATEGY)
+
+    Returns:
+        요약이 추가된 기사 리스트
+    """
+    deadline = Config.SUMMARY_DEADLINE if deadline is None else deadline
 
-    success_count = sum(1 for a in articles if not a['summary'].startswith('('))
-    print(f"\n[요약] 완료! 성공: {success_count}/{total}개")
+    print(f"\n[요약] 총 {len(articles)}개 기사 요약 시작...")
+    if not articles:
+        return articles
 
+    with SummarySession(delay, max_workers, strategy) as session:
+        session.summarize(articles, deadline)
+    session.print_result()
     return articles
 
 
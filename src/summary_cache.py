@@ -0,0 +1,140 @@
+"""
+요약 캐시 모듈
+기사 요약을 정규화 링크별로 SQLite에 저장해 CLI와 웹 앱이 함께 쓰고,
+한 번 만든 요약은 보관 기간 동안 다시 만들지 않도록 합니다.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import TypedDict
+
+from .config import Config
+from .storage import canonical_url, connect
+
+
+class CachedSummary(TypedDict):
+    """캐시된 요약 한 개"""
+    summary: str
+    extractor: str  # 요약을 만든 방법 (portal, newspaper, content, extractive)
+    created_at: float
+
+
+class SummaryCache:
+    """
+    정규화 링크 -> 요약 캐시
+
+    여러 프로세스(스케줄러, Streamlit 앱)가 같은 파일을 동시에 열어도 되도록
+    WAL 모드 SQLite를 사용합니다. 만든 지 보관 기간이 지난 요약은 조회되지 않고,
+    최대 개수를 넘으면 가장 오래 조회되지 않은 요약부터 삭제합니다. (LRU)
+
+    Args:
+        path: SQLite 파일 경로 (None이면 캐시 디렉토리의 summaries.db)
+        ttl_days: 보관 기간 (일, None이면 Config.SUMMARY_CACHE_TTL_DAYS)
+        max_entries: 최대 보관 개수 (None이면 Config.SUMMARY_CACHE_MAX_ENTRIES)
+    """
+
+    def __init__(self, path: Path | None = None, ttl_days: float | None = None, max_entries: int | None = None):
+        self.path = path or Config.get_cache_path('summaries.db')
+        self.ttl = (ttl_days if ttl_days is not None else Config.SUMMARY_CACHE_TTL_DAYS) * 86400
+        self.max_entries = max_entries or Config.SUMMARY_CACHE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS summaries ('
+                ' url TEXT PRIMARY KEY, summary TEXT, extractor TEXT, created_at REAL, accessed_at REAL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_summaries_accessed_at ON summaries (accessed_at)')
+        self.evict()
+
+    def get_many(self, links: list[str]) -> dict[str, CachedSummary]:
+        """
+        링크들의 캐시된 요약을 반환하고 조회 시각을 갱신합니다.
+
+        Returns:
+            {원래 링크: 캐시된 요약} (없거나 만료된 링크는 빠짐)
+        """
+        keys: dict[str, list[str]] = {}
+        for link in links:
+            keys.setdefault(canonical_url(link), []).append(link)
+        if not keys:
+            return {}
+
+        found: dict[str, CachedSummary] = {}
+        now = time.time()
+        key_list = list(keys)
+        with self._lock, self._conn:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for i in range(0, len(key_list), 500):
+                chunk = key_list[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    'SELECT url, summary, extractor, created_at FROM summaries'
+                    f' WHERE url IN ({placeholders}) AND created_at >= ?',
+                    (*chunk, now - self.ttl)
+                ).fetchall()
+                self._conn.execute(
+                    f'UPDATE summaries SET accessed_at = ? WHERE url IN ({placeholders})',
+                    (now, *chunk)
+                )
+                for url, summary, extractor, created_at in rows:
+                    for link in keys[url]:
+                        found[link] = {'summary': summary, 'extractor': extractor, 'created_at': created_at}
+        return found
+
+    def get(self, link: str) -> CachedSummary | None:
+        """링크의 캐시된 요약을 반환합니다. (없거나 만료되면 None)"""
+        return self.get_many([link]).get(link)
+
+    def put_many(self, items: list[tuple[str, str, str]]) -> None:
+        """
+        요약들을 저장하고 크기 제한을 적용합니다.
+
+        Args:
+            items: (링크, 요약, 요약 방법) 리스트
+        """
+        if not items:
+            return
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO summaries (url, summary, extractor, created_at, accessed_at)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                [(canonical_url(link), summary, extractor, now, now) for link, summary, extractor in items]
+            )
+        self.evict()
+
+    def evict(self) -> None:
+        """만료된 요약과 최대 개수를 넘는 오래 조회되지 않은 요약을 삭제합니다."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM summaries WHERE created_at < ?', (time.time() - self.ttl,))
+            count = self._conn.execute('SELECT COUNT(*) FROM summaries').fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    'DELETE FROM summaries WHERE url IN'
+                    ' (SELECT url FROM summaries ORDER BY accessed_at LIMIT ?)',
+                    (count - self.max_entries,)
+                )
+
+
+_cache: SummaryCache | None = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache | None:
+    """공유 요약 캐시를 반환합니다. (SUMMARY_CACHE가 꺼져 있거나 열 수 없으면 None)"""
+    global _cache, _cache_failed
+    if not Config.SUMMARY_CACHE:
+        return None
+
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            try:
+                _cache = SummaryCache()
+            except Exception as e:
+                print(f"    [경고] 요약 캐시를 열 수 없습니다: {e}")
+                _cache_failed = True
+        return _cache